@@ -0,0 +1,71 @@
+"""Benchmark the headless execution of long node chains.
+
+Two kind of chains are built with the headless engine:
+
+- exec: `NodeDebug` nodes chained by their execute sockets, each one reading
+  the text of the same `NodeInput`.
+- data: `NodePassthru` nodes chained by their data sockets and read by a
+  single `NodeDebug`.
+
+Usage, from the repository root:
+
+    python -m scripts.benchmark_chain [size ...]
+"""
+import sys
+import time
+
+from src.engine import EngineGraph, GraphExecutor
+
+
+def exec_chain(size: int) -> EngineGraph:
+    graph = EngineGraph()
+    previous = graph.add_node('NodeExecute', 'NodeExecute.001')
+    text = graph.add_node('NodeInput', 'NodeInput.001')
+
+    for index in range(size):
+        node = graph.add_node('NodeDebug', f'NodeDebug.{index + 1:03}')
+        graph.connect(previous.node_id, 0, node.node_id, 0)
+        graph.connect(text.node_id, 0, node.node_id, 1)
+        previous = node
+
+    return graph
+
+
+def data_chain(size: int) -> EngineGraph:
+    graph = EngineGraph()
+    event = graph.add_node('NodeExecute', 'NodeExecute.001')
+    previous = graph.add_node('NodeInput', 'NodeInput.001')
+
+    for index in range(size):
+        node = graph.add_node('NodePassthru', f'NodePassthru.{index + 1:03}')
+        graph.connect(previous.node_id, 0, node.node_id, 0)
+        previous = node
+
+    debug = graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect(event.node_id, 0, debug.node_id, 0)
+    graph.connect(previous.node_id, 0, debug.node_id, 1)
+    return graph
+
+
+def benchmark(graph: EngineGraph, size: int) -> str:
+    executor = GraphExecutor(graph)
+
+    start = time.perf_counter()
+    graph.plan()
+    compiled = time.perf_counter()
+    executor.run()
+    executed = time.perf_counter()
+
+    return (f'{size:>8} nodes  plan {(compiled - start) / size * 1e6:8.2f} us/node'
+            f'  run {(executed - compiled) / size * 1e6:8.2f} us/node')
+
+
+def main(sizes):
+    for name, build in (('exec', exec_chain), ('data', data_chain)):
+        print(f'{name} chain')
+        for size in sizes:
+            print(benchmark(build(size), size))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [10, 1000, 100000])
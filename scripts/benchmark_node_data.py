@@ -0,0 +1,57 @@
+"""Benchmark `NodeGraphics.data` on a node with many output edges.
+
+A `NodeInput` is connected to a number of `NodeString` nodes, and the cost of
+a call is measured for some of its fields and for all of them.
+
+Usage, from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m scripts.benchmark_node_data [edges ...]
+"""
+import sys
+import timeit
+
+from PySide2.QtWidgets import QApplication
+
+from src.nodes import create_node
+from src.widgets.editor_scene import Scene
+from src.widgets.node_edge import NodeEdge
+from src.widgets.node_graphics import NodeGraphics
+
+CALLS = 1000
+FIELDS = ('id', 'position', 'output_edges')
+
+
+def fan_out(size: int) -> NodeGraphics:
+    scene = Scene().graphics_scene
+    node = create_node(scene, 'NodeInput')
+
+    for _ in range(size):
+        end = create_node(scene, 'NodeString')
+        NodeEdge(scene, node.output_sockets[0], end.input_sockets[0])
+
+    return node.node_graphics
+
+
+def per_call(function) -> float:
+    return timeit.timeit(function, number=CALLS) / CALLS * 1e6
+
+
+def benchmark(node: NodeGraphics, size: int) -> str:
+    timings = [f'{field} {per_call(lambda: node.data(field)):8.2f}'
+               for field in FIELDS]
+    timings.append(f'all {per_call(lambda: dict(node.data())):8.2f}')
+
+    return f'{size:>6} edges  ' + '  '.join(timings) + '  us/call'
+
+
+def main(sizes):
+    app = QApplication(sys.argv)
+
+    for size in sizes:
+        print(benchmark(fan_out(size), size))
+
+    return app
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [1, 10, 100])
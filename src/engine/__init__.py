@@ -0,0 +1,39 @@
+"""Headless graph execution.
+
+This package has no Qt dependency so graphs saved by the editor can be run
+from scripts and worker processes.
+"""
+from .engine_register import EngineRegister
+from .engine_cache import OutputCache, digest
+from .engine_model import Edge, Graph, NodeModel, Port
+from .engine_topology import CycleError, TopologyIndex
+from .engine_disk_cache import DiskCache, default_cache_path
+from .engine_node import EngineNode, SocketType
+from .engine_plan import (
+    ExecutionPlan,
+    PlanLink,
+    compile_plan,
+    run_plan,
+    walk_exec_flow
+)
+from .engine_graph import EngineGraph, EngineEdge, load_graph
+from .engine_async import run_plan_async
+from .engine_profiler import NodeStats, Profiler
+from .engine_executor import (
+    ExecutionCancelled,
+    ExecutionTimeout,
+    GraphExecutor,
+    RunControl,
+    run_file
+)
+from .engine_batch import BatchExecutor, run_batch
+from .engine_compiler import GraphCompiler, compile_graph, compile_source
+from .engine_service import GraphService, InvalidRun, ServiceBusy, WarmGraph
+from .engine_trace import (
+    TraceRecorder,
+    load_trace,
+    record_trace,
+    replay_trace,
+    save_trace
+)
+from .classes import *
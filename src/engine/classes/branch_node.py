@@ -0,0 +1,42 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeBranch(EngineNode):
+    title = "If/Else"
+    thread_safe = True
+    inline = True
+
+    inputs = (SocketType.execute, SocketType.boolean)
+    outputs = (SocketType.execute, SocketType.execute)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.condition = False
+        self.output = None
+
+    def restore_state(self, content):
+        self.condition = content.get('condition', False)
+
+    def save_state(self):
+        return {'condition': self.condition}
+
+    def get_output(self, index):
+        return ""
+
+    def clear_output(self, index):
+        return ""
+
+    def set_input(self, value, index):
+        self.output = value
+
+    def compile_output(self, index, inputs, state):
+        return '""'
+
+    def compile_execute(self, inputs, state):
+        return f"0 if ({inputs.get(1, 'None')}) or {state['condition']} else 1"
+
+    def get_execute_flow(self, output_execs):
+        condition = self.output or self.condition
+        return output_execs[0] if condition else output_execs[1]
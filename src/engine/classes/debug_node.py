@@ -0,0 +1,51 @@
+from src.engine.engine_node import LOGGER, EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeDebug(EngineNode):
+    title = "Debug Print"
+    thread_safe = True
+    vectorized = True
+    inline = True
+
+    inputs = (SocketType.execute, SocketType.text)
+    outputs = (SocketType.execute,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = None
+        self.batch_text = None
+
+    def set_input(self, value, index):
+        self.text = str(value)
+        LOGGER.info('%s: %s', self.node_id, self.text)
+
+    def get_output(self, index):
+        return
+
+    def result(self):
+        return self.text
+
+    def set_input_batch(self, values, index):
+        self.batch_text = [str(value) for value in values]
+        LOGGER.info('%s: %s rows', self.node_id, len(self.batch_text))
+
+    def get_output_batch(self, index, size):
+        return [None] * size
+
+    def result_batch(self, size):
+        if self.batch_text is None:
+            return None if self.text is None else [self.text] * size
+        return self.batch_text
+
+    def compile_output(self, index, inputs, state):
+        return 'None'
+
+    def compile_result(self, inputs, state):
+        if 1 in inputs:
+            return f'str({inputs[1]})'
+        return None if self.text is None else repr(self.text)
+
+    def clear_batch(self):
+        self.batch_text = None
@@ -0,0 +1,20 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeExecute(EngineNode):
+    title = "Event"
+    is_event_node = True
+    inline = True
+
+    outputs = (SocketType.execute,)
+
+    def get_output(self, index):
+        return ""
+
+    def set_input(self, value, index):
+        return ""
+
+    def compile_output(self, index, inputs, state):
+        return '""'
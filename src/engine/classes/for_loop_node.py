@@ -0,0 +1,40 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeForLoop(EngineNode):
+    title = "For Loop"
+    thread_safe = True
+
+    inputs = (SocketType.execute, SocketType.array)
+    outputs = (SocketType.execute, SocketType.value, SocketType.number)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.output = ['foo', 'bar', 'foobar']
+
+        # any iterable, consumed lazily by `iterate`
+        self.items = None
+        self.value = None
+        self.index = None
+
+    def iterate(self):
+        items = self.output if self.items is None else self.items
+        for index, value in enumerate(items):
+            self.index = index
+            self.value = value
+            yield value
+
+    def get_output(self, index):
+        if index == 1:
+            return self.value
+        if index == 2:
+            return self.index
+
+    def clear_output(self, index):
+        return ""
+
+    def set_input(self, value, index):
+        if index == 1:
+            self.items = value
@@ -0,0 +1,63 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeInput(EngineNode):
+    title = 'Input Text'
+    thread_safe = True
+    memoize = True
+    batch_input = 'text'
+    vectorized = True
+    inline = True
+
+    outputs = (SocketType.text, SocketType.number)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = 'foo BAR'
+        self.batch_text = None
+
+    def restore_state(self, content):
+        self.text = content.get('text', '')
+
+    def save_state(self):
+        return {'text': self.text}
+
+    def get_output(self, index=1):
+
+        if index == 0:
+            return self.text
+
+        if index == 1:
+            return len(self.text)
+
+        return ""
+
+    def feed_batch(self, column):
+        self.batch_text = column
+
+    def get_output_batch(self, index, size):
+        texts = self.batch_text
+        if texts is None:
+            texts = [self.text] * size
+
+        if index == 0:
+            return texts
+
+        if index == 1:
+            return [len(text) for text in texts]
+
+        return [""] * size
+
+    def compile_output(self, index, inputs, state):
+        if index == 0:
+            return state['text']
+
+        if index == 1:
+            return f"len({state['text']})"
+
+        return '""'
+
+    def clear_batch(self):
+        self.batch_text = None
@@ -0,0 +1,48 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeNumber(EngineNode):
+    title = 'Numbers'
+    thread_safe = True
+    batch_input = 'spinbox'
+    vectorized = True
+    inline = True
+
+    inputs = (SocketType.number,)
+    outputs = (SocketType.number,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.spinbox = 21.44
+        self.batch_spinbox = None
+
+    def restore_state(self, content):
+        self.spinbox = content.get('spinbox', 0.0)
+
+    def save_state(self):
+        return {"spinbox": self.spinbox}
+
+    def set_input(self, value, index):
+        return ""
+
+    def get_output(self, index):
+        return str(self.spinbox)
+
+    def feed_batch(self, column):
+        self.batch_spinbox = column
+
+    def set_input_batch(self, values, index):
+        return
+
+    def get_output_batch(self, index, size):
+        if self.batch_spinbox is None:
+            return [str(self.spinbox)] * size
+        return [str(value) for value in self.batch_spinbox]
+
+    def compile_output(self, index, inputs, state):
+        return f"str({state['spinbox']})"
+
+    def clear_batch(self):
+        self.batch_spinbox = None
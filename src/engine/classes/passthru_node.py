@@ -0,0 +1,38 @@
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodePassthru(EngineNode):
+    title = 'Passthru'
+    thread_safe = True
+    vectorized = True
+    inline = True
+
+    inputs = (SocketType.text,)
+    outputs = (SocketType.text,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.output = "Passthru"
+        self.batch_output = None
+
+    def set_input(self, value, index):
+        self.output = value
+
+    def get_output(self, index):
+        return self.output
+
+    def set_input_batch(self, values, index):
+        self.batch_output = values
+
+    def get_output_batch(self, index, size):
+        if self.batch_output is None:
+            return [self.output] * size
+        return self.batch_output
+
+    def compile_output(self, index, inputs, state):
+        return inputs.get(0, repr(self.output))
+
+    def clear_batch(self):
+        self.batch_output = None
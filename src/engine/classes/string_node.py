@@ -0,0 +1,114 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.engine.engine_node import EngineNode, SocketType
+from src.engine.engine_register import EngineRegister
+
+
+@EngineRegister.register_class
+class NodeString(EngineNode):
+    title = "String mod"
+    thread_safe = True
+    vectorized = True
+    inline = True
+
+    inputs = (SocketType.widget,)
+    outputs = (SocketType.text,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = ''
+        self.buttons = {
+            'make_upper': True,
+            'make_lower': False,
+            'make_title': False
+        }
+        self.output_text = ""
+        self.batch_output = None
+
+    def restore_state(self, content):
+        self.text = content.get('text') or ''
+        for button, state in content.get('buttons', {}).items():
+            if state:
+                self.buttons = dict.fromkeys(self.buttons, False)
+                self.buttons[button] = True
+                break
+
+    def save_state(self):
+        return {'text': self.text, 'buttons': dict(self.buttons)}
+
+    def update_text(self, text):
+        if self.buttons['make_upper']:
+            return text.upper()
+
+        if self.buttons['make_lower']:
+            return text.lower()
+
+        if self.buttons['make_title']:
+            return text.title()
+
+        return text
+
+    def update_text_batch(self, texts):
+        """Vectorized `update_text`, using `numpy.char` for NumPy arrays."""
+        if numpy is not None and isinstance(texts, numpy.ndarray):
+            texts = texts.astype(str)
+            if self.buttons['make_upper']:
+                return numpy.char.upper(texts)
+
+            if self.buttons['make_lower']:
+                return numpy.char.lower(texts)
+
+            if self.buttons['make_title']:
+                return numpy.char.title(texts)
+
+            return texts
+
+        if self.buttons['make_upper']:
+            return [text.upper() for text in texts]
+
+        if self.buttons['make_lower']:
+            return [text.lower() for text in texts]
+
+        if self.buttons['make_title']:
+            return [text.title() for text in texts]
+
+        return list(texts)
+
+    def get_output(self, index):
+        return self.output_text or self.update_text(self.text)
+
+    def set_input(self, value, index):
+        self.output_text = self.update_text(value)
+
+    def clear_output(self, index):
+        self.output_text = None
+
+    def set_input_batch(self, values, index):
+        self.batch_output = self.update_text_batch(values)
+
+    def get_output_batch(self, index, size):
+        default = self.update_text(self.text)
+        if self.batch_output is None:
+            return [default] * size
+
+        if numpy is not None and isinstance(self.batch_output, numpy.ndarray):
+            return numpy.where(self.batch_output != '', self.batch_output, default)
+        return [text or default for text in self.batch_output]
+
+    def compile_output(self, index, inputs, state):
+        default = repr(self.update_text(self.text))
+        if 0 not in inputs:
+            return default
+
+        for button, method in (('make_upper', 'upper'), ('make_lower', 'lower'),
+                               ('make_title', 'title')):
+            if self.buttons[button]:
+                return f'({inputs[0]}.{method}() or {default})'
+
+        return f'({inputs[0]} or {default})'
+
+    def clear_batch(self):
+        self.batch_output = None
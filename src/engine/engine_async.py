@@ -0,0 +1,53 @@
+"""Asynchronous execution of a compiled plan.
+
+Nodes can implement `get_output` and `set_input` as `async def`: the values
+they return are awaited, and the data groups of the same wave are awaited
+concurrently, so nodes waiting on I/O do not block each other.
+"""
+import asyncio
+import inspect
+import logging
+
+from src.engine.engine_plan import ExecutionPlan, feed_inputs, walk_exec_flow
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+async def _resolve(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _transfer_group(links) -> None:
+    for link in links:
+        edge = link.edge
+        if not edge.is_dirty:
+            continue
+
+        value = await _resolve(edge.pull_data())
+        for result in edge.push_data(value):
+            await _resolve(result)
+
+
+async def run_plan_async(plan: ExecutionPlan, on_exec_edge=None) -> list:
+    """Execute a compiled plan on the running asyncio loop.
+
+    Same as `run_plan`, but every group of a data wave is scheduled as a
+    coroutine and the wave awaits all of them together.
+
+    Returns:
+        (list) - The nodes reached by the execute flow, in the order they
+        first executed.
+    """
+    executed = {}
+    for node in walk_exec_flow(plan, on_exec_edge):
+        feed_inputs(node)
+        for wave in plan.waves(node):
+            await asyncio.gather(*[_transfer_group(links) for links in wave])
+
+        node.outputs_changed()
+        node.was_execute = True
+        executed[node] = None
+
+    return list(executed)
@@ -0,0 +1,201 @@
+"""Batch execution of a graph over N input records.
+
+Source nodes declaring a `batch_input` state key are fed a column (a list or
+a NumPy array) instead of a single value, and every data node is evaluated
+once for the whole batch:
+
+- Nodes declaring `vectorized = True` receive and return whole columns
+  through `feed_batch`, `set_input_batch`, `get_output_batch` and
+  `result_batch`.
+- The other nodes are evaluated with a per row loop over their regular
+  `restore_state`, `set_input` and `get_output` methods. They are marked
+  dirty after the batch, so the next run feeds them their inputs again in
+  place of the values of the last row.
+
+If a node reached by the execute flow picks a different execute output for
+different rows, or is a loop, the batch falls back to running the whole graph
+row by row.
+"""
+import logging
+
+from src.engine.engine_executor import GraphExecutor
+from src.engine.engine_graph import EngineGraph
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+class _FlowDiverged(Exception):
+    """The rows of the batch do not follow the same execute flow."""
+
+
+class BatchExecutor:
+    """Run the execute flow of an `EngineGraph` over a batch of records.
+
+    Args:
+        graph (EngineGraph): The graph to execute.
+    """
+
+    def __init__(self, graph: EngineGraph):
+        self.graph = graph
+
+        self._size = 0
+        self._columns = {}
+        self._inputs = {}
+        self._outputs = {}
+        self._exec_indexes = {}
+        self._results = {}
+        self._row_nodes = []
+
+    def run(self, columns: dict) -> dict:
+        """Execute the graph for every row of the columns.
+
+        `BatchExecutor(graph).run({'NodeInput.001': ['foo', 'bar']})`
+
+        Args:
+            columns (dict): The node id of a source node mapped to the column
+            of values for its `batch_input`. All columns must have the same
+            length.
+
+        Returns:
+            (dict) - The executed sink nodes id mapped to their results, one
+            per row.
+        """
+        sizes = {len(column) for column in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f'Batch columns have different lengths: {sizes}')
+
+        for node_id in columns:
+            if not self.graph.nodes[node_id].batch_input:
+                raise ValueError(f'Node does not accept a batch column: {node_id}')
+
+        self._size = sizes.pop() if sizes else 0
+        self._columns = {self.graph.nodes[node_id]: column
+                         for node_id, column in columns.items()}
+
+        try:
+            return self._run_batch()
+        except _FlowDiverged as err:
+            LOGGER.info('%s, running the batch row by row', err)
+            return self._run_rows(columns)
+        finally:
+            self._clear()
+
+    def _clear(self):
+        for node in self._inputs.keys() | self._outputs.keys():
+            node.clear_batch()
+
+        for node, input_values in self._row_nodes:
+            node.input_values = input_values
+            node.mark_dirty()
+
+        self._inputs = {}
+        self._outputs = {}
+        self._exec_indexes = {}
+        self._results = {}
+        self._row_nodes = []
+
+    def _run_batch(self) -> dict:
+        plan = self.graph.plan()
+
+        for node in plan.event_nodes:
+            while True:
+                if node.iterate() is not None:
+                    raise _FlowDiverged(f'{node.node_id} loops')
+
+                self._evaluate(node)
+
+                indexes = self._exec_indexes.get(node) or {node.execute_index()}
+                if len(indexes) > 1:
+                    raise _FlowDiverged(
+                        f'{node.node_id} takes different execute outputs')
+
+                next_exec = plan.next_exec(node, indexes.pop())
+                if not next_exec:
+                    break
+
+                _, node = next_exec
+                for link in plan.steps(node):
+                    if link.start_node not in self._outputs:
+                        self._evaluate(link.start_node)
+
+                    column = self._outputs[link.start_node][link.start_index]
+                    self._inputs.setdefault(link.end_node, {})[link.end_index] = column
+
+        return {node.node_id: result for node, result in self._results.items()
+                if result is not None}
+
+    def _evaluate(self, node) -> None:
+        """Compute the output columns and results of a node."""
+        inputs = self._inputs.get(node, {})
+        if node.vectorized:
+            self._evaluate_vectorized(node, inputs)
+        else:
+            self._evaluate_rows(node, inputs)
+
+    def _evaluate_vectorized(self, node, inputs) -> None:
+        if node in self._columns:
+            node.feed_batch(self._columns[node])
+
+        for index in sorted(inputs):
+            node.set_input_batch(inputs[index], index)
+
+        self._outputs[node] = {
+            index: node.get_output_batch(index, self._size)
+            for index in node.data_outputs}
+        self._results[node] = node.result_batch(self._size)
+
+    def _evaluate_rows(self, node, inputs) -> None:
+        state = node.save_state()
+        column = self._columns.get(node)
+        self._row_nodes.append((node, dict(node.input_values)))
+
+        outputs = {index: [] for index in node.data_outputs}
+        results = []
+        exec_indexes = set()
+
+        for row in range(self._size):
+            if column is not None:
+                node.restore_state(dict(state, **{node.batch_input: column[row]}))
+
+            for index in sorted(inputs):
+                node.push_input(inputs[index][row], index)
+
+            for index in node.data_outputs:
+                outputs[index].append(node.get_output(index))
+
+            results.append(node.result())
+            if len(node.output_execs) > 1:
+                exec_indexes.add(node.execute_index())
+
+        node.restore_state(state)
+
+        self._outputs[node] = outputs
+        self._results[node] = results if any(
+            result is not None for result in results) else None
+        if exec_indexes:
+            self._exec_indexes[node] = exec_indexes
+
+    def _run_rows(self, columns: dict) -> dict:
+        states = {node_id: self.graph.nodes[node_id].save_state()
+                  for node_id in columns}
+
+        results = {}
+        executor = GraphExecutor(self.graph)
+        for row in range(self._size):
+            for node_id, column in columns.items():
+                node = self.graph.nodes[node_id]
+                self.graph.set_state(node_id, dict(
+                    states[node_id], **{node.batch_input: column[row]}))
+
+            for node_id, result in executor.run().items():
+                results.setdefault(node_id, [None] * self._size)[row] = result
+
+        for node_id, state in states.items():
+            self.graph.set_state(node_id, state)
+
+        return results
+
+
+def run_batch(graph: EngineGraph, columns: dict) -> dict:
+    """Execute a graph over a batch of records, see `BatchExecutor.run`."""
+    return BatchExecutor(graph).run(columns)
@@ -0,0 +1,99 @@
+import json
+import pickle
+import hashlib
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+def digest(*values) -> str:
+    """Hash values into a short hexadecimal digest.
+
+    Json serializable values are hashed by their json with sorted keys, so
+    the digest of a dict does not depend on its order. The other values are
+    hashed by their pickle, which holds all of their data, e.g. the whole
+    buffer of a NumPy array where its `repr` is truncated.
+
+    Raises:
+        TypeError: If the values can not be pickled either.
+    """
+    try:
+        data = json.dumps(values, sort_keys=True).encode('utf-8')
+    except (TypeError, ValueError):
+        try:
+            data = b'pickle:' + pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            raise TypeError(f'Values can not be digested: {err}') from err
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def is_reusable(value) -> bool:
+    """Check if an output can be served again from a cache.
+
+    Awaitables and iterators, e.g. generators, are consumed by the first
+    node reading them.
+    """
+    return not (inspect.isawaitable(value) or isinstance(value, Iterator))
+
+
+class OutputCache:
+    """A bounded LRU cache of the outputs of a node.
+
+    Outputs are keyed on the socket index and on a digest of the node saved
+    state and input values, so the node logic runs once per distinct input.
+    Inputs that can not be digested and outputs that are not reusable, see
+    `is_reusable`, are not cached. The cache can be shared by threads that
+    pull the same node.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_output(self, index, state: dict, inputs: dict, compute):
+        """Get the cached output or compute it.
+
+        Args:
+            index (int): The output socket index.
+            state (dict): The node `save_state` dict.
+            inputs (dict): The node input values keyed by socket index.
+            compute (callable): Called with the index on a cache miss.
+        """
+        try:
+            key = (index, digest(state, inputs))
+        except TypeError:
+            return compute(index)
+
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+
+        value = compute(index)
+        if not is_reusable(value):
+            return value
+
+        with self._lock:
+            self._cache[key] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._cache), 'maxsize': self.maxsize}
@@ -0,0 +1,241 @@
+"""Compile a graph into a plain Python function.
+
+The generated function runs the execute flow of the graph with every data
+edge turned into a local variable:
+
+- Nodes declaring `inline = True` are inlined as Python expressions built by
+  their `compile_output`, `compile_result` and `compile_execute` methods.
+- The other nodes are instantiated once, when the source is executed, and
+  their `set_input`, `get_output`, `execute_index` and `iterate` methods are
+  called directly.
+
+The `batch_input` state of inlined source nodes becomes a keyword argument of
+the function, defaulting to the saved value.
+"""
+import re
+import logging
+
+from src.engine.engine_graph import EngineGraph
+from src.engine.engine_node import EngineNode
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+def _var_name(node_id: str) -> str:
+    return re.sub(r'\W', '_', node_id)
+
+
+class GraphCompiler:
+    """Generate the source of a function running an `EngineGraph`.
+
+    Args:
+        graph (EngineGraph): The graph to compile.
+        name (str): The name of the generated function.
+    """
+
+    def __init__(self, graph: EngineGraph, name: str = 'run_graph'):
+        self.graph = graph
+        self.name = name
+        self.plan = graph.plan()
+
+        self._lines = []
+        self._instances = {}
+        self._input_vars = {}
+        self._used_outputs = {}
+        self._exec_nodes = {node for _, node in self.plan.exec_edges.values()}
+
+        for link in graph.links():
+            if not link.is_execute:
+                self._used_outputs.setdefault(
+                    link.start_node, set()).add(link.start_index)
+
+        self._params = {
+            node: _var_name(node.node_id) for node in graph.nodes.values()
+            if node.inline and node.batch_input}
+
+    def source(self) -> str:
+        """Generate the module source defining the function."""
+        self._lines = []
+        self._instances = {}
+        self._input_vars = {}
+
+        self._emit(1, 'results = {}')
+        self._compile_flow()
+        self._emit(1, 'return {node_id: result for node_id, result in '
+                      'results.items() if result is not None}')
+        body = self._lines
+
+        params = ', '.join(
+            f'{param}={node.save_state()[node.batch_input]!r}'
+            for node, param in self._params.items())
+
+        header = ['# Generated from a node graph, do not edit.']
+        for node_class in sorted({type(node) for node in self._instances},
+                                 key=lambda node_class: node_class.__name__):
+            header.append(f'from {node_class.__module__} import {node_class.__name__}')
+
+        if self._instances:
+            header.append('')
+        for node, instance in self._instances.items():
+            header.append(f'{instance} = {type(node).__name__}({node.node_id!r})')
+            header.append(f'{instance}.restore_state({node.save_state()!r})')
+
+        return '\n'.join(header + ['', '', f'def {self.name}({params}):'] + body) + '\n'
+
+    def _emit(self, indent: int, line: str):
+        self._lines.append('    ' * indent + line)
+
+    def _instance(self, node) -> str:
+        if node not in self._instances:
+            self._instances[node] = '_' + _var_name(node.node_id)
+        return self._instances[node]
+
+    def _state(self, node) -> dict:
+        state = {key: repr(value) for key, value in node.save_state().items()}
+        if node in self._params:
+            state[node.batch_input] = self._params[node]
+        return state
+
+    def _inputs(self, node) -> dict:
+        return dict(self._input_vars.get(node, {}))
+
+    def _evaluate(self, node, indent: int, scope: set):
+        """Assign the used outputs of a node to their local variables."""
+        scope.add(node)
+        for index in sorted(self._used_outputs.get(node, ())):
+            if node.inline:
+                expression = node.compile_output(
+                    index, self._inputs(node), self._state(node))
+            else:
+                expression = f'{self._instance(node)}.get_output({index})'
+
+            self._emit(indent, f'{_var_name(node.node_id)}_{index} = {expression}')
+
+    def _feed(self, link, indent: int, scope: set):
+        """Compile a data link, evaluating its start node when needed."""
+        if link.end_node in scope and link.end_node not in self._exec_nodes:
+            return
+
+        if link.start_node not in scope:
+            self._evaluate(link.start_node, indent, scope)
+
+        var = f'{_var_name(link.start_node.node_id)}_{link.start_index}'
+        if link.end_node.inline:
+            self._input_vars.setdefault(link.end_node, {})[link.end_index] = var
+        else:
+            self._emit(indent, f'{self._instance(link.end_node)}.set_input'
+                               f'({var}, {link.end_index})')
+
+    def _run_node(self, node, indent: int, scope: set):
+        """Compile the data steps of a node reached by the execute flow."""
+        for link in self.plan.steps(node):
+            self._feed(link, indent, scope)
+
+        # its outputs have to be read again after it ran
+        scope.discard(node)
+
+        if node.inline:
+            result = node.compile_result(self._inputs(node), self._state(node))
+        elif type(node).result is not EngineNode.result:
+            result = f'{self._instance(node)}.result()'
+        else:
+            result = None
+
+        if result is not None:
+            self._emit(indent, f'results[{node.node_id!r}] = {result}')
+
+    def _compile_flow(self):
+        """Compile the execute flow with an explicit stack of blocks.
+
+        A task compiles a chain of nodes inside a block, until the chain ends
+        or reaches a branch or a loop, which push one task per nested block.
+        Blocks evaluate their data in a copy of the parent scope.
+        """
+        root_scope = set()
+        tasks = [(None, 1, event, frozenset(), root_scope)
+                 for event in reversed(self.plan.event_nodes)]
+
+        while tasks:
+            header, indent, node, path, scope = tasks.pop()
+            if header:
+                self._emit(indent - 1, header)
+
+            start = len(self._lines)
+            pushed = len(tasks)
+            path = set(path)
+
+            while node is not None:
+                if node in path:
+                    raise ValueError(f'Execute flow cycle at {node.node_id}')
+                path.add(node)
+
+                self._run_node(node, indent, scope)
+                node = self._next_node(node, indent, tasks, path, scope)
+
+            if header and len(self._lines) == start and len(tasks) == pushed:
+                self._emit(indent, 'pass')
+
+    def _next_node(self, node, indent: int, tasks: list, path: set, scope: set):
+        """Get the next node of a chain, or push the nested blocks."""
+        connected = [(index, self.plan.next_exec(node, index))
+                     for index in node.output_execs]
+        connected = [(index, next_exec[1]) for index, next_exec in connected
+                     if next_exec]
+
+        if not node.inline and node.iterate() is not None:
+            for _, body in connected:
+                tasks.append((f'for _ in {self._instance(node)}.iterate():',
+                              indent + 1, body, frozenset(path), set(scope)))
+            return None
+
+        if len(node.output_execs) <= 1:
+            return connected[0][1] if connected else None
+
+        if node.inline:
+            expression = node.compile_execute(self._inputs(node), self._state(node))
+        else:
+            expression = f'{self._instance(node)}.execute_index()'
+
+        var = f'{_var_name(node.node_id)}_exec'
+        self._emit(indent, f'{var} = {expression}')
+
+        blocks = [(f'{"if" if not i else "elif"} {var} == {index}:', next_node)
+                  for i, (index, next_node) in enumerate(connected)]
+        for block_header, next_node in reversed(blocks):
+            tasks.append((block_header, indent + 1, next_node,
+                          frozenset(path), set(scope)))
+        return None
+
+
+def compile_source(data: dict, name: str = 'run_graph') -> str:
+    """Generate the Python source of a function running a graph.
+
+    Args:
+        data (dict): The graph as generated by `scene_state`.
+        name (str): The name of the generated function.
+
+    Returns:
+        (str) - The source of a module defining the function.
+    """
+    return GraphCompiler(EngineGraph.from_state(data), name).source()
+
+
+def compile_graph(data: dict, name: str = 'run_graph'):
+    """Compile a graph into a Python function.
+
+    `compile_graph(data)(NodeInput_001='foo') -> {'NodeDebug.001': 'FOO'}`
+
+    Args:
+        data (dict): The graph as generated by `scene_state`.
+        name (str): The name of the generated function.
+
+    Returns:
+        (function) - The function, which returns the results of the executed
+        sink nodes keyed by node id, like `GraphExecutor.run`.
+    """
+    source = compile_source(data, name)
+    LOGGER.debug('Compiled graph source:\n%s', source)
+
+    namespace = {}
+    exec(compile(source, f'<graph {name}>', 'exec'), namespace)
+    return namespace[name]
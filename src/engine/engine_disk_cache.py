@@ -0,0 +1,149 @@
+"""Persistent cache of the outputs of pure nodes, shared across sessions.
+
+Outputs are pickled into a SQLite database and keyed on a digest of the node
+class, output index, `save_state` and input values. The least recently used
+entries are evicted once the database grows over its size cap.
+"""
+import os
+import time
+import pickle
+import sqlite3
+import logging
+import threading
+
+from src.engine.engine_cache import digest, is_reusable
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+def default_cache_path() -> str:
+    """Get the cache database path, inside `NODEEDITOR_CACHE_DIR` if set."""
+    cache_dir = os.environ.get('NODEEDITOR_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'nodeeditor')
+    return os.path.join(cache_dir, 'outputs.sqlite')
+
+
+class DiskCache:
+    """A size capped, content addressed store of node outputs.
+
+    The cache can be shared by the threads of a run.
+
+    Args:
+        path (str): The SQLite database file. Defaults to
+        `default_cache_path()`.
+        max_bytes (int): The size cap of the stored outputs.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = 256 * 1024 ** 2):
+        self.path = path or default_cache_path()
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10,
+                                   check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS outputs ('
+                         'key TEXT PRIMARY KEY, value BLOB, '
+                         'size INTEGER, accessed REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS outputs_accessed '
+                         'ON outputs (accessed)')
+        self._db.commit()
+
+        # kept in memory so inserting does not sum the table
+        self._bytes = self._db.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM outputs').fetchone()[0]
+
+    def get_output(self, node_class: str, index, state: dict, inputs: dict,
+                   compute):
+        """Get the stored output or compute and store it.
+
+        Args:
+            node_class (str): The node class name.
+            index (int): The output socket index.
+            state (dict): The node `save_state` dict.
+            inputs (dict): The node input values keyed by socket index.
+            compute (callable): Called with the index on a cache miss.
+        """
+        try:
+            key = digest(node_class, index, state, inputs)
+        except TypeError:
+            LOGGER.debug('Inputs of %s can not be digested, not cached', node_class)
+            return compute(index)
+
+        with self._lock:
+            row = self._db.execute('SELECT value FROM outputs WHERE key = ?',
+                                   (key,)).fetchone()
+            if row:
+                self.hits += 1
+                self._db.execute('UPDATE outputs SET accessed = ? WHERE key = ?',
+                                 (time.time(), key))
+                self._db.commit()
+                return pickle.loads(row[0])
+            self.misses += 1
+
+        value = compute(index)
+        if not is_reusable(value):
+            return value
+
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            LOGGER.debug('Output of %s is not picklable, not cached', node_class)
+            return value
+
+        with self._lock:
+            row = self._db.execute('SELECT size FROM outputs WHERE key = ?',
+                                   (key,)).fetchone()
+            self._db.execute('INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?)',
+                             (key, data, len(data), time.time()))
+            self._bytes += len(data) - (row[0] if row else 0)
+            self._evict()
+            self._db.commit()
+
+        return value
+
+    def _evict(self):
+        """Delete the least recently used outputs over the size cap."""
+        while self._bytes > self.max_bytes:
+            rows = self._db.execute('SELECT key, size FROM outputs '
+                                    'ORDER BY accessed LIMIT 64').fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+
+            evicted = []
+            for key, size in rows:
+                if self._bytes <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                self._bytes -= size
+
+            self._db.executemany('DELETE FROM outputs WHERE key = ?', evicted)
+            self.evictions += len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM outputs')
+            self._db.commit()
+            self._db.execute('VACUUM')
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM outputs').fetchone()[0]
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'entries': entries,
+                'bytes': self._bytes, 'max_bytes': self.max_bytes,
+                'path': self.path}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
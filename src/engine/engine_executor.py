@@ -0,0 +1,200 @@
+import time
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.engine.engine_async import run_plan_async
+from src.engine.engine_disk_cache import DiskCache
+from src.engine.engine_graph import EngineGraph, load_graph
+from src.engine.engine_plan import run_plan
+from src.engine.engine_profiler import Profiler
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+class ExecutionCancelled(RuntimeError):
+    """The run was cancelled before reaching the end of the flow."""
+
+
+class ExecutionTimeout(ExecutionCancelled):
+    """The run took longer than its timeout."""
+
+
+class RunControl:
+    """Cooperative cancellation and timeout of a run.
+
+    The control is checked between two executed nodes, so a node that is
+    already running is never interrupted.
+
+    Args:
+        timeout (float): Optional run timeout in seconds.
+    """
+
+    def __init__(self, timeout: float = None):
+        self.timeout = timeout
+        self._cancelled = threading.Event()
+        self._deadline = None
+
+    def start(self):
+        if self.timeout:
+            self._deadline = time.monotonic() + self.timeout
+
+    def cancel(self):
+        """Request the run to stop, this can be called from any thread."""
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def check(self, *args):
+        """Raise if the run was cancelled or is past its deadline."""
+        if self._cancelled.is_set():
+            raise ExecutionCancelled('Graph execution cancelled')
+
+        if self._deadline and time.monotonic() > self._deadline:
+            raise ExecutionTimeout(
+                f'Graph execution timed out after {self.timeout}s')
+
+
+class GraphExecutor:
+    """Run the execute flow of an `EngineGraph` without Qt.
+
+    The flow starts from every event node and follows the execute edges. Each
+    node reached by the flow first receives the data of its input edges,
+    after the upstream data nodes have been evaluated. The graph compiled
+    plan is reused as long as the graph topology does not change.
+
+    Args:
+        graph (EngineGraph): The graph to execute.
+        max_workers (int): If set, independent data branches of thread safe
+        nodes are evaluated concurrently on a thread pool of this size.
+        max_processes (int): If set, nodes that declare `run_in_process` are
+        evaluated on a process pool of this size.
+        profiler (Profiler): If set, the runs record the time spent in the
+        nodes. It can be set or unset between runs.
+        disk_cache (DiskCache): If set, the outputs of the pure nodes are
+        served from this persistent cache.
+    """
+
+    def __init__(self, graph: EngineGraph, max_workers: int = None,
+                 max_processes: int = None, profiler: Profiler = None,
+                 disk_cache: DiskCache = None):
+        self.graph = graph
+        self.profiler = profiler
+        self.disk_cache = disk_cache
+        self.pool = ThreadPoolExecutor(max_workers) if max_workers else None
+        self.process_pool = (ProcessPoolExecutor(max_processes)
+                             if max_processes else None)
+
+    def run(self, control: RunControl = None, on_exec_edge=None,
+            on_node=None) -> dict:
+        """Execute the graph.
+
+        Args:
+            control (RunControl): Optional cancellation and timeout control.
+            on_exec_edge (callable): Optional callback invoked with every
+            execute edge the flow goes through.
+            on_node (callable): Optional callback invoked with every
+            executed node.
+
+        Returns:
+            (dict) - The results of the executed sink nodes, e.g. the text of
+            the `NodeDebug` nodes, keyed by node id.
+
+        Raises:
+            ExecutionCancelled: If the control stopped the run.
+        """
+        def node_executed(node):
+            if control:
+                control.check()
+            if on_node:
+                on_node(node)
+
+        if control:
+            control.start()
+            control.check()
+
+        self._set_disk_cache()
+
+        profiler = self.profiler
+        if profiler:
+            profiler.attach(self.graph.nodes.values())
+
+        try:
+            executed = run_plan(self.graph.plan(), on_exec_edge=on_exec_edge,
+                                pool=self.pool, process_pool=self.process_pool,
+                                on_node=node_executed)
+        finally:
+            if profiler:
+                profiler.detach()
+
+            for node in self.graph.nodes.values():
+                node.was_execute = False
+
+        return self._collect_results(executed)
+
+    async def run_async(self) -> dict:
+        """Execute the graph on the running asyncio loop.
+
+        Nodes may implement `get_output` and `set_input` as coroutines, and
+        the independent data branches are awaited concurrently.
+
+        Returns:
+            (dict) - The results of the executed sink nodes.
+        """
+        self._set_disk_cache()
+
+        profiler = self.profiler
+        if profiler:
+            profiler.attach(self.graph.nodes.values())
+
+        try:
+            executed = await run_plan_async(self.graph.plan())
+        finally:
+            if profiler:
+                profiler.detach()
+
+        return self._collect_results(executed)
+
+    def _set_disk_cache(self):
+        for node in self.graph.nodes.values():
+            if node.pure:
+                node.disk_cache = self.disk_cache
+
+    def _collect_results(self, executed: list) -> dict:
+        results = {}
+        for node in executed:
+            result = node.result()
+            if result is not None:
+                results[node.node_id] = result
+
+        for node in self.graph.nodes.values():
+            node.was_execute = False
+
+        return results
+
+    def close(self):
+        """Shut down the pools, if any."""
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+        if self.process_pool:
+            self.process_pool.shutdown()
+            self.process_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def run_file(file: str, max_workers: int = None) -> dict:
+    """Load and execute a graph file saved by the editor.
+
+    `run_file('example/my_project.json') -> {'NodeDebug.001': 'FOO BAR'}`
+    """
+    with GraphExecutor(load_graph(file), max_workers) as executor:
+        return executor.run()
@@ -0,0 +1,258 @@
+import json
+import logging
+from collections.abc import Iterator
+
+from src.engine.engine_model import Edge, Graph, NodeModel
+from src.engine.engine_topology import CycleError
+from src.engine.engine_node import SocketType
+from src.engine.engine_plan import PlanLink, compile_plan
+from src.engine.engine_register import EngineRegister
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+class EngineEdge(Edge):
+    """A connection between an output socket and an input socket.
+
+    The edge is stored in the graph model, with the engine nodes of its
+    model nodes for the execution.
+    """
+
+    # `__dict__` is only allocated when a `TraceRecorder` wraps the methods
+    __slots__ = ('start_node', 'end_node', '_synced_versions', '__dict__')
+
+    def __init__(self, start: NodeModel, start_index: int,
+                 end: NodeModel, end_index: int):
+        super().__init__(start, start_index, end, end_index)
+
+        self.start_node = start.view
+        self.end_node = end.view
+
+        # the start output version and end state version of the last transfer
+        self._synced_versions = None
+
+    @property
+    def socket_type(self) -> str:
+        return self.start_node.outputs[self.start_index]
+
+    @property
+    def is_execute(self) -> bool:
+        return self.socket_type == SocketType.execute
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the edge needs to transfer its data again."""
+        return self._synced_versions != (self.start_node.output_version,
+                                         self.end_node.state_version)
+
+    def pull_data(self):
+        """Pull the start node output and mark the edge as synced.
+
+        An iterator, e.g. a generator streamed to a loop, is consumed by the
+        run, so the edge stays dirty to pull a new one on the next run.
+        """
+        value = self.start_node.pull_output(self.start_index)
+        if not isinstance(value, Iterator):
+            self._synced_versions = (self.start_node.output_version,
+                                     self.end_node.state_version)
+        return value
+
+    def push_data(self, value) -> list:
+        """Set a pulled value into the end node input.
+
+        Returns:
+            (list) - A list holding the node `set_input` result, which is an
+            awaitable for asynchronous nodes.
+        """
+        results = [self.end_node.push_input(value, self.end_index)]
+
+        self.end_node.outputs_changed()
+        return results
+
+    def transfer_data(self):
+        """Pull the start node output and set it into the end node input."""
+        self.push_data(self.pull_data())
+
+    def data(self) -> dict:
+        return {
+            'end_socket': {
+                'node': self.end_node.node_id,
+                'index': self.end_index
+            },
+            'start_socket': {
+                'node': self.start_node.node_id,
+                'index': self.start_index
+            }}
+
+    def __repr__(self):
+        return (f'<EngineEdge {self.start_node.node_id}[{self.start_index}] -> '
+                f'{self.end_node.node_id}[{self.end_index}]>')
+
+
+class EngineGraph:
+    """A Qt-free graph built from the editor save file format.
+
+    The topology is kept in a `Graph` model, whose node views are the
+    `EngineNode` objects and whose edges are `EngineEdge` objects.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.model = Graph()
+
+        # bumped on every topology change to invalidate the cached plan
+        self.revision = 0
+        self._plan = None
+        self._plan_revision = None
+
+    def add_node(self, node_class: str, node_id: str = None, state: dict = None):
+        """Create a node from a node class name.
+
+        Args:
+            node_class (str): The class name, e.g. `NodeDebug`.
+            node_id (str): The node id. Defaults to the next free
+            `Class.NNN` id.
+            state (dict): The node content as returned by `save_state`.
+
+        Returns:
+            (EngineNode) - The new node.
+        """
+        node_id = node_id or self._next_node_id(node_class)
+        if node_id in self.nodes:
+            raise RuntimeError(f'Node id already exists: {node_id}')
+
+        node = EngineRegister.get_node_class_object(node_class)(node_id)
+        if state:
+            node.restore_state(state)
+
+        self.nodes[node_id] = node
+        self.model.add_node(node_id, node_class, node.inputs, node.outputs, node)
+        self.revision += 1
+        return node
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and all of its edges."""
+        node = self.nodes[node_id]
+        for edge in self.input_edges(node) + self.output_edges(node):
+            self.disconnect(edge)
+
+        self.nodes.pop(node_id)
+        self.model.remove_node(node_id)
+        self.revision += 1
+
+    def _next_node_id(self, node_class: str) -> str:
+        node_num = 1
+        while f'{node_class}.{str(node_num).zfill(3)}' in self.nodes:
+            node_num += 1
+        return f'{node_class}.{str(node_num).zfill(3)}'
+
+    def get_node(self, node_id: str):
+        return self.nodes[node_id]
+
+    def set_state(self, node_id: str, content: dict) -> None:
+        """Restore the content of a node and mark it dirty."""
+        node = self.nodes[node_id]
+        node.restore_state(content)
+        node.mark_dirty()
+
+    def connect(self, start_id: str, start_index: int,
+                end_id: str, end_index: int) -> EngineEdge:
+        """Connect an output socket to an input socket.
+
+        Like in the editor, an input socket accepts only one edge, so an
+        existing edge on the end socket gets replaced.
+
+        Raises:
+            CycleError: If the edge would close a cycle, the graph is left
+            unchanged.
+        """
+        end_node = self.nodes[end_id]
+
+        start = self.model.nodes[start_id]
+        end = self.model.nodes[end_id]
+        if self.model.topology.creates_cycle(start, end):
+            raise CycleError(f'Edge would create a cycle: {start_id} -> {end_id}')
+
+        previous = end.input_edge(end_index)
+        if previous:
+            self.disconnect(previous)
+
+        edge = self.model.add_edge(EngineEdge(start, start_index, end, end_index))
+        end_node.mark_dirty()
+        self.revision += 1
+        return edge
+
+    def disconnect(self, edge: EngineEdge) -> None:
+        self.model.disconnect(edge)
+        edge.end_node.input_values.pop(edge.end_index, None)
+        edge.end_node.mark_dirty()
+        self.revision += 1
+
+    @property
+    def edges(self) -> list:
+        return list(self.model.edges())
+
+    def input_edges(self, node) -> list:
+        """Get the input edges of a node sorted by socket index."""
+        return self.model.nodes[node.node_id].input_edges()
+
+    def output_edges(self, node) -> list:
+        """Get the output edges of a node sorted by socket index."""
+        return self.model.nodes[node.node_id].output_edges()
+
+    def exec_edge(self, node, index: int):
+        """Get the edge connected to an execute output socket, if any."""
+        return self.model.nodes[node.node_id].exec_edge(index)
+
+    def event_nodes(self) -> list:
+        return [node for node in self.nodes.values() if node.is_event_node]
+
+    def links(self) -> list:
+        return [PlanLink(edge, edge.start_node, edge.start_index,
+                         edge.end_node, edge.end_index, edge.is_execute)
+                for edge in self.edges]
+
+    def plan(self):
+        """Get the execution plan, compiling it only if the graph changed."""
+        if self._plan_revision != self.revision:
+            self._plan = compile_plan(self.links(), self.event_nodes())
+            self._plan_revision = self.revision
+        return self._plan
+
+    @classmethod
+    def from_state(cls, data: dict) -> 'EngineGraph':
+        """Build a graph from the dict generated by `scene_state`."""
+        graph = cls()
+
+        nodes = data['nodes']
+        for node_id, node_attrs in nodes.items():
+            graph.add_node(node_attrs['class'], node_id,
+                           node_attrs.get('content') or {})
+
+        for node_id, node_attrs in nodes.items():
+            for edge in node_attrs.get('output_edges', {}).values():
+                graph.connect(node_id, int(edge['start_socket']['index']),
+                              edge['end_socket']['node'],
+                              int(edge['end_socket']['index']))
+
+        return graph
+
+    def state(self) -> dict:
+        """Generate the graph state in the editor save file format."""
+        state = {'viewport': {'x': 0.0, 'y': 0.0}, 'nodes': {}}
+        for node_id, node in self.nodes.items():
+            edges = {str(i): edge.data()
+                     for i, edge in enumerate(self.output_edges(node))}
+            state['nodes'][node_id] = {
+                'class': str(node),
+                'position': {'x': 0.0, 'y': 0.0},
+                'output_edges': edges,
+                'content': node.save_state()
+            }
+        return state
+
+
+def load_graph(file: str) -> EngineGraph:
+    """Load a graph file saved by the editor."""
+    with open(file, 'r', encoding='utf-8') as f:
+        return EngineGraph.from_state(json.load(f))
@@ -0,0 +1,247 @@
+"""Compact Qt-free model of a graph topology.
+
+Both the editor and `EngineGraph` keep their nodes, sockets and edges in a
+`Graph`. The objects they build around it, a Qt `Node` or an `EngineNode`,
+are attached to the model as its `view`, so the topology is owned in one
+place and can be walked without any Qt object.
+
+Every object uses `__slots__`. A node stores the edges of its sockets in two
+arrays, allocated on the first connection, and `Port` objects are only views
+over them, to keep graphs of many nodes small.
+
+A `TopologyIndex` keeps the graph acyclic and answers the topological
+queries, see `engine_topology`.
+"""
+from .engine_topology import TopologyIndex
+
+
+class Port:
+    """A view over an input or output socket of a node."""
+
+    __slots__ = ('node', 'index', 'is_output')
+
+    def __init__(self, node: 'NodeModel', index: int, is_output: bool):
+        self.node = node
+        self.index = index
+        self.is_output = is_output
+
+    @property
+    def socket_type(self) -> str:
+        types = self.node.output_types if self.is_output else self.node.input_types
+        return types[self.index]
+
+    @property
+    def edges(self) -> list:
+        if self.is_output:
+            return list(self.node.socket_edges(self.index))
+
+        edge = self.node.input_edge(self.index)
+        return [edge] if edge else []
+
+    def __eq__(self, other):
+        return (isinstance(other, Port) and self.node is other.node
+                and self.index == other.index and self.is_output == other.is_output)
+
+    def __hash__(self):
+        return hash((id(self.node), self.index, self.is_output))
+
+    def __repr__(self):
+        side = 'out' if self.is_output else 'in'
+        return f'<Port {self.node.node_id} {side}[{self.index}]>'
+
+
+class Edge:
+    """A connection from an output socket to an input socket.
+
+    Subclasses can be connected with `Graph.add_edge` to keep their own data
+    in the edge itself rather than in a `view`.
+    """
+
+    __slots__ = ('start', 'start_index', 'end', 'end_index', 'view')
+
+    def __init__(self, start: 'NodeModel', start_index: int,
+                 end: 'NodeModel', end_index: int, view=None):
+        self.start = start
+        self.start_index = start_index
+        self.end = end
+        self.end_index = end_index
+        self.view = view
+
+    @property
+    def start_port(self) -> Port:
+        return Port(self.start, self.start_index, True)
+
+    @property
+    def end_port(self) -> Port:
+        return Port(self.end, self.end_index, False)
+
+    def __repr__(self):
+        return (f'<Edge {self.start.node_id}[{self.start_index}] -> '
+                f'{self.end.node_id}[{self.end_index}]>')
+
+
+class NodeModel:
+    """A node with the edges of its sockets.
+
+    Args:
+        node_id (str): The node id, e.g. `NodeDebug.001`.
+        node_class (str): The node class name.
+        inputs (list): The socket type of every input socket.
+        outputs (list): The socket type of every output socket.
+        view (any): The object representing the node.
+    """
+
+    __slots__ = ('node_id', 'node_class', 'input_types', 'output_types',
+                 '_inputs', '_outputs', 'order', 'view')
+
+    def __init__(self, node_id: str, node_class: str, inputs=(), outputs=(),
+                 view=None):
+        self.node_id = node_id
+        self.node_class = node_class
+        self.view = view
+
+        # the socket types are usually the tuples declared by the node class,
+        # which `tuple` does not copy
+        self.input_types = tuple(inputs)
+        self.output_types = tuple(outputs)
+
+        # the edge of every input socket and the edges list of every output
+        # socket, `None` until the node gets connected
+        self._inputs = None
+        self._outputs = None
+
+        # the position of the node in the topological order of its graph
+        self.order = 0
+
+    @property
+    def inputs(self) -> tuple:
+        return tuple([Port(self, index, False)
+                      for index in range(len(self.input_types))])
+
+    @property
+    def outputs(self) -> tuple:
+        return tuple([Port(self, index, True)
+                      for index in range(len(self.output_types))])
+
+    def input_edge(self, index: int):
+        """Get the edge connected to an input socket, `None` if any."""
+        return self._inputs[index] if self._inputs else None
+
+    def socket_edges(self, index: int) -> tuple:
+        """Get the edges connected to an output socket."""
+        if self._outputs and self._outputs[index]:
+            return tuple(self._outputs[index])
+        return ()
+
+    def exec_edge(self, index: int):
+        """Get the first edge connected to an output socket, `None` if any."""
+        edges = self._outputs and self._outputs[index]
+        return edges[0] if edges else None
+
+    def input_edges(self) -> list:
+        """Get the input edges sorted by socket index."""
+        return [edge for edge in self._inputs if edge] if self._inputs else []
+
+    def output_edges(self) -> list:
+        """Get the output edges sorted by socket index."""
+        if not self._outputs:
+            return []
+        return [edge for edges in self._outputs if edges for edge in edges]
+
+    def __repr__(self):
+        return f'<NodeModel {self.node_id}>'
+
+
+class Graph:
+    """The nodes of a graph mapped by id, and the edges between their sockets.
+
+    The graph is kept acyclic, see `topology`.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.edge_count = 0
+        self.topology = TopologyIndex(self.nodes)
+
+    def add_node(self, node_id: str, node_class: str, inputs=(), outputs=(),
+                 view=None) -> NodeModel:
+        """Add a node, see `NodeModel`.
+
+        Raises:
+            RuntimeError: If the node id already exists.
+        """
+        if node_id in self.nodes:
+            raise RuntimeError(f'Node id already exists: {node_id}')
+
+        node = self.nodes[node_id] = NodeModel(
+            node_id, node_class, inputs, outputs, view)
+        self.topology.add_node(node)
+        return node
+
+    def remove_node(self, node_id: str) -> list:
+        """Remove a node and disconnect its edges.
+
+        Returns:
+            (list) - The disconnected edges.
+        """
+        node = self.nodes.pop(node_id)
+
+        edges = node.input_edges() + node.output_edges()
+        for edge in edges:
+            self.disconnect(edge)
+
+        self.topology.remove_node(node)
+        return edges
+
+    def connect(self, start: NodeModel, start_index: int,
+                end: NodeModel, end_index: int, view=None) -> Edge:
+        """Connect an output socket to an input socket.
+
+        Raises:
+            RuntimeError: If the input socket is already connected, the
+            caller has to disconnect the previous edge first.
+            CycleError: If the edge would close a cycle.
+        """
+        return self.add_edge(Edge(start, start_index, end, end_index, view))
+
+    def add_edge(self, edge: Edge) -> Edge:
+        """Connect an edge created by the caller, see `connect`."""
+        start, end = edge.start, edge.end
+        if end.input_edge(edge.end_index):
+            raise RuntimeError(
+                f'Input already connected: {end.node_id}[{edge.end_index}]')
+
+        self.topology.add_edge(start, end)
+
+        if end._inputs is None:
+            end._inputs = [None] * len(end.input_types)
+        end._inputs[edge.end_index] = edge
+
+        if start._outputs is None:
+            start._outputs = [None] * len(start.output_types)
+        if start._outputs[edge.start_index] is None:
+            start._outputs[edge.start_index] = [edge]
+        else:
+            start._outputs[edge.start_index].append(edge)
+
+        self.edge_count += 1
+        return edge
+
+    def disconnect(self, edge: Edge) -> None:
+        edge.start._outputs[edge.start_index].remove(edge)
+        edge.end._inputs[edge.end_index] = None
+        self.edge_count -= 1
+        self.topology.remove_edge(edge.start, edge.end)
+
+    def edges(self):
+        """Iterate every edge, by node and output socket index."""
+        for node in self.nodes.values():
+            yield from node.output_edges()
+
+    def clear(self):
+        self.nodes.clear()
+        self.edge_count = 0
+        self.topology.clear()
+
+    def __len__(self):
+        return len(self.nodes)
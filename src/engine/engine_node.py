@@ -0,0 +1,227 @@
+import logging
+
+from src.engine.engine_cache import OutputCache
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+class SocketType:
+    """Socket types as saved by the editor, without the Qt colors."""
+
+    execute = 'execute'
+    number = 'number'
+    array = 'list'
+    boolean = 'boolean'
+    text = 'string'
+    widget = 'widget'
+    value = 'value'
+
+
+class EngineNode:
+    """Qt-free counterpart of a `NodeContent`.
+
+    `inputs` and `outputs` list the socket types in the same order the editor
+    node creates its sockets, so the socket indexes of a saved graph can be
+    used as they are.
+    """
+
+    title = None
+    is_event_node = False
+
+    # opt-in memoization of `get_output`, for nodes whose output only depends
+    # on their saved state and input values.
+    memoize = False
+    memoize_size = 128
+
+    # nodes whose outputs only depend on their saved state and input values,
+    # served from the `disk_cache` across sessions when the run has one.
+    pure = False
+    disk_cache = None
+
+    # nodes that can be evaluated concurrently with other nodes in a pool
+    thread_safe = False
+
+    # CPU bound nodes that can be evaluated in a worker process
+    run_in_process = False
+
+    # state key a source node reads from a column in batch mode
+    batch_input = None
+
+    # nodes that implement the `*_batch` methods, the others are evaluated
+    # row by row in batch mode
+    vectorized = False
+
+    # nodes that implement the `compile_*` methods, the others are called
+    # directly by the compiled function, see `GraphCompiler`
+    inline = False
+
+    inputs = ()
+    outputs = ()
+
+    def __init__(self, node_id: str):
+        self.node_id = node_id
+        self.was_execute = False
+
+        self.output_version = 0
+        self.state_version = 0
+
+        self.input_values = {}
+        self.output_cache = OutputCache(self.memoize_size) if self.memoize else None
+
+        # outputs computed by a worker process, see `apply_work_result`
+        self.process_outputs = {}
+
+    @property
+    def output_execs(self) -> list:
+        return [index for index, socket_type in enumerate(self.outputs)
+                if socket_type == SocketType.execute]
+
+    @property
+    def data_outputs(self) -> list:
+        return [index for index, socket_type in enumerate(self.outputs)
+                if socket_type != SocketType.execute]
+
+    def mark_dirty(self):
+        """Mark the node content as changed.
+
+        Both the input and the output edges of the node will transfer their
+        data again on the next run.
+        """
+        self.state_version += 1
+        self.output_version += 1
+        self.process_outputs.clear()
+
+    def outputs_changed(self):
+        """Mark the node outputs as changed after receiving new data."""
+        self.output_version += 1
+
+    def pull_output(self, index):
+        """Get an output for an edge, from the node cache if memoized."""
+        if index in self.process_outputs:
+            return self.process_outputs[index]
+
+        if self.memoize:
+            return self.output_cache.get_output(
+                index, self.save_state(), self.input_values, self._compute_output)
+        return self._compute_output(index)
+
+    def _compute_output(self, index):
+        if self.pure and self.disk_cache:
+            return self.disk_cache.get_output(
+                str(self), index, self.save_state(), self.input_values,
+                self.get_output)
+        return self.get_output(index)
+
+    def push_input(self, value, index):
+        """Set an input from an edge, keeping track of the input values."""
+        self.input_values[index] = value
+        return self.set_input(value, index)
+
+    def work_unit(self, inputs: list) -> tuple:
+        """Get the picklable `WorkUnit` fields to evaluate the node in a process."""
+        return (str(self), self.node_id, self.save_state(), inputs)
+
+    def apply_work_result(self, inputs: list, result):
+        """Apply the result of a worker process to the node."""
+        self.input_values.update(inputs)
+        if result.state != self.save_state():
+            self.restore_state(result.state)
+
+        self.process_outputs = dict(result.outputs)
+        self.outputs_changed()
+
+    def clear_output(self, index):
+        return
+
+    def get_output(self, index):
+        raise NotImplementedError(self.node_id)
+
+    def set_input(self, value, index):
+        raise NotImplementedError(self.node_id)
+
+    def save_state(self):
+        return {}
+
+    def restore_state(self, content):
+        pass
+
+    def result(self):
+        """The value produced by a sink node at the end of a run.
+
+        Returns:
+            (any) - `None` if the node does not produce a result.
+        """
+        return None
+
+    def iterate(self):
+        """Get the iterator of a loop node, see `walk_exec_flow`.
+
+        Returns:
+            (iterator) - `None` if the node is not a loop.
+        """
+        return None
+
+    def feed_batch(self, column):
+        """Set the column of values read in place of the `batch_input` state."""
+        raise NotImplementedError(self.node_id)
+
+    def set_input_batch(self, values, index):
+        """Set an input from a column of values, one per row."""
+        raise NotImplementedError(self.node_id)
+
+    def get_output_batch(self, index, size: int):
+        """Get an output as a column of `size` values, one per row."""
+        raise NotImplementedError(self.node_id)
+
+    def result_batch(self, size: int):
+        """The results of a sink node for every row of a batch.
+
+        Returns:
+            (list) - `None` if the node does not produce a result.
+        """
+        return None
+
+    def clear_batch(self):
+        """Drop the columns kept by the node after a batch."""
+        return
+
+    def compile_output(self, index, inputs: dict, state: dict) -> str:
+        """Get the Python expression of an output for the graph compiler.
+
+        Args:
+            index (int): The output socket index.
+            inputs (dict): The connected input indexes mapped to the local
+            variable holding their value.
+            state (dict): The `save_state` keys mapped to the expression of
+            their value.
+        """
+        raise NotImplementedError(self.node_id)
+
+    def compile_result(self, inputs: dict, state: dict):
+        """Get the Python expression of the node `result`.
+
+        Returns:
+            (str) - `None` if the node does not produce a result.
+        """
+        return None
+
+    def compile_execute(self, inputs: dict, state: dict) -> str:
+        """Get the Python expression of the node `execute_index`."""
+        raise NotImplementedError(self.node_id)
+
+    def get_execute_flow(self, output_execs):
+        if len(output_execs) >= 2:
+            raise NotImplementedError(
+                'Node should override the execute method '
+                'because it has more than one exec output')
+        return output_execs[0]
+
+    def execute_index(self) -> int:
+        """Get the index of the execute output socket to follow."""
+        return self.get_execute_flow(self.output_execs)
+
+    def __str__(self):
+        return f'{self.__class__.__name__}'
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.node_id}>'
@@ -0,0 +1,287 @@
+import logging
+from collections import namedtuple
+
+from src.engine.engine_process import submit_links
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+# sentinel of an exhausted loop iterator
+_LOOP_DONE = object()
+
+# `edge` is the object that owns `transfer_data`, the nodes are the objects
+# that own `execute_index`. Both the editor and the headless graph can
+# therefore be described with the same links.
+PlanLink = namedtuple('PlanLink', ['edge', 'start_node', 'start_index',
+                                   'end_node', 'end_index', 'is_execute'])
+
+
+class ExecutionPlan:
+    """A flat description of the graph execution.
+
+    The data steps of a node are sorted the first time the execute flow
+    reaches it, so the subgraphs behind branches that never run are neither
+    sorted nor evaluated.
+
+    Attributes:
+        event_nodes (list): The nodes where the execute flow starts.
+        exec_edges (dict): `(node, output index)` mapped to the execute
+        `(edge, next node)` connected to that socket.
+        data_steps (dict): A node reached by the execute flow mapped to the
+        links of the data edges that feed it, in topological order.
+        data_waves (dict): The same data steps grouped into waves. Each wave
+        is a list of groups, one for every node fed in that wave, and the
+        groups of a wave do not depend on each other.
+    """
+
+    def __init__(self, event_nodes, exec_edges, data_inputs, exec_nodes):
+        self.event_nodes = event_nodes
+        self.exec_edges = exec_edges
+        self.data_steps = {}
+        self.data_waves = {}
+
+        self._data_inputs = data_inputs
+        self._exec_nodes = exec_nodes
+
+    def next_exec(self, node, index):
+        """Get the `(edge, next node)` pair of an execute output socket.
+
+        Returns:
+            (tuple) - The pair or `None` if the socket is not connected.
+        """
+        return self.exec_edges.get((node, index))
+
+    def steps(self, node) -> list:
+        """Get the data links feeding a node, sorting them on the first call."""
+        steps = self.data_steps.get(node)
+        if steps is None:
+            steps = self.data_steps[node] = _sort_data_edges(
+                node, self._data_inputs, self._exec_nodes)
+        return steps
+
+    def data_nodes(self) -> set:
+        """Get the nodes connected by a data edge, the ones `run_plan` may
+        submit to its pools."""
+        return {node for links in self._data_inputs.values() for link in links
+                for node in (link.start_node, link.end_node)}
+
+    def waves(self, node) -> list:
+        waves = self.data_waves.get(node)
+        if waves is None:
+            waves = self.data_waves[node] = _group_waves(self.steps(node))
+        return waves
+
+
+def _sort_data_edges(node, data_inputs, exec_nodes) -> list:
+    """Get the data edges upstream of a node in topological order.
+
+    Nodes that have an execute input are fed by the execute flow itself, so
+    the walk only pulls their output and does not evaluate their inputs.
+
+    The depth first walk uses an explicit stack, so the length of a chain is
+    not bound by the recursion limit. Each frame keeps the link that reached
+    its node, which is added once all the node inputs are sorted.
+    """
+    steps = []
+    visited = {node}
+    stack = [(node, iter(data_inputs.get(node, [])), None)]
+
+    while stack:
+        current, links, via_link = stack[-1]
+        for link in links:
+            parent = link.start_node
+            if parent not in visited and parent not in exec_nodes:
+                visited.add(parent)
+                stack.append((parent, iter(data_inputs.get(parent, [])), link))
+                break
+            steps.append(link)
+        else:
+            stack.pop()
+            if via_link:
+                steps.append(via_link)
+
+    return steps
+
+
+def _group_waves(steps) -> list:
+    """Group topologically sorted links by the node they feed, into waves.
+
+    A node is fed in the wave after the last of its fed parents, so the
+    groups of the same wave can run concurrently.
+    """
+    levels = {}
+    groups = {}
+    for link in steps:
+        level = levels.get(link.start_node, -1) + 1
+        levels[link.end_node] = max(levels.get(link.end_node, 0), level)
+        groups.setdefault(link.end_node, []).append(link)
+
+    waves = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+    for node, links in groups.items():
+        waves[levels[node]].append(links)
+    return waves
+
+
+def _transfer_group(links) -> None:
+    for link in links:
+        if link.edge.is_dirty:
+            link.edge.transfer_data()
+
+
+def _is_thread_safe(links) -> bool:
+    return all(link.start_node.thread_safe and link.end_node.thread_safe
+               for link in links)
+
+
+def _run_wave(wave, pool=None, process_pool=None, exec_node=None) -> None:
+    """Transfer the data of a wave, concurrently when possible.
+
+    Groups that feed a `run_in_process` node are submitted to the process
+    pool and their result is applied in the calling thread, where the
+    `exec_node` the wave feeds also receives its inputs. Groups are
+    submitted to the thread pool only if every node they touch declares
+    itself thread safe, the others run in the calling thread.
+    """
+    jobs = []
+    for links in wave:
+        if process_pool and links[0].end_node.run_in_process:
+            job = submit_links(process_pool, links,
+                               set_inputs=links[0].end_node is exec_node)
+            if job:
+                jobs.append(job)
+
+        elif pool and len(wave) > 1 and _is_thread_safe(links):
+            jobs.append((pool.submit(_transfer_group, links), None))
+
+        else:
+            _transfer_group(links)
+
+    for future, apply in jobs:
+        result = future.result()
+        if apply:
+            apply(result)
+
+
+def compile_plan(links, event_nodes) -> ExecutionPlan:
+    """Compile the graph links into an `ExecutionPlan`.
+
+    Args:
+        links (list): A list of `PlanLink` describing every graph edge.
+        event_nodes (list): The nodes where the execute flow starts.
+    """
+    exec_edges = {}
+    exec_nodes = set()
+    data_inputs = {}
+
+    for link in links:
+        if link.is_execute:
+            exec_edges[(link.start_node, link.start_index)] = (
+                link.edge, link.end_node)
+            exec_nodes.add(link.end_node)
+        else:
+            data_inputs.setdefault(link.end_node, []).append(link)
+
+    for inputs in data_inputs.values():
+        inputs.sort(key=lambda link: link.end_index)
+
+    LOGGER.debug('Compiled plan: %s exec edges, %s exec nodes',
+                 len(exec_edges), len(exec_nodes))
+
+    return ExecutionPlan(list(event_nodes), exec_edges, data_inputs, exec_nodes)
+
+
+def walk_exec_flow(plan: ExecutionPlan, on_exec_edge=None):
+    """Yield the nodes reached by the execute flow, starting from the events.
+
+    The next node is resolved only when the generator resumes, so the caller
+    must feed the data of the yielded node before asking for the next one:
+    the node picks its execute output based on its inputs.
+
+    Loop nodes, whose `iterate()` returns an iterator, run the flow connected
+    to their execute output once per element. The elements are pulled one at
+    a time after the previous loop body completed, so the loop never holds
+    more than the current element.
+    """
+    for node in plan.event_nodes:
+        yield node
+
+        # the innermost running loop is last
+        loops = []
+
+        while True:
+            items = node.iterate() if node is not None else None
+            if items is not None:
+                loops.append((node, iter(items)))
+                node = None
+
+            next_exec = None
+            if node is not None:
+                next_exec = plan.next_exec(node, node.execute_index())
+
+            while not next_exec and loops:
+                loop, items = loops[-1]
+                next_exec = plan.next_exec(loop, loop.execute_index())
+                if not next_exec or next(items, _LOOP_DONE) is _LOOP_DONE:
+                    loops.pop()
+                    next_exec = None
+                    continue
+
+                loop.outputs_changed()
+
+            if not next_exec:
+                break
+
+            edge, node = next_exec
+            if on_exec_edge:
+                on_exec_edge(edge)
+
+            yield node
+
+
+def feed_inputs(node) -> None:
+    """Make the edges connected to the inputs of a node dirty.
+
+    A node reached by the execute flow always receives its inputs, even if
+    they did not change since the last run, since running it can depend on
+    them, e.g. `NodeDebug` showing its input again after being cleared. The
+    clean edges further upstream are still not pulled again.
+    """
+    node.state_version += 1
+
+
+def run_plan(plan: ExecutionPlan, on_exec_edge=None, pool=None,
+             process_pool=None, on_node=None) -> list:
+    """Execute a compiled plan.
+
+    Only the dirty data edges transfer their data, so a run after a change
+    only touches the nodes downstream of it. The nodes reached by the execute
+    flow always receive their inputs, run and mark their outputs as changed.
+
+    Args:
+        plan (ExecutionPlan): The plan to run.
+        on_exec_edge (callable): Optional callback invoked with every execute
+        edge the flow goes through.
+        pool (ThreadPoolExecutor): Optional pool used to evaluate the
+        independent data branches of thread safe nodes concurrently.
+        process_pool (ProcessPoolExecutor): Optional pool used to evaluate
+        the nodes that declare `run_in_process`.
+        on_node (callable): Optional callback invoked with every node after
+        it was executed. It can raise to stop the run.
+
+    Returns:
+        (list) - The nodes reached by the execute flow, in the order they
+        first executed. Nodes of a loop body are listed once.
+    """
+    executed = {}
+    for node in walk_exec_flow(plan, on_exec_edge):
+        feed_inputs(node)
+        for wave in plan.waves(node):
+            _run_wave(wave, pool, process_pool, node)
+
+        node.outputs_changed()
+        node.was_execute = True
+        executed[node] = None
+
+        if on_node:
+            on_node(node)
+
+    return list(executed)
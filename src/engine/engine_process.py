@@ -0,0 +1,83 @@
+"""Process pool work units.
+
+A node that sets `run_in_process = True` is evaluated in a worker process by
+its headless counterpart: the work unit is the node class name, its
+`save_state()` dict and its input values, which are all picklable. The
+worker sends back the new state and the data outputs, which are applied to
+the original node in the main process. A node reached by the execute flow
+also receives its inputs there, so its widgets and its execute output follow
+them as when it runs in the main process.
+
+Custom nodes must be importable by the worker, i.e. registered in a module
+and not in `__main__`, when the pool uses the `spawn` start method.
+"""
+import logging
+from collections import namedtuple
+
+from src.engine.engine_node import SocketType
+from src.engine.engine_register import EngineRegister
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+WorkUnit = namedtuple('WorkUnit', ['node_class', 'node_id', 'state', 'inputs'])
+WorkResult = namedtuple('WorkResult', ['state', 'outputs'])
+
+
+def run_work_unit(work: WorkUnit) -> WorkResult:
+    """Evaluate a node work unit, this runs inside the worker process.
+
+    Args:
+        work (WorkUnit): The node class name, id, state and the input values
+        as a list of `(index, value)` in the order they must be set.
+    """
+    node = EngineRegister.get_node_class_object(work.node_class)(work.node_id)
+    node.restore_state(work.state)
+
+    for index, value in work.inputs:
+        node.push_input(value, index)
+
+    outputs = {index: node.get_output(index)
+               for index, socket_type in enumerate(node.outputs)
+               if socket_type != SocketType.execute}
+
+    return WorkResult(node.save_state(), outputs)
+
+
+def submit_links(process_pool, links, set_inputs: bool = False):
+    """Pull the data of the dirty links and submit the end node work unit.
+
+    Args:
+        process_pool (ProcessPoolExecutor): The pool.
+        links (list): The `PlanLink` feeding the same end node.
+        set_inputs (bool): Also call the end node `set_input` with the inputs
+        when the result is applied, for a node of the execute flow whose
+        widgets or execute output depend on them, e.g. `NodeDebug`.
+
+    Returns:
+        (tuple) - The future and a callable that applies its result to the
+        end node, or `None` if no link was dirty.
+    """
+    dirty = [link for link in links if link.edge.is_dirty]
+    if not dirty:
+        return None
+
+    node = links[0].end_node
+    pulled = []
+    for link in dirty:
+        pulled.append((link.end_index, link.edge.pull_data()))
+
+    fresh = {index for index, _ in pulled}
+    inputs = [(index, value) for index, value in node.input_values.items()
+              if index not in fresh] + pulled
+
+    future = process_pool.submit(run_work_unit,
+                                 WorkUnit(*node.work_unit(inputs)))
+
+    def apply(result: WorkResult):
+        if set_inputs:
+            for index, value in inputs:
+                node.set_input(value, index)
+        # the state computed by the worker wins over the one set above
+        node.apply_work_result(inputs, result)
+
+    return future, apply
@@ -0,0 +1,123 @@
+"""Per node profiling of a run.
+
+The profiler wraps the `set_input`, `get_output` and `get_execute_flow`
+methods of the node instances while it is attached, and removes the wrappers
+once detached, so the nodes of a run without profiler are left untouched.
+"""
+import sys
+import time
+import threading
+
+# `time.thread_time` is only available from python 3.7
+_cpu_time = getattr(time, 'thread_time', time.process_time)
+
+
+class NodeStats:
+    """The time spent in the methods of a node.
+
+    Attributes:
+        node_id (str): The profiled node id.
+        wall (float): The wall clock time, in seconds.
+        cpu (float): The CPU time of the calling thread, in seconds.
+        calls (int): The number of profiled method calls.
+        bytes (int): The size of the values returned by `get_output`.
+    """
+
+    def __init__(self, node_id: str):
+        self.node_id = node_id
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+        self.bytes = 0
+
+    def as_dict(self) -> dict:
+        return {'node_id': self.node_id, 'wall': self.wall, 'cpu': self.cpu,
+                'calls': self.calls, 'bytes': self.bytes}
+
+    def __repr__(self):
+        return (f'<NodeStats {self.node_id} wall={self.wall:.6f} '
+                f'cpu={self.cpu:.6f} calls={self.calls} bytes={self.bytes}>')
+
+
+class Profiler:
+    """Record the wall time, CPU time, calls and output bytes of each node.
+
+    `Profiler.attach` is meant to wrap a single run, the stats are kept until
+    `reset` is called.
+    """
+
+    methods = ('set_input', 'get_output', 'get_execute_flow')
+
+    def __init__(self):
+        self.stats = {}
+
+        self._lock = threading.Lock()
+        self._attached = []
+
+    def attach(self, nodes) -> None:
+        """Wrap the profiled methods of the nodes instances."""
+        for node in nodes:
+            for name in self.methods:
+                method = getattr(node, name)
+                self._attached.append((node, name, node.__dict__.get(name)))
+                setattr(node, name, self._wrap(node.node_id, name, method))
+
+    def detach(self) -> None:
+        """Restore the methods of the attached nodes."""
+        for node, name, previous in reversed(self._attached):
+            if previous is None:
+                delattr(node, name)
+            else:
+                setattr(node, name, previous)
+
+        self._attached = []
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats = {}
+
+    def _wrap(self, node_id: str, name: str, method):
+        measure_bytes = name == 'get_output'
+
+        def profiled(*args, **kwargs):
+            wall = time.perf_counter()
+            cpu = _cpu_time()
+            result = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            finally:
+                self._record(node_id, time.perf_counter() - wall,
+                             _cpu_time() - cpu,
+                             sys.getsizeof(result) if measure_bytes else 0)
+
+        return profiled
+
+    def _record(self, node_id: str, wall: float, cpu: float, size: int):
+        with self._lock:
+            stats = self.stats.get(node_id)
+            if stats is None:
+                stats = self.stats[node_id] = NodeStats(node_id)
+
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.calls += 1
+            stats.bytes += size
+
+    def heat(self) -> dict:
+        """Get the wall time of each node relative to the slowest one.
+
+        Returns:
+            (dict) - The node id mapped to a value between 0 and 1.
+        """
+        with self._lock:
+            slowest = max((stats.wall for stats in self.stats.values()),
+                          default=0.0)
+            return {node_id: stats.wall / slowest if slowest else 0.0
+                    for node_id, stats in self.stats.items()}
+
+    def report(self) -> list:
+        """Get the stats of every node, the slowest first."""
+        with self._lock:
+            return sorted(self.stats.values(), key=lambda stats: stats.wall,
+                          reverse=True)
@@ -0,0 +1,31 @@
+class EngineRegister:
+    nodes_classes = {}
+
+    @classmethod
+    def register_class(cls, node_class):
+        """Register a headless node class.
+
+        This function is used as a decorator on a `EngineNode` declaration.
+        The class name must match the editor node it mirrors, e.g. `NodeDebug`,
+        so that the classes saved in a graph file can be resolved.
+        """
+        cls.nodes_classes[node_class.__name__] = node_class
+        return node_class
+
+    @classmethod
+    def get_node_class_object(cls, node: str):
+        """Get a headless class reference object.
+
+        `EngineRegister.get_node_class_object('NodeDebug')`.
+
+        Returns:
+            obj - The object reference for the node.
+
+        Raises:
+            RunTimeError: If the class is invalid.
+        """
+        node_class = cls.nodes_classes.get(node)
+        if node_class:
+            return node_class
+
+        raise RuntimeError(f'Headless node class not found: {node}')
@@ -0,0 +1,190 @@
+"""Keep graphs loaded in memory and run them on request.
+
+`GraphService` is the core of `python -m src.serve`: a graph file is loaded
+once, its plan, compiled function and node instances are reused by the next
+runs, and it is reloaded when the file modification time changes.
+"""
+import os
+import json
+import time
+import logging
+import threading
+
+from src.engine.engine_compiler import _var_name, compile_graph
+from src.engine.engine_executor import GraphExecutor, RunControl
+from src.engine.engine_graph import EngineGraph
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+
+class ServiceBusy(RuntimeError):
+    """Every run slot stayed taken for longer than the queue timeout."""
+
+
+class InvalidRun(ValueError):
+    """The overrides or the options of a run do not fit the graph."""
+
+
+class WarmGraph:
+    """A graph file loaded in memory.
+
+    Runs of the same graph are serialized, since they share the nodes.
+
+    Args:
+        file (str): The graph file saved by the editor.
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        self.lock = threading.Lock()
+        self.runs = 0
+        self.loads = 0
+        self.load()
+
+    def load(self):
+        """Load the file, dropping the previous graph and compiled function."""
+        self.mtime = os.stat(self.file).st_mtime_ns
+        with open(self.file, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+
+        self.graph = EngineGraph.from_state(self.data)
+        self.executor = GraphExecutor(self.graph)
+        self.base_states = {node_id: node.save_state()
+                            for node_id, node in self.graph.nodes.items()}
+        self._compiled = None
+        self.loads += 1
+        LOGGER.info('Loaded graph: %s', self.file)
+
+    def is_stale(self) -> bool:
+        return os.stat(self.file).st_mtime_ns != self.mtime
+
+    @property
+    def compiled(self):
+        """The graph compiled by `compile_graph`, created on the first use."""
+        if self._compiled is None:
+            self._compiled = compile_graph(self.data)
+        return self._compiled
+
+    def _apply_overrides(self, overrides: dict):
+        """Set the overridden states, restoring the ones of the previous run.
+
+        Only the nodes whose state differs are marked dirty, so a run with the
+        same overrides reuses the data of the previous one.
+        """
+        for node_id in overrides:
+            if node_id not in self.graph.nodes:
+                raise InvalidRun(f'Node not found: {node_id}')
+
+        for node_id, node in self.graph.nodes.items():
+            state = dict(self.base_states[node_id], **overrides.get(node_id, {}))
+            if node.save_state() != state:
+                self.graph.set_state(node_id, state)
+
+    def _compiled_arguments(self, overrides: dict) -> dict:
+        arguments = {}
+        for node_id, override in overrides.items():
+            node = self.graph.nodes.get(node_id)
+            if node is None:
+                raise InvalidRun(f'Node not found: {node_id}')
+
+            if set(override) != {node.batch_input}:
+                raise InvalidRun(f'Compiled graphs only override the '
+                               f'{node.batch_input!r} state of {node_id}')
+
+            arguments[_var_name(node_id)] = override[node.batch_input]
+        return arguments
+
+    def run(self, overrides: dict = None, timeout: float = None,
+            compiled: bool = False) -> dict:
+        """Run the graph, the caller holds `lock`.
+
+        Args:
+            overrides (dict): A node id mapped to the state keys to override
+            for this run, e.g. `{'NodeInput.001': {'text': 'foo'}}`.
+            timeout (float): Optional run timeout in seconds.
+            compiled (bool): Run the compiled function, which only accepts
+            overrides of the source nodes `batch_input` and no timeout.
+
+        Returns:
+            (dict) - The results of the executed sink nodes.
+
+        Raises:
+            InvalidRun: If an override names an unknown node, or a compiled
+            run gets a timeout, since its function cannot be stopped between
+            nodes.
+        """
+        if compiled and timeout is not None:
+            raise InvalidRun('Compiled runs do not support a timeout')
+
+        overrides = overrides or {}
+        self.runs += 1
+
+        if compiled:
+            return self.compiled(**self._compiled_arguments(overrides))
+
+        self._apply_overrides(overrides)
+        return self.executor.run(RunControl(timeout))
+
+
+class GraphService:
+    """Run graph files kept in memory, with a bounded number of concurrent runs.
+
+    Args:
+        max_runs (int): The number of runs executed at the same time.
+        queue_timeout (float): How long a run waits for a free slot before
+        `ServiceBusy` is raised.
+    """
+
+    def __init__(self, max_runs: int = 4, queue_timeout: float = 30):
+        self.max_runs = max_runs
+        self.queue_timeout = queue_timeout
+
+        self._graphs = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_runs)
+
+    def warm_graph(self, file: str) -> WarmGraph:
+        """Get the loaded graph of a file, loading or reloading it if needed."""
+        file = os.path.abspath(file)
+        with self._lock:
+            entry = self._graphs.get(file)
+            if entry is None:
+                entry = self._graphs[file] = WarmGraph(file)
+                return entry
+
+        if entry.is_stale():
+            with entry.lock:
+                if entry.is_stale():
+                    entry.load()
+        return entry
+
+    def run(self, file: str, overrides: dict = None, timeout: float = None,
+            compiled: bool = False) -> dict:
+        """Run a graph file, see `WarmGraph.run`.
+
+        Returns:
+            (dict) - The `results` and the `wall` time in seconds.
+
+        Raises:
+            ServiceBusy: If no run slot was freed within the queue timeout.
+            InvalidRun: If the overrides or the options do not fit the graph.
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise ServiceBusy(f'No free run slot after {self.queue_timeout}s')
+
+        try:
+            entry = self.warm_graph(file)
+            with entry.lock:
+                start = time.perf_counter()
+                results = entry.run(overrides, timeout, compiled)
+                return {'results': results, 'wall': time.perf_counter() - start}
+        finally:
+            self._slots.release()
+
+    def status(self) -> list:
+        """Get the loaded graphs with their runs and loads count."""
+        with self._lock:
+            entries = list(self._graphs.values())
+
+        return [{'file': entry.file, 'runs': entry.runs, 'loads': entry.loads,
+                 'mtime': entry.mtime} for entry in entries]
@@ -0,0 +1,184 @@
+"""Incremental topological index of a `Graph`.
+
+Every node keeps its position in a topological order of the graph. An edge
+added against the order only reorders the nodes between its two ends, found
+by two walks bounded by their positions (the dynamic topological order of
+Pearce and Kelly), and the forward walk reaching the start node means the
+edge would close a cycle, so it is rejected before being connected.
+
+The roots and leaves are collected on the first query and then updated on
+every change, and the order is sorted once and kept until a reorder or a
+removal.
+"""
+
+
+class CycleError(RuntimeError):
+    """Raised when an edge would close a cycle in the graph."""
+
+
+def _parents(node) -> list:
+    return [edge.start for edge in node.input_edges()]
+
+
+def _children(node) -> list:
+    return [edge.end for edge in node.output_edges()]
+
+
+class TopologyIndex:
+    """The topological order, roots and leaves of the nodes of a graph.
+
+    Args:
+        nodes (dict): The nodes of the graph mapped by id, the index keeps a
+            reference to it.
+    """
+
+    def __init__(self, nodes: dict):
+        self._nodes = nodes
+
+        # the nodes without input or output edges as ordered sets, `None`
+        # until queried so loading a graph does not fill them with every node
+        self._roots = None
+        self._leaves = None
+
+        self._next_order = 0
+        self._sorted = None
+
+    def add_node(self, node) -> None:
+        node.order = self._next_order
+        self._next_order += 1
+
+        if self._roots is not None:
+            self._roots[node] = None
+            self._leaves[node] = None
+
+        # the new node is the last of the order
+        if self._sorted is not None:
+            self._sorted.append(node)
+
+    def remove_node(self, node) -> None:
+        """Remove a node whose edges were already removed."""
+        if self._roots is not None:
+            self._roots.pop(node, None)
+            self._leaves.pop(node, None)
+        self._sorted = None
+
+    def add_edge(self, start, end) -> None:
+        """Update the index for an edge about to be connected.
+
+        Raises:
+            CycleError: If the edge would close a cycle.
+        """
+        if start.order >= end.order:
+            forward = None if start is end else self._walk(
+                end, start.order, _children, start)
+            if forward is None:
+                raise CycleError(
+                    f'Edge would create a cycle: {start.node_id} -> {end.node_id}')
+
+            backward = self._walk(start, end.order, _parents)
+            self._reorder(sorted(backward, key=_order) + sorted(forward, key=_order))
+
+        if self._roots is not None:
+            self._roots.pop(end, None)
+            self._leaves.pop(start, None)
+
+    def remove_edge(self, start, end) -> None:
+        """Update the index for a disconnected edge."""
+        if self._roots is None:
+            return
+        if not end.input_edges():
+            self._roots[end] = None
+        if not start.output_edges():
+            self._leaves[start] = None
+
+    def creates_cycle(self, start, end) -> bool:
+        """Check if an edge from `start` to `end` would close a cycle."""
+        if start.order < end.order:
+            return False
+        return start is end or self._walk(end, start.order, _children, start) is None
+
+    def roots(self) -> list:
+        """Get the nodes without input edges."""
+        self._collect_ends()
+        return list(self._roots)
+
+    def leaves(self) -> list:
+        """Get the nodes without output edges."""
+        self._collect_ends()
+        return list(self._leaves)
+
+    def topological_order(self) -> list:
+        """Get the nodes sorted so every node comes after its parents."""
+        if self._sorted is None:
+            self._sorted = sorted(self._nodes.values(), key=_order)
+        return list(self._sorted)
+
+    def upstream(self, node) -> list:
+        """Get the nodes a node depends on, in topological order."""
+        return sorted(self._closure(node, _parents), key=_order)
+
+    def downstream(self, node) -> list:
+        """Get the nodes depending on a node, in topological order."""
+        return sorted(self._closure(node, _children), key=_order)
+
+    def clear(self) -> None:
+        self._roots = None
+        self._leaves = None
+        self._next_order = 0
+        self._sorted = None
+
+    def _collect_ends(self) -> None:
+        if self._roots is not None:
+            return
+
+        nodes = self._nodes.values()
+        self._roots = dict.fromkeys(node for node in nodes if not node.input_edges())
+        self._leaves = dict.fromkeys(node for node in nodes if not node.output_edges())
+
+    @staticmethod
+    def _closure(node, neighbours) -> set:
+        visited = set()
+        stack = [node]
+        while stack:
+            for other in neighbours(stack.pop()):
+                if other not in visited:
+                    visited.add(other)
+                    stack.append(other)
+        return visited
+
+    @staticmethod
+    def _walk(node, bound: int, neighbours, target=None):
+        """Get the nodes reachable from a node whose order is within `bound`.
+
+        The forward walk over the children stops at the nodes after `bound`
+        and the backward walk over the parents at the nodes before it.
+
+        Returns:
+            (list) - The reached nodes, `None` if `target` was reached.
+        """
+        forward = neighbours is _children
+        visited = {node}
+        stack = [node]
+        while stack:
+            for other in neighbours(stack.pop()):
+                if other is target:
+                    return None
+                if other in visited:
+                    continue
+                if other.order <= bound if forward else other.order >= bound:
+                    visited.add(other)
+                    stack.append(other)
+        return list(visited)
+
+    def _reorder(self, nodes: list) -> None:
+        """Give the walked nodes their own positions again, in the order of
+        the list: the sorted backward walk followed by the sorted forward one.
+        """
+        orders = sorted(node.order for node in nodes)
+        for node, order in zip(nodes, orders):
+            node.order = order
+        self._sorted = None
+
+
+def _order(node) -> int:
+    return node.order
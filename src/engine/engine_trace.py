@@ -0,0 +1,269 @@
+"""Record the execution of a graph and replay it headlessly.
+
+A trace is a json serializable dict:
+
+- `graph`: the graph in the editor save file format, with the `save_state`
+  of every node before the run.
+- `states`: the `save_state` of every node after the run.
+- `exec`: the executed nodes, `[node_id, seconds since the start]`.
+- `exec_edges`: the execute outputs followed, `[node_id, index]`.
+- `transfers`: the data edges transfers, `[start_id, start_index, end_id,
+  end_index, digest, pull seconds, push seconds]`.
+- `values`: the transferred values keyed by digest, the values that are not
+  json serializable are saved in `opaque` by their `repr`.
+- `results` and `wall`: the run results and duration.
+"""
+import gzip
+import json
+import time
+import logging
+import threading
+from collections import deque
+
+from src.engine.engine_cache import digest
+from src.engine.engine_executor import GraphExecutor
+from src.engine.engine_graph import EngineGraph
+
+LOGGER = logging.getLogger('nodeeditor.engine')
+
+TRACE_VERSION = 1
+
+
+class TraceRecorder:
+    """Record the execute flow and the data transfers of a graph run.
+
+    The edges `pull_data` and `push_data` methods are wrapped while the
+    recorder is attached, like the nodes methods with a `Profiler`.
+
+    Args:
+        graph (EngineGraph): The graph to record.
+    """
+
+    def __init__(self, graph: EngineGraph):
+        self.graph = graph
+
+        self._start = None
+        self._lock = threading.Lock()
+        self._attached = []
+        self._pending = {}
+
+        self.initial_state = graph.state()
+        self.executed = []
+        self.exec_edges = []
+        self.transfers = []
+        self.values = {}
+        self.opaque = {}
+
+    def attach(self) -> None:
+        self._start = time.perf_counter()
+        for edge in self.graph.edges:
+            for name, wrap in (('pull_data', self._wrap_pull),
+                               ('push_data', self._wrap_push)):
+                self._attached.append((edge, name, edge.__dict__.get(name)))
+                setattr(edge, name, wrap(edge, getattr(edge, name)))
+
+    def detach(self) -> None:
+        for edge, name, previous in reversed(self._attached):
+            if previous is None:
+                delattr(edge, name)
+            else:
+                setattr(edge, name, previous)
+
+        self._attached = []
+
+    def _store(self, value) -> str:
+        try:
+            key = digest(value)
+        except TypeError:
+            key = digest(repr(value))
+        if key in self.values or key in self.opaque:
+            return key
+
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            self.opaque[key] = repr(value)
+        else:
+            self.values[key] = value
+        return key
+
+    def _wrap_pull(self, edge, method):
+        def pull_data():
+            start = time.perf_counter()
+            value = method()
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                transfer = [edge.start_node.node_id, edge.start_index,
+                            edge.end_node.node_id, edge.end_index,
+                            self._store(value), elapsed, 0.0]
+                self.transfers.append(transfer)
+                self._pending[edge] = transfer
+            return value
+
+        return pull_data
+
+    def _wrap_push(self, edge, method):
+        def push_data(value):
+            start = time.perf_counter()
+            results = method(value)
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                transfer = self._pending.pop(edge, None)
+                if transfer:
+                    transfer[6] = elapsed
+            return results
+
+        return push_data
+
+    def on_exec_edge(self, edge):
+        self.exec_edges.append([edge.start_node.node_id, edge.start_index])
+
+    def on_node(self, node):
+        self.executed.append([node.node_id, time.perf_counter() - self._start])
+
+    def trace(self, results: dict) -> dict:
+        return {
+            'version': TRACE_VERSION,
+            'graph': self.initial_state,
+            'states': {node_id: node.save_state()
+                       for node_id, node in self.graph.nodes.items()},
+            'exec': self.executed,
+            'exec_edges': self.exec_edges,
+            'transfers': self.transfers,
+            'values': self.values,
+            'opaque': self.opaque,
+            'results': results,
+            'wall': time.perf_counter() - self._start,
+        }
+
+
+def record_trace(graph: EngineGraph, executor: GraphExecutor = None) -> dict:
+    """Run a graph and record its trace.
+
+    Only the dirty edges transfer their data, record a freshly loaded graph
+    to capture every transfer.
+
+    Args:
+        graph (EngineGraph): The graph to run.
+        executor (GraphExecutor): Optional executor of the graph, e.g. with
+        pools or a profiler.
+
+    Returns:
+        (dict) - The trace, see the module docstring.
+    """
+    executor = executor or GraphExecutor(graph)
+    recorder = TraceRecorder(graph)
+
+    recorder.attach()
+    try:
+        results = executor.run(on_exec_edge=recorder.on_exec_edge,
+                               on_node=recorder.on_node)
+    finally:
+        recorder.detach()
+
+    return recorder.trace(results)
+
+
+def save_trace(trace: dict, file: str) -> None:
+    """Save a trace as compact json, gzipped if the file ends with `.gz`."""
+    data = json.dumps(trace, separators=(',', ':')).encode('utf-8')
+    opener = gzip.open if file.endswith('.gz') else open
+    with opener(file, 'wb') as f:
+        f.write(data)
+
+
+def load_trace(file: str) -> dict:
+    opener = gzip.open if file.endswith('.gz') else open
+    with opener(file, 'rb') as f:
+        trace = json.loads(f.read().decode('utf-8'))
+
+    if trace.get('version') != TRACE_VERSION:
+        raise RuntimeError(f'Unsupported trace version: {trace.get("version")}')
+    return trace
+
+
+def _substitute(node, trace: dict):
+    """Replace the logic of a node with the values recorded in a trace."""
+    outputs = {}
+    for start_id, start_index, _, _, key, _, _ in trace['transfers']:
+        if start_id == node.node_id:
+            outputs.setdefault(start_index, deque()).append(key)
+
+    exec_indexes = deque(index for node_id, index in trace['exec_edges']
+                         if node_id == node.node_id)
+    is_loop = node.iterate() is not None
+    iterations = len(exec_indexes)
+    last = {}
+
+    def get_output(index):
+        keys = outputs.get(index)
+        if keys:
+            last[index] = keys.popleft()
+
+        key = last.get(index)
+        if key in trace['opaque']:
+            raise ValueError(f'Recorded output of {node.node_id}[{index}] is not '
+                             f'json serializable: {trace["opaque"][key]}')
+        return trace['values'].get(key)
+
+    def execute_index():
+        if is_loop or not exec_indexes:
+            return node.output_execs[0]
+        return exec_indexes.popleft()
+
+    # the recorded outputs are served as they are, never from or to a cache
+    node.memoize = False
+    node.pure = False
+    node.run_in_process = False
+    node.get_output = get_output
+    node.set_input = lambda value, index: None
+    node.execute_index = execute_index
+    node.iterate = lambda: iter(range(iterations)) if is_loop else None
+    node.result = lambda: trace['results'].get(node.node_id)
+
+
+def replay_trace(trace: dict, skip=(), isolate: str = None,
+                 executor_options: dict = None) -> dict:
+    """Replay a recorded trace headlessly.
+
+    The graph is rebuilt from the trace, the skipped nodes do not run their
+    logic and return the outputs recorded in the trace instead, so a slow
+    node can be timed without running its upstream.
+
+    `replay_trace(trace, isolate='NodeString.001', executor_options={'profiler': profiler})`
+
+    Args:
+        trace (dict): The trace generated by `record_trace`.
+        skip (iterable): The ids of the nodes to substitute.
+        isolate (str): If set, the id of the only node that is not substituted.
+        executor_options (dict): Keyword arguments of the `GraphExecutor`.
+
+    Returns:
+        (dict) - The trace of the replay, with the extra `mismatches` key
+        listing the indexes of the transfers whose value digest differs from
+        the recorded one.
+    """
+    graph = EngineGraph.from_state(trace['graph'])
+
+    skip = set(skip)
+    if isolate:
+        skip.update(node_id for node_id in graph.nodes if node_id != isolate)
+
+    for node_id in skip:
+        _substitute(graph.nodes[node_id], trace)
+
+    with GraphExecutor(graph, **(executor_options or {})) as executor:
+        replay = record_trace(graph, executor)
+
+    replay['mismatches'] = [
+        index for index, (recorded, replayed) in enumerate(
+            zip(trace['transfers'], replay['transfers']))
+        if recorded[:5] != replayed[:5]]
+
+    if len(trace['transfers']) != len(replay['transfers']):
+        LOGGER.warning('Replay transferred %s values, the trace %s',
+                       len(replay['transfers']), len(trace['transfers']))
+
+    return replay
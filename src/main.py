@@ -23,14 +23,15 @@ from PySide2.QtWidgets import (
 )
 
 
-from src.nodes import NodesRegister, create_node
+from src.nodes import create_node
 
 from src.utils.graph_state import load_file, save_file, scene_state
 
+from src.widgets.editor_cache import CacheStatsWidget
 from src.widgets.editor_menubar import NodeMenubar
+from src.widgets.editor_profiler import ProfilerTable
 from src.widgets.editor_scene import Scene
 from src.widgets.editor_view import GraphicsView
-from src.widgets.logic.left_click import LeftClickConstants
 from src.widgets.node_edge import NodeEdge
 
 LOGGER = logging.getLogger('nodeeditor.main')
@@ -69,6 +70,12 @@ class DebugWidget(QWidget):
         self.console.setFont(QFont('Menlo', 16))
         self.tabs.addTab(QUndoView(self.undo_stack), 'Undo History')
         self.tabs.addTab(self.console, 'Debug Console')
+
+        self.profiler_table = ProfilerTable()
+        self.tabs.addTab(self.profiler_table, 'Profiler')
+
+        self.cache_stats = CacheStatsWidget()
+        self.tabs.addTab(self.cache_stats, 'Cache')
         self.tabs.setCurrentIndex(1)
 
         self._btn_exec = QPushButton('Exec')
@@ -135,6 +142,13 @@ class MainWindow(QMainWindow):
         self.menubar = NodeMenubar(self)
         self.setMenuBar(self.menubar)
 
+        run_actions = self.menubar._run_actions
+        run_actions.profile_updated.connect(
+            self.debug_widget.profiler_table.show_stats)
+        run_actions.cache_updated.connect(self.debug_widget.cache_stats.show_stats)
+        self.debug_widget.cache_stats.clear_requested.connect(
+            run_actions.clear_disk_cache)
+
         self._set_toolbar()
         self._set_status_bar()
 
@@ -147,8 +161,8 @@ class MainWindow(QMainWindow):
     def reset_graph(self):
         self._scene.clear()
         self.undo_stack.clear()
-        NodesRegister.clean_register()
-        LeftClickConstants.reset_attrs()
+        self._scene.register.clean_register()
+        self._view.click_state.reset_attrs()
 
         if not scene_state(self._scene).get('nodes'):
             node = create_node(self._scene, 'NodeExecute')
@@ -198,6 +212,10 @@ class MainWindow(QMainWindow):
     def show_status_message(self, msg, timeout=5000):
         self.statusBar().showMessage(msg, timeout)
 
+    def closeEvent(self, event):
+        self.menubar._run_actions.shutdown()
+        super().closeEvent(event)
+
     def contextMenuEvent(self, event):
         """Right click menu."""
         if event.modifiers() == Qt.ControlModifier:
@@ -212,9 +230,11 @@ class MainWindow(QMainWindow):
         super().contextMenuEvent(event)
 
 
-app = QApplication(sys.argv)
+# the guard keeps the spawned worker processes from opening the editor
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
 
-window = MainWindow()
-window.show()
+    window = MainWindow()
+    window.show()
 
-app.exec_()
+    app.exec_()
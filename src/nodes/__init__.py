@@ -1,10 +1,12 @@
 from .nodes_register import NodesRegister
 from .nodes_content import NodeContent
 from .nodes_utility import (
+    connect_edge,
     connect_output_edges,
     connect_input_edges,
     extract_output_edges,
     extract_input_edges,
+    extract_plan_links,
     create_node
 )
 from .classes import *
@@ -17,6 +17,8 @@ class NodeBranchContent(NodeContent):
         self.condition = self.add_input_boolean('Condition', pos=3)
         self.output = None
 
+        self.track_changes(self.condition.toggled)
+
     def restore_state(self, content):
         self.condition.setChecked(content.get('condition', False))
 
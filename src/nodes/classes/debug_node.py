@@ -28,6 +28,9 @@ class NodeDebugContent(NodeContent):
     def set_input(self, value, index):
         self.text_box.setPlainText(str(value))
 
+    def show_result(self, value):
+        self.text_box.setPlainText(str(value))
+
     def clear_output(self, index):
         return
 
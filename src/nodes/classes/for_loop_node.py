@@ -18,17 +18,30 @@ class NodeForLoopContent(NodeContent):
 
         self.output = ['foo', 'bar', 'foobar']
 
+        # any iterable, consumed lazily by `iterate`
+        self.items = None
+        self.value = None
+        self.index = None
+
+    def iterate(self):
+        items = self.output if self.items is None else self.items
+        for index, value in enumerate(items):
+            self.index = index
+            self.value = value
+            yield value
+
     def get_output(self, index):
         if index == 1:
-            return self.output
+            return self.value
         if index == 2:
-            return range(len(self.output))
+            return self.index
 
     def clear_output(self, index):
         return ""
 
     def set_input(self, value, index):
-        return ""
+        if index == 1:
+            self.items = value
 
 
 @NodesRegister.register_class
@@ -10,6 +10,8 @@ from src.widgets.node_socket import SocketType
 class NodeInputContent(NodeContent):
     """The node content widgets container class."""
 
+    memoize = True
+
     def __init__(self, node, parent=None):
         super().__init__(node, parent)
 
@@ -19,6 +21,8 @@ class NodeInputContent(NodeContent):
         self.text_box = QPlainTextEdit('foo BAR')
         self.add_widget(self.text_box, pos=2)
 
+        self.track_changes(self.text_box.textChanged)
+
     def restore_state(self, content):
         self.text_box.setPlainText(content.get('text', ''))
 
@@ -22,6 +22,8 @@ class NodeNumberContent(NodeContent):
         self.add_widget(self.spinbox, pos=1)
         self.add_output(SocketType.number, 'Number', pos=2)
 
+        self.track_changes(self.spinbox.valueChanged)
+
     def restore_state(self, content):
         return self.spinbox.setValue(content.get('spinbox', 0.0))
 
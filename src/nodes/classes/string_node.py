@@ -36,6 +36,9 @@ class NodeStringContent(NodeContent):
 
         self.output_text = ""
 
+        self.track_changes(self.text.textChanged, self.make_upper.toggled,
+                           self.make_lower.toggled, self.make_title.toggled)
+
     def restore_state(self, content):
         self.text.setText(content.get('text'))
         for button, state in content['buttons'].items():
@@ -2,7 +2,7 @@ import logging
 
 from collections import namedtuple
 
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, Signal
 from PySide2.QtWidgets import (
     QCheckBox,
     QFormLayout,
@@ -12,6 +12,7 @@ from PySide2.QtWidgets import (
     QWidget
 )
 
+from src.engine.engine_cache import OutputCache
 from src.widgets.node_socket import SocketType
 
 LOGGER = logging.getLogger('nodeeditor.master_node')
@@ -20,6 +21,25 @@ SocketData = namedtuple('SocketData', ['data', 'widget', 'label'])
 
 
 class NodeContent(QWidget):
+    content_changed = Signal()
+
+    # opt-in memoization of `get_output`, for nodes whose output only depends
+    # on their saved state and input values.
+    memoize = False
+    memoize_size = 128
+
+    # nodes whose outputs only depend on their saved state and input values,
+    # served from the `disk_cache` across sessions when the run has one.
+    pure = False
+    disk_cache = None
+
+    # nodes that can be evaluated in a worker thread, concurrently with other
+    # nodes. Nodes that read or write widgets in their logic must not be.
+    thread_safe = False
+
+    # CPU bound nodes evaluated in a worker process by their headless
+    # counterpart in `src.engine.classes`, using `save_state` as work unit.
+    run_in_process = False
 
     def __init__(self, node, parent=None):
         super().__init__(parent)
@@ -29,6 +49,9 @@ class NodeContent(QWidget):
         self.inputs = []
         self.outputs = []
 
+        self.input_values = {}
+        self.output_cache = OutputCache(self.memoize_size) if self.memoize else None
+
         self.widgets = {}
         self._replaceable_widgets = {}
 
@@ -42,6 +65,33 @@ class NodeContent(QWidget):
     def layout_size(self):
         return self._layout.sizeHint()
 
+    def track_changes(self, *signals):
+        """Emit `content_changed` when any of the widget signals is emitted.
+
+        The node is then marked dirty and re-evaluated on the next run.
+
+        Args:
+            signals (Signal): The widgets signals, e.g. `QLineEdit.textChanged`.
+        """
+        for signal in signals:
+            signal.connect(self._on_content_changed)
+
+    def _on_content_changed(self, *args):
+        self.content_changed.emit()
+
+    def memoized_output(self, index):
+        """Get the output from the node cache, computing it on a miss."""
+        return self.output_cache.get_output(
+            index, self.save_state(), self.input_values, self.cached_output)
+
+    def cached_output(self, index):
+        """Get the output from the disk cache if the node is pure."""
+        if self.pure and self.disk_cache:
+            return self.disk_cache.get_output(
+                str(self.node), index, self.save_state(), self.input_values,
+                self.get_output)
+        return self.get_output(index)
+
     def add_widget(self, widget, pos=0):
         """Add a widget into the node graphics
 
@@ -176,6 +226,17 @@ class NodeContent(QWidget):
     def save_state(self):
         return {}
 
+    def iterate(self):
+        """Get the iterator of a loop node, see `walk_exec_flow`.
+
+        Returns:
+            (iterator) - `None` if the node is not a loop.
+        """
+        return None
+
+    def show_result(self, value):
+        """Display the result of a background run, see `EngineNode.result`."""
+
     def restore_state(self, content):
         pass
 
@@ -1,12 +1,89 @@
+import heapq
+
 from pprint import pformat
 from typing import Union
 
+from src.engine.engine_model import Graph
+
+
+def format_node_id(node_class: str, number: int) -> str:
+    """Get the id of a node, e.g. `NodeExample.002` or `NodeExample.1000`."""
+    return f'{node_class}.{str(number).zfill(3)}'
+
+
+def node_id_number(node_id: str) -> int:
+    return int(node_id.rsplit('.', 1)[-1])
+
+
+class NodeIdAllocator:
+    """Allocate the id numbers of the nodes of one class.
+
+    The lowest released number is reused first, so the gaps left by deleted
+    nodes get filled, otherwise the number after the highest one in use is
+    taken. Both operations are O(log n).
+    """
+
+    def __init__(self):
+        # the highest number in use
+        self.last = 0
+
+        # released numbers below `last`, the heap can hold stale numbers
+        # which are not in the set anymore
+        self._released = []
+        self._free = set()
+
+    def allocate(self) -> int:
+        while self._released:
+            number = heapq.heappop(self._released)
+            if number in self._free:
+                self._free.remove(number)
+                return number
+
+        self.last += 1
+        return self.last
+
+    def release(self, number: int) -> None:
+        if number != self.last:
+            self._free.add(number)
+            heapq.heappush(self._released, number)
+            return
+
+        # lower `last` to the highest number still in use
+        self.last -= 1
+        while self.last in self._free:
+            self._free.remove(self.last)
+            self.last -= 1
+
 
 class NodesRegister:
-    nodes = {}
+    """The nodes of a scene and the indexes to look them up.
+
+    Every `Scene` owns a register, so several graphs can be loaded and run
+    in the same process. The node classes are shared by all of them.
+    """
+
     nodes_classes = {}
-    all_nodes = []
-    event_nodes = []
+
+    def __init__(self):
+        # node class name mapped to the ids of its nodes and their `NodeGraphics`
+        self.nodes = {}
+
+        # every `NodeGraphics` mapped to its `Node`, in registration order
+        self.all_nodes = {}
+        self.event_nodes = []
+
+        # node id mapped to its `NodeGraphics`
+        self.node_ids = {}
+
+        # node class name mapped to the `NodeIdAllocator` of its ids
+        self.id_allocators = {}
+
+        # the topology of the graph, whose views are the `Node` and
+        # `NodeEdge` objects
+        self.graph = Graph()
+
+        # bumped on every node or edge change to invalidate the execution plan
+        self.revision = 0
 
     @classmethod
     def register_class(cls, node_class):
@@ -20,19 +97,23 @@ class NodesRegister:
             return node_class(args[0])
         return wrapper
 
-    @classmethod
-    def clean_register(cls):
+    def clean_register(self):
         """Clear the nodes in the register."""
-        cls.nodes.clear()
-        cls.all_nodes.clear()
-        cls.event_nodes.clear()
-
-    @classmethod
-    def reset_execution_flow(cls):
-        # Review: node data should already have all the information
-        # without the need to check if socket has edge
-        for node in cls.all_nodes:
-            for edge in node.data('output_edges'):
+        self.nodes.clear()
+        self.node_ids.clear()
+        self.id_allocators.clear()
+        self.all_nodes.clear()
+        self.event_nodes.clear()
+        self.graph.clear()
+        self.graph_changed()
+
+    def graph_changed(self):
+        """Mark the graph topology as changed."""
+        self.revision += 1
+
+    def reset_execution_flow(self):
+        for node in self.all_nodes:
+            for edge in node.base.output_edges:
                 edge.edge_graphics.update_flow_color()
 
     @classmethod
@@ -53,106 +134,100 @@ class NodesRegister:
 
         raise RuntimeError(f'Node class not found: {node}')
 
-    @classmethod
-    def get_node_from_graph(cls, node: 'NodeGraphics'):
+    def get_node_from_graph(self, node: 'NodeGraphics'):
         """Get a node from the graph by the class id.
 
-        `NodeRegister.get_node_from_graph(node_graphics_obj)`
+        `register.get_node_from_graph(node_graphics_obj)`
 
         Returns:
             (NodeGraphics) - A NodeGraphics object.
         """
-        return cls.nodes[node.node_class].get(node.node_id)
+        return self.nodes[node.node_class].get(node.node_id)
 
-    @classmethod
-    def get_node_from_id(cls, _id: str) -> Union['NodeGraphics', None]:
+    def get_node_from_id(self, _id: str) -> Union['NodeGraphics', None]:
         """Get a node from the graph by its id.
 
-        `NodeRegister.get_node_from_id('NodeExample.001')`
+        `register.get_node_from_id('NodeExample.001')`
 
         Returns:
             (NodeGraphics) - A NodeGraphics object if id was found, `None`
             otherwise.
 
         """
-        for node in cls.nodes.values():
-            for node_id in node:
-                if node_id == _id:
-                    return node[node_id]
-        return None
+        return self.node_ids.get(_id)
 
-    @classmethod
-    def get_last_node_id(cls, node_class: str) -> str:
+    def get_node_from_graphics(self, node: 'NodeGraphics') -> Union['Node', None]:
+        """Get the node of a graphics item.
+
+        Returns:
+            (Node) - The node if the graphics item is registered, `None`
+            otherwise.
+        """
+        return self.all_nodes.get(node)
+
+    def get_last_node_id(self, node_class: str) -> str:
         """Get the last node id of a specific class from the graph.
 
-        `NodeRegister.get_node_from_graph('NodeExample')`
+        `register.get_last_node_id('NodeExample')`
 
         Returns:
             (str) - A node id e.g., `NodeExample.002`.
         """
         # XXX: maybe should return the object directly?
-        return max(cls.nodes[node_class])
+        return format_node_id(node_class, self.id_allocators[node_class].last)
 
-    @classmethod
-    def reset_nodes_execution(cls) -> str:
-        for node in cls.all_nodes:
+    def reset_nodes_execution(self) -> str:
+        for node in self.all_nodes:
             node.base.was_execute = False
 
-    @classmethod
-    def get_event_nodes(cls) -> str:
-        return cls.event_nodes
+    def get_event_nodes(self) -> str:
+        return self.event_nodes
 
-    @classmethod
-    def get_root_nodes(cls) -> str:
+    def get_root_nodes(self) -> str:
         """Get all of the root nodes in the graphs.
 
-        `NodeRegister.ger_root_nodes()`
+        `register.get_root_nodes()`
 
         Root nodes are nodes which have no parent node attached.
 
         Returns:
             (list) - A list of nodes.
         """
-        starting_nodes = []
-        for node in cls.all_nodes:
-            node_data = node.data()
-            if not node_data['parents'] and node_data['children']:
-                starting_nodes.append(node.base)
-        return starting_nodes
+        return [node.view for node in self.graph.topology.roots()
+                if node.output_edges()]
 
-    @classmethod
-    def register_node(cls, node: 'NodeGraphics') -> str:
+    def register_node(self, node: 'NodeGraphics') -> str:
         """Add a node to the current scene register.
 
         Returns:
             (str) - The id of the registered node.
         """
-        cls.all_nodes.append(node)
+        self.all_nodes[node] = node.base
 
         if node.base.is_event_node:
-            cls.event_nodes.append(node)
+            self.event_nodes.append(node)
 
         node_class = node.node_class
-        node_data = cls.nodes.get(node_class)
-
-        node_num = 1
-        if node_data:
-            for index, key in enumerate(sorted(node_data.keys()), 1):
-                num = key.split('.')[-1]
-                if index != int(num):
-                    node_num = index
-                    break
-                node_num += 1
-        else:
-            cls.nodes.update({node_class: {}})
-
-        node_id = f'{node_class}.{str(node_num).zfill(3)}'
-        cls.nodes[node_class].update(({node_id: node}))
+        if node_class not in self.nodes:
+            self.nodes[node_class] = {}
+            self.id_allocators[node_class] = NodeIdAllocator()
+
+        node_id = format_node_id(
+            node_class, self.id_allocators[node_class].allocate())
+        self.nodes[node_class][node_id] = node
+        self.node_ids[node_id] = node
+        self.graph_changed()
 
         return node_id
 
-    @classmethod
-    def unregister_node(cls, node: 'NodeGraphics') -> None:
+    def unregister_node(self, node: 'NodeGraphics') -> None:
         """Remove a node from the current scene register."""
-        cls.all_nodes.remove(node)
-        cls.nodes[node.node_class].pop(node.node_id)
+        self.all_nodes.pop(node)
+        if node in self.event_nodes:
+            self.event_nodes.remove(node)
+
+        self.nodes[node.node_class].pop(node.node_id)
+        self.node_ids.pop(node.node_id)
+        self.id_allocators[node.node_class].release(node_id_number(node.node_id))
+        self.graph.remove_node(node.node_id)
+        self.graph_changed()
@@ -1,10 +1,16 @@
+import logging
+
 from PySide2.QtWidgets import (
     QGraphicsScene
 )
 
+from src.engine.engine_plan import PlanLink
+from src.engine.engine_topology import CycleError
 from src.nodes import NodesRegister
 from src.widgets.node_edge import NodeEdge
 
+LOGGER = logging.getLogger('nodeeditor.edge')
+
 
 def create_node(scene: QGraphicsScene, node_class: str) -> 'Node':
     """Create a node from a node class name.
@@ -15,34 +21,56 @@ def create_node(scene: QGraphicsScene, node_class: str) -> 'Node':
     return node(scene)
 
 
+def connect_edge(scene: 'QGraphicsScene', start_socket, end_socket) -> 'NodeEdge':
+    """Connect two sockets, skipping an edge that would close a cycle.
+
+    A save file or an undone command can hold such an edge, which is reported
+    in the status bar like the ones refused while dragging.
+
+    Returns:
+        (NodeEdge) - The edge, `None` if it was skipped.
+    """
+    try:
+        return NodeEdge(scene, start_socket, end_socket)
+    except CycleError as err:
+        LOGGER.warning('Skipped edge: %s', err)
+        for view in scene.views():
+            top = view.topLevelWidget()
+            if hasattr(top, 'show_status_message'):
+                top.show_status_message(f'Skipped edge: {err}')
+        return None
+
+
 def connect_output_edges(scene: 'QGraphicsScene', connections: dict) -> None:
+    register = scene.register
     for node, edges in connections.items():
         for edge in edges.values():
 
-            new_node = NodesRegister.get_node_from_id(node).base
+            new_node = register.get_node_from_id(node).base
             start_socket = new_node.output_sockets[edge['start_socket']['index']]
 
             end_connection = edge['end_socket']
             end_node_id = end_connection['node']
-            end_node = NodesRegister.get_node_from_id(end_node_id)
+            end_node = register.get_node_from_id(end_node_id)
             end_socket = end_node.base.input_sockets[end_connection['index']]
 
-            NodeEdge(scene, start_socket, end_socket)
+            connect_edge(scene, start_socket, end_socket)
 
 
 def connect_input_edges(scene: 'QGraphicsScene', connections: dict) -> None:
+    register = scene.register
     for node, edges in connections.items():
         for edge in edges.values():
 
-            node = NodesRegister.get_node_from_id(node).base
-            end_socket = node.input_sockets[edge['end_socket']['index']]
+            end_node = register.get_node_from_id(node).base
+            end_socket = end_node.input_sockets[edge['end_socket']['index']]
 
             start_connection = edge['start_socket']
             start_node_id = start_connection['node']
-            start_node = NodesRegister.get_node_from_id(start_node_id)
+            start_node = register.get_node_from_id(start_node_id)
             start_socket = start_node.base.output_sockets[start_connection['index']]
 
-            NodeEdge(scene, start_socket, end_socket)
+            connect_edge(scene, start_socket, end_socket)
 
 
 def _create_edge_connection_data(edges: dict, index: int, edge: NodeEdge):
@@ -67,12 +95,8 @@ def extract_output_edges(node) -> dict:
         (dict): A dictionary with all of the output edges data.
     """
     edges = {}
-    index = 0
-    for socket in node.base.output_sockets:
-        if socket.has_edge():
-            for edge in socket.edges:
-                _create_edge_connection_data(edges, index, edge)
-                index += 1
+    for index, edge in enumerate(node.base.model.output_edges()):
+        _create_edge_connection_data(edges, index, edge.view)
     return edges
 
 
@@ -86,11 +110,19 @@ def extract_input_edges(node) -> dict:
         (dict): A dictionary with all of the input edges data.
     """
     edges = {}
-    index = 0
-    for socket in node.base.input_sockets:
-        if socket.has_edge():
-            edge = socket.get_edges()
-            _create_edge_connection_data(edges, index, edge)
-            index += 1
-
+    for index, edge in enumerate(node.base.model.input_edges()):
+        _create_edge_connection_data(edges, index, edge.view)
     return edges
+
+
+def extract_plan_links(register: NodesRegister) -> list:
+    """Describe every edge of a scene graph for the execution plan compiler.
+
+    Returns:
+        (list) - A list of `PlanLink` where the nodes are the `Node` objects
+        and the edge is the `NodeEdge` object.
+    """
+    return [PlanLink(edge.view, edge.start.view, edge.start_index,
+                     edge.end.view, edge.end_index,
+                     edge.start_port.socket_type == 'execute')
+            for edge in register.graph.edges()]
@@ -0,0 +1,231 @@
+"""Run graph files headlessly from the command line.
+
+Every file is executed from its `NodeExecute` flow inside a process pool, and
+a line is reported per file with its wall time and status, followed by a
+summary with the failures and the throughput. A graph still running past its
+timeout, or crashing its worker process, is reported without stopping the
+other files.
+
+    python -m src.run example/ 'graphs/**/*.json' --workers 4 --timeout 30 --jsonl
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from src.engine import ExecutionTimeout, GraphExecutor, RunControl, load_graph
+
+# the run of a graph stops itself at the first node past its timeout, the
+# parent only kills it when a single node keeps it running this much longer
+KILL_GRACE = 1.0
+
+
+def collect_files(paths) -> list:
+    """Expand the directories and glob patterns into graph files.
+
+    Args:
+        paths (list): Files, directories (their `*.json` files) or glob
+        patterns, which support `**`.
+
+    Returns:
+        (list) - The unique files, in the order they were found.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.json'))))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            files.append(path)
+
+    return list(dict.fromkeys(files))
+
+
+def run_graph_file(file: str, timeout: float = None) -> dict:
+    """Execute a graph file and report its outcome.
+
+    This is the unit of work of the pool, so it never raises.
+
+    Returns:
+        (dict) - The `file`, its `status` (`ok`, `timeout` or `failed`), the
+        `wall` time in seconds, the run `results` and the `error` message.
+    """
+    record = {'file': file, 'status': 'ok', 'wall': 0.0,
+              'results': None, 'error': None}
+
+    start = time.perf_counter()
+    try:
+        with GraphExecutor(load_graph(file)) as executor:
+            record['results'] = executor.run(RunControl(timeout))
+    except ExecutionTimeout as err:
+        record.update(status='timeout', error=str(err))
+    except Exception as err:
+        record.update(status='failed', error=f'{type(err).__name__}: {err}')
+
+    record['wall'] = time.perf_counter() - start
+    return record
+
+
+def _kill(pool: ProcessPoolExecutor) -> None:
+    """Terminate the workers of a pool, including the ones running a call."""
+    # the executor has no public way to stop the calls already running
+    processes = list((pool._processes or {}).values())
+    for process in processes:
+        process.terminate()
+    pool.shutdown(wait=False)
+    for process in processes:
+        process.join()
+
+
+def run_files(files, workers: int = None, timeout: float = None):
+    """Execute graph files in a process pool.
+
+    No more files than workers are submitted at once, so every file starts
+    when it is submitted and its deadline is known. When a file is still
+    running `KILL_GRACE` seconds past its timeout the pool is terminated, the
+    file is reported as a `timeout` and the other running files are submitted
+    again to a new pool.
+
+    A worker dying without a result breaks the pool, and the files running
+    in it are submitted again one at a time, so the file that crashed it is
+    the only one reported as `failed`.
+
+    Yields:
+        (dict) - The record of every file, see `run_graph_file`, in the
+        order they complete.
+    """
+    if workers == 1 and timeout is None:
+        for file in files:
+            yield run_graph_file(file, timeout)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pending = deque(files)
+    running = {}  # the futures mapped to their file and start time
+    isolated = set()  # the files that were running in a broken pool
+
+    pool = ProcessPoolExecutor(workers)
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                if running and (pending[0] in isolated or
+                                any(file in isolated for file, _ in running.values())):
+                    break
+                file = pending.popleft()
+                future = pool.submit(run_graph_file, file, timeout)
+                running[future] = (file, time.perf_counter())
+
+            remaining = None
+            if timeout is not None:
+                deadline = min(start for _, start in running.values()) + timeout + KILL_GRACE
+                remaining = max(deadline - time.perf_counter(), 0.0)
+
+            done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for future in done:
+                file, start = running.pop(future)
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    running[future] = (file, start)
+                except Exception as err:
+                    # e.g. results that cannot be sent back by the worker
+                    yield {'file': file, 'status': 'failed',
+                           'wall': time.perf_counter() - start, 'results': None,
+                           'error': f'{type(err).__name__}: {err}'}
+
+            if broken:
+                crashed = [file for file, _ in running.values()]
+                running.clear()
+                if len(crashed) == 1:
+                    yield {'file': crashed[0], 'status': 'failed', 'wall': 0.0,
+                           'results': None, 'error': 'Worker process died'}
+                else:
+                    isolated.update(crashed)
+                    pending.extendleft(reversed(crashed))
+
+                _kill(pool)
+                pool = ProcessPoolExecutor(workers)
+                continue
+
+            if done:
+                continue
+
+            _kill(pool)
+
+            now = time.perf_counter()
+            for future, (file, start) in list(running.items()):
+                if now - start >= timeout + KILL_GRACE:
+                    del running[future]
+                    yield {'file': file, 'status': 'timeout', 'wall': now - start,
+                           'results': None,
+                           'error': f'Graph execution killed after {timeout}s'}
+
+            # the other files were running in the terminated pool
+            pending.extendleft(reversed([file for file, _ in running.values()]))
+            running.clear()
+            pool = ProcessPoolExecutor(workers)
+    finally:
+        _kill(pool)
+
+
+def _format_record(record: dict) -> str:
+    line = f'{record["status"]:<8} {record["wall"] * 1000:10.1f} ms  {record["file"]}'
+    if record['error']:
+        line += f'\n         {record["error"]}'
+    return line
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m src.run',
+        description='Execute graph files headlessly in a process pool.')
+    parser.add_argument('paths', nargs='+',
+                        help='graph files, directories or glob patterns')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes, default to the CPU count')
+    parser.add_argument('-t', '--timeout', type=float, default=None,
+                        help='per graph timeout in seconds, a graph still running '
+                             f'{KILL_GRACE}s after it is killed')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='print a JSON object per line instead of a table')
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths)
+    if not files:
+        parser.error('no graph file found')
+
+    failures = 0
+    start = time.perf_counter()
+    for record in run_files(files, args.workers, args.timeout):
+        if record['status'] != 'ok':
+            failures += 1
+
+        if args.jsonl:
+            print(json.dumps(record, default=repr), flush=True)
+        else:
+            print(_format_record(record), flush=True)
+
+    wall = time.perf_counter() - start
+    summary = {'files': len(files), 'failures': failures, 'wall': wall,
+               'throughput': len(files) / wall if wall else 0.0}
+
+    if args.jsonl:
+        print(json.dumps({'summary': summary}), flush=True)
+    else:
+        print(f'{len(files)} files, {failures} failed in {wall:.2f}s '
+              f'({summary["throughput"]:.1f} files/s)')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Serve graph runs from a long-lived local process.
+
+Graph files are loaded once and kept in memory, see `GraphService`, so a run
+does not pay the interpreter start up nor the graph loading.
+
+    python -m src.serve --port 8765 --max-runs 4
+    python -m src.serve --socket /tmp/nodeeditor.sock
+
+Endpoints, all of them exchanging JSON:
+
+- `POST /run` with `{"file": ..., "overrides": {node_id: {key: value}},
+  "timeout": seconds, "compiled": false}` returns `{"results": ..., "wall": ...}`,
+  a compiled run takes no timeout.
+- `GET /status` returns the loaded graphs.
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+from src.engine import ExecutionTimeout
+from src.engine.engine_service import GraphService, InvalidRun, ServiceBusy
+
+LOGGER = logging.getLogger('nodeeditor.serve')
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """Handle the JSON requests of a `GraphService`."""
+
+    def _reply(self, code: int, body):
+        data = json.dumps(body, default=repr).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/status':
+            self._reply(200, {'graphs': self.server.service.status()})
+        else:
+            self._reply(404, {'error': f'Unknown path: {self.path}'})
+
+    def do_POST(self):
+        if self.path != '/run':
+            self._reply(404, {'error': f'Unknown path: {self.path}'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError('the body must be a JSON object')
+            file = request['file']
+        except (ValueError, KeyError) as err:
+            self._reply(400, {'error': f'Invalid request: {err}'})
+            return
+
+        try:
+            reply = self.server.service.run(
+                file, request.get('overrides'), request.get('timeout'),
+                bool(request.get('compiled')))
+        except FileNotFoundError as err:
+            self._reply(404, {'error': str(err)})
+        except InvalidRun as err:
+            self._reply(400, {'error': str(err)})
+        except ServiceBusy as err:
+            self._reply(503, {'error': str(err)})
+        except ExecutionTimeout as err:
+            self._reply(504, {'error': str(err)})
+        except Exception as err:
+            LOGGER.exception('Graph run failed: %s', file)
+            self._reply(500, {'error': f'{type(err).__name__}: {err}'})
+        else:
+            self._reply(200, reply)
+
+    def address_string(self):
+        # the clients of a unix socket have no address
+        return str(self.client_address[0]) if self.client_address else 'local'
+
+    def log_message(self, format, *args):
+        LOGGER.info('%s %s', self.address_string(), format % args)
+
+
+class ServiceHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: GraphService):
+        super().__init__(address, ServiceRequestHandler)
+        self.service = service
+
+
+class ServiceUnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: GraphService):
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, ServiceRequestHandler)
+        self.service = service
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m src.serve',
+        description='Serve graph runs, keeping the graphs loaded in memory.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--socket', help='listen on a unix socket instead')
+    parser.add_argument('--max-runs', type=int, default=4,
+                        help='number of graphs running at the same time')
+    parser.add_argument('--queue-timeout', type=float, default=30,
+                        help='seconds a run waits for a free slot')
+    args = parser.parse_args(argv)
+
+    service = GraphService(args.max_runs, args.queue_timeout)
+    if args.socket:
+        server = ServiceUnixServer(args.socket, service)
+        address = args.socket
+    else:
+        server = ServiceHTTPServer((args.host, args.port), service)
+        address = f'http://{args.host}:{server.server_address[1]}'
+
+    print(f'Serving graph runs on {address}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
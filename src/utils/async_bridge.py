@@ -0,0 +1,69 @@
+import asyncio
+import logging
+
+from PySide2.QtCore import QObject, QTimer
+
+LOGGER = logging.getLogger('nodeeditor.async_bridge')
+
+
+class AsyncBridge(QObject):
+    """Drive an asyncio event loop from the Qt event loop.
+
+    While there are pending tasks, a timer runs one iteration of the asyncio
+    loop at every tick, polling its I/O without blocking, so the editor stays
+    interactive during a run.
+    """
+
+    def __init__(self, interval=5, parent=None):
+        super().__init__(parent)
+
+        self.loop = asyncio.new_event_loop()
+        self._tasks = set()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._run_once)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    def run(self, coroutine, callback=None) -> asyncio.Task:
+        """Schedule a coroutine on the bridged loop.
+
+        Args:
+            coroutine (coroutine): The coroutine to run.
+            callback (callable): Optional function called with the finished
+            task, inside the Qt event loop.
+
+        Returns:
+            (Task) - The asyncio task of the coroutine.
+        """
+        task = self.loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        if callback:
+            task.add_done_callback(callback)
+
+        self._timer.start()
+        return task
+
+    def _run_once(self):
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        if not self._tasks:
+            self._timer.stop()
+
+    def cancel(self):
+        """Cancel the pending tasks, they finish at the next tick."""
+        for task in self._tasks:
+            task.cancel()
+
+    def close(self):
+        """Cancel the pending tasks and close the loop."""
+        self._timer.stop()
+        for task in self._tasks:
+            task.cancel()
+        self.loop.close()
@@ -0,0 +1,35 @@
+from PySide2.QtCore import Signal
+from PySide2.QtWidgets import QFormLayout, QLabel, QPushButton, QWidget
+
+
+class CacheStatsWidget(QWidget):
+    """Show the stats of the persistent output cache."""
+    clear_requested = Signal()
+
+    fields = (('hits', 'Hits'), ('misses', 'Misses'), ('evictions', 'Evictions'),
+              ('entries', 'Entries'), ('bytes', 'Size'), ('path', 'File'))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._labels = {}
+
+        _layout = QFormLayout()
+        for key, label in self.fields:
+            self._labels[key] = QLabel('-')
+            _layout.addRow(label, self._labels[key])
+
+        self._btn_clear = QPushButton('Clear Cache')
+        self._btn_clear.clicked.connect(self.clear_requested)
+        _layout.addRow(self._btn_clear)
+
+        self.setLayout(_layout)
+
+    def show_stats(self, stats: dict):
+        """Fill the labels with the dict returned by `DiskCache.stats`."""
+        for key, label in self._labels.items():
+            label.setText(str(stats.get(key, '-')))
+
+        self._labels['bytes'].setText(
+            f'{stats["bytes"] / 1024 ** 2:.2f} / '
+            f'{stats["max_bytes"] / 1024 ** 2:.0f} MB')
@@ -1,6 +1,10 @@
 import os
+import time
+import multiprocessing
 from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from PySide2.QtCore import Signal
 from PySide2.QtGui import (
     QKeySequence
 )
@@ -13,9 +17,32 @@ from PySide2.QtWidgets import (
     QMenuBar,
 )
 
-from src.nodes import NodesRegister
+from src.engine import (
+    DiskCache,
+    EngineGraph,
+    GraphExecutor,
+    Profiler,
+    RunControl,
+    record_trace,
+    save_trace
+)
+from src.engine.engine_async import run_plan_async
+from src.engine.engine_plan import compile_plan, run_plan
+from src.nodes import NodesRegister, extract_plan_links
+from src.utils.async_bridge import AsyncBridge
+from src.widgets.logic.run_worker import (
+    GraphRunWorker,
+    HeadlessGraphSync,
+    has_headless_nodes,
+    start_worker
+)
 from src.widgets.logic.undo_redo import AddNodeCommand, DeleteNodeCommand
-from src.utils.graph_state import connect_output_edges, load_file, save_file
+from src.utils.graph_state import (
+    connect_output_edges,
+    load_file,
+    save_file,
+    scene_state
+)
 
 
 class EditorActions(QWidget):
@@ -25,6 +52,7 @@ class EditorActions(QWidget):
         self.top_window = self.topLevelWidget()
         self.undo_stack = self.top_window.undo_stack
         self.scene = self.top_window._scene
+        self.register = self.scene.register
         self.view = self.scene.views()[0]
 
 
@@ -160,7 +188,7 @@ class EditorEditActions(EditorActions):
 
                 node_id = edge['end_socket']['node']
                 node_class, _ = node_id.split('.')
-                node = NodesRegister.get_last_node_id(node_class)
+                node = self.register.get_last_node_id(node_class)
 
                 edge['end_socket']['node'] = node
 
@@ -223,7 +251,7 @@ class EditorAddActions(EditorActions):
     def add_node(self, node):
         # TODO: [NOD-4] create the node at mouse point
 
-        if node.is_event_node and NodesRegister.event_nodes:
+        if node.is_event_node and self.register.event_nodes:
             self.top_window.show_status_message('Execute node already created')
             return
 
@@ -237,6 +265,12 @@ class EditorAddActions(EditorActions):
 
 
 class EditorRunActions(EditorActions):
+    # the `NodeStats` of a profiled run, slowest first
+    profile_updated = Signal(list)
+
+    # the `DiskCache.stats` after a run
+    cache_updated = Signal(dict)
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -244,43 +278,333 @@ class EditorRunActions(EditorActions):
         self.run_act.setShortcut(QKeySequence('ctrl+r'))
         self.run_act.triggered.connect(self.run_data)
 
+        self.run_async_act = QAction('Run Async', self)
+        self.run_async_act.setShortcut(QKeySequence('ctrl+shift+r'))
+        self.run_async_act.triggered.connect(self.run_data_async)
+
+        self.cancel_act = QAction('Cancel Run', self)
+        self.cancel_act.setShortcut(QKeySequence('ctrl+.'))
+        self.cancel_act.triggered.connect(self.cancel_run)
+
+        self.profile_act = QAction('Profile Nodes', self)
+        self.profile_act.setCheckable(True)
+        self.profile_act.toggled.connect(self._toggle_profiler)
+
+        # nodes are only instrumented during the runs while profiling
+        self.profiler = Profiler()
+
+        self.trace_act = QAction('Record Trace...', self)
+        self.trace_act.triggered.connect(self.record_trace)
+
+        self.cache_act = QAction('Use Result Cache', self)
+        self.cache_act.setCheckable(True)
+        self.cache_act.setChecked(False)
+
+        # outputs of the pure nodes kept across sessions, and the pools, are
+        # created on first use, see `shutdown`
+        self._disk_cache = None
+        self._thread_pool = None
+        self._process_pool = None
+
+        self.async_bridge = AsyncBridge(parent=self)
+
+        # background runs, see `run_data`
+        self.run_timeout = 60
+        self.headless_graph = HeadlessGraphSync(self.scene)
+        self._worker = None
+        self._run_control = None
+        self._run_start = None
+
+        self._plan = None
+        self._plan_revision = None
+
+    @property
+    def disk_cache(self) -> DiskCache:
+        if self._disk_cache is None:
+            self._disk_cache = DiskCache()
+        return self._disk_cache
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """The pool of the data branches of nodes declared as thread safe."""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=4)
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """The pool of the nodes declared as `run_in_process`.
+
+        Workers are spawned so they do not inherit the Qt application state.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context('spawn'))
+        return self._process_pool
+
+    def shutdown(self):
+        """Stop the pools and close the disk cache, if they were created."""
+        self.cancel_run()
+
+        if self._thread_pool:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+        if self._disk_cache:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def execution_plan(self):
+        """Get the execution plan, compiling it only if the graph changed."""
+        if self._plan_revision != self.register.revision:
+            event_nodes = [node.base for node in self.register.get_event_nodes()]
+            self._plan = compile_plan(extract_plan_links(self.register), event_nodes)
+            self._plan_revision = self.register.revision
+        return self._plan
+
+    def is_running(self) -> bool:
+        return self.async_bridge.is_running or self._worker is not None
+
     def run_data(self):
-        NodesRegister.reset_execution_flow()
-        self.top_window.show_status_message('Graph executed')
+        """Run the graph on a worker thread.
+
+        The worker executes a headless copy of the graph, and the widgets are
+        updated from its queued signals. If a node has no headless
+        counterpart the graph is run in the GUI thread instead.
+        """
+        if self.is_running():
+            self.top_window.show_status_message('Graph is already running')
+            return
+
+        if not has_headless_nodes(self.register):
+            self.run_data_sync()
+            return
+
+        self.register.reset_execution_flow()
+        self.top_window.show_status_message('Graph running...', 0)
+
+        self._run_control = RunControl(self.run_timeout)
+        executor = GraphExecutor(self.headless_graph.update(),
+                                 profiler=self._start_profile(),
+                                 disk_cache=self._run_disk_cache())
+
+        self._worker = GraphRunWorker(executor, self._run_control)
+        self._worker.exec_edge.connect(self._worker_exec_edge)
+        self._worker.progress.connect(self._worker_progress)
+        self._worker.finished.connect(self._worker_finished)
+        self._worker.failed.connect(self._worker_failed)
+
+        self._run_start = time.perf_counter()
+        start_worker(self._worker, self)
+
+    def cancel_run(self):
+        """Cancel the current run, it stops before the next node executes."""
+        if self._run_control:
+            self._run_control.cancel()
+
+        self.async_bridge.cancel()
+
+    def _worker_exec_edge(self, node_id, index):
+        node = self.register.get_node_from_id(node_id)
+        if not node:
+            return
+
+        socket = node.base.output_sockets[index]
+        if socket.has_edge():
+            self._update_exec_color(socket.edges[0])
+            socket.edges[0].edge_graphics.update()
+
+    def _worker_progress(self, node_id, executed):
+        self.top_window.show_status_message(
+            f'Graph running... {executed} nodes executed ({node_id})', 0)
 
-        for node in NodesRegister.get_event_nodes():
-            self._find_exec_flow(node.base)
-        NodesRegister.reset_nodes_execution()
+    def _worker_finished(self, updates):
+        self._worker = None
+        self._run_control = None
+        self._show_profile()
+        self._show_cache_stats()
 
-    def _exec_connected_sockets(self, node):
-        for edge in node.node_graphics.data('input_edges'):
-            socket = edge.start_socket
-            if socket.socket_type == 'execute':
+        for node_id, update in updates.items():
+            node = self.register.get_node_from_id(node_id)
+            if not node:
                 continue
 
-            edge.transfer_data()
+            # a node edited during the run keeps the user changes
+            content = node.content
+            if (update['state'] is not None and
+                    content.save_state() == update['sent_state']):
+                content.restore_state(update['state'])
+
+            if update['result'] is not None:
+                content.show_result(update['result'])
+
+        elapsed = (time.perf_counter() - self._run_start) * 1000
+        self.top_window.show_status_message(f'Graph executed in {elapsed:.1f} ms')
+
+    def _worker_failed(self, message):
+        self._worker = None
+        self._run_control = None
+        self._show_profile()
+        self._show_cache_stats()
+        self.top_window.show_status_message(message)
+
+    def run_data_sync(self):
+        """Run the graph inside the GUI thread."""
+        if self.is_running():
+            self.top_window.show_status_message('Graph is already running')
+            return
 
-            parent_node = socket.node.base
-            if parent_node.was_execute:
-                break
+        self.register.reset_execution_flow()
+        self.top_window.show_status_message('Graph executed')
 
-            return self._exec_connected_sockets(parent_node)
+        plan = self.execution_plan()
+        pool, process_pool = self._run_pools(plan)
+
+        self._set_editor_disk_cache(self._run_disk_cache())
+        profiler = self._start_profile(editor_nodes=True)
+        try:
+            run_plan(plan, on_exec_edge=self._update_exec_color,
+                     pool=pool, process_pool=process_pool)
+        finally:
+            if profiler:
+                profiler.detach()
+            self._set_editor_disk_cache(None)
+
+        self.register.reset_nodes_execution()
+        self._show_profile()
+        self._show_cache_stats()
+
+    def run_data_async(self):
+        """Run the graph on the asyncio loop bridged to the Qt event loop.
+
+        Nodes can implement `get_output` and `set_input` as coroutines, and
+        the editor stays interactive while they are awaited.
+        """
+        if self.is_running():
+            self.top_window.show_status_message('Graph is already running')
+            return
 
-        return None
+        self.register.reset_execution_flow()
+        self.top_window.show_status_message('Graph running...', 0)
+
+        self._set_editor_disk_cache(self._run_disk_cache())
+        self._start_profile(editor_nodes=True)
+        coroutine = run_plan_async(self.execution_plan(),
+                                   on_exec_edge=self._update_exec_color)
+        self.async_bridge.run(coroutine, self._async_run_finished)
+
+    def _async_run_finished(self, task):
+        self.register.reset_nodes_execution()
+        self._set_editor_disk_cache(None)
+        self._show_cache_stats()
+
+        if self.profile_act.isChecked():
+            self.profiler.detach()
+            self._show_profile()
+
+        if task.cancelled():
+            self.top_window.show_status_message('Graph execution cancelled')
+        elif task.exception():
+            self.top_window.show_status_message(
+                f'Graph execution failed: {task.exception()}')
+        else:
+            self.top_window.show_status_message('Graph executed')
 
-    def _find_exec_flow(self, node):
-        start_socket = node.get_execute_flow()
+    def record_trace(self):
+        """Run a headless copy of the graph and save its execution trace."""
+        if self.is_running():
+            self.top_window.show_status_message('Graph is already running')
+            return
 
-        if start_socket.has_edge():
-            socket_edge = start_socket.edges[0]
-            socket_edge.edge_graphics.update_flow_color('#78DD2A')
+        if not has_headless_nodes(self.register):
+            self.top_window.show_status_message(
+                'Graph has nodes that cannot run headless')
+            return
 
-            next_node = socket_edge.end_socket.node.base
+        file, _ = QFileDialog.getSaveFileName(caption='Save Trace as...',
+                                              dir='scripts',
+                                              filter='*.json.gz *.json')
+        if not file:
+            return
+
+        # a fresh copy, so every edge transfers its data
+        trace = record_trace(EngineGraph.from_state(scene_state(self.scene)))
+        save_trace(trace, file)
+
+        self.top_window.show_status_message(
+            f'Trace saved: {len(trace["exec"])} nodes executed '
+            f'in {trace["wall"] * 1000:.1f} ms')
+
+    def _run_pools(self, plan) -> tuple:
+        """Get the thread and process pools of a run, `None` for a pool no
+        node of the plan uses, so it is not created."""
+        nodes = plan.data_nodes()
+        pool = self.thread_pool if any(
+            node.thread_safe for node in nodes) else None
+        process_pool = self.process_pool if any(
+            node.run_in_process for node in nodes) else None
+        return pool, process_pool
+
+    def _run_disk_cache(self):
+        return self.disk_cache if self.cache_act.isChecked() else None
+
+    def _set_editor_disk_cache(self, disk_cache):
+        # only set during the runs, so reading the node outputs outside of
+        # a run does not query the cache
+        for node in self.register.all_nodes:
+            if node.content.pure:
+                node.content.disk_cache = disk_cache
+
+    def _show_cache_stats(self):
+        if self._disk_cache:
+            self.cache_updated.emit(self._disk_cache.stats())
+
+    def clear_disk_cache(self):
+        self.disk_cache.clear()
+        self._show_cache_stats()
+
+    def _start_profile(self, editor_nodes=False):
+        """Reset the profiler if profiling is enabled.
+
+        Args:
+            editor_nodes (bool): Attach the profiler to the editor nodes, for
+            the runs in the GUI thread.
+
+        Returns:
+            (Profiler) - `None` if profiling is disabled.
+        """
+        if not self.profile_act.isChecked():
+            return None
+
+        self.profiler.reset()
+        if editor_nodes:
+            self.profiler.attach([node.base for node in self.register.all_nodes])
+        return self.profiler
+
+    def _show_profile(self):
+        if not self.profile_act.isChecked():
+            return
+
+        heat = self.profiler.heat()
+        for node in self.register.all_nodes:
+            node.set_heat(heat.get(node.node_id))
+
+        self.profile_updated.emit(self.profiler.report())
+
+    def _toggle_profiler(self, enabled):
+        if enabled:
+            return
 
-            self._exec_connected_sockets(next_node)
-            return self._find_exec_flow(next_node)
+        for node in self.register.all_nodes:
+            node.set_heat(None)
 
-        return None
+    @staticmethod
+    def _update_exec_color(edge):
+        edge.edge_graphics.update_flow_color('#78DD2A')
 
 
 class NodeMenubar(QMenuBar):
@@ -327,3 +651,9 @@ class NodeMenubar(QMenuBar):
 
     def add_run_menu(self):
         self.run_menu.addAction(self._run_actions.run_act)
+        self.run_menu.addAction(self._run_actions.run_async_act)
+        self.run_menu.addAction(self._run_actions.cancel_act)
+        self.run_menu.addSeparator()
+        self.run_menu.addAction(self._run_actions.profile_act)
+        self.run_menu.addAction(self._run_actions.trace_act)
+        self.run_menu.addAction(self._run_actions.cache_act)
@@ -0,0 +1,37 @@
+from PySide2.QtCore import Qt
+from PySide2.QtWidgets import QAbstractItemView, QHeaderView, QTableWidget, QTableWidgetItem
+
+
+class ProfilerTable(QTableWidget):
+    """Sortable table of the per node stats of the last profiled run."""
+
+    columns = ('Node', 'Wall (ms)', 'CPU (ms)', 'Calls', 'Bytes')
+
+    def __init__(self, parent=None):
+        super().__init__(0, len(self.columns), parent)
+
+        self.setHorizontalHeaderLabels(self.columns)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.verticalHeader().setVisible(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSortingEnabled(True)
+
+    @staticmethod
+    def _item(value) -> QTableWidgetItem:
+        # items store the numbers, not their text, so they sort numerically
+        item = QTableWidgetItem()
+        item.setData(Qt.DisplayRole, value)
+        return item
+
+    def show_stats(self, report: list):
+        """Fill the table with the `NodeStats` of `Profiler.report`."""
+        self.setSortingEnabled(False)
+        self.setRowCount(len(report))
+
+        for row, stats in enumerate(report):
+            values = (stats.node_id, round(stats.wall * 1000, 3),
+                      round(stats.cpu * 1000, 3), stats.calls, stats.bytes)
+            for column, value in enumerate(values):
+                self.setItem(row, column, self._item(value))
+
+        self.setSortingEnabled(True)
@@ -7,15 +7,19 @@ from PySide2.QtWidgets import (
     QGraphicsItem
 )
 
+from src.nodes.nodes_register import NodesRegister
 
 LOGGER = logging.getLogger('nodeeditor.scene')
 
 
 class GraphicScene(QGraphicsScene):
-    def __init__(self, parent=None):
+    def __init__(self, register: NodesRegister, parent=None):
         super().__init__(parent)
         LOGGER.info('Init Graphical Scene')
 
+        # the nodes of the scene, shared with the owning `Scene`
+        self.register = register
+
         self._grid_pattern = QBrush(QColor("#282828"), Qt.Dense7Pattern)
 
         self.setBackgroundBrush(QColor("#393939"))
@@ -50,7 +54,9 @@ class Scene:
         self.scene_width = 64000
         self.scene_height = 64000
 
-        self.graphics_scene = GraphicScene()
+        self.register = NodesRegister()
+
+        self.graphics_scene = GraphicScene(self.register)
         self.graphics_scene.setSceneRect(-self.scene_width // 2,
                                          -self.scene_height // 2,
                                          self.scene_width, self.scene_height)
@@ -32,6 +32,9 @@ class GraphicsView(QGraphicsView):
 
         self.top = self.topLevelWidget()
 
+        # the left click interactions of this view
+        self.click_state = LeftClickConstants()
+
         self._set_flags()
 
         self.zoom_level = 10
@@ -152,7 +155,7 @@ class GraphicsView(QGraphicsView):
         nodes = self.selected_nodes()
         if len(nodes) <= 1:
             # Review: don't link this
-            LeftClickConstants._box_selection_mode = False
+            self.click_state._box_selection_mode = False
 
     def selected_nodes(self):
         """Return the selected nodes inside the scene."""
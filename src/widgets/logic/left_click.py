@@ -1,6 +1,5 @@
 import logging
 import contextlib
-from src.nodes import nodes_register
 
 from src.widgets.logic.undo_redo import (
     BoxSelectCommand,
@@ -19,32 +18,35 @@ LOGGER.setLevel(logging.DEBUG)
 
 
 class LeftClickConstants:
-    mode_selection_box = None
-    mode_drag_node = None
-    mode_drag_edge = None
-    mode_drag_tmp_edge = None
+    """The state of the left click interactions of a view.
 
-    nodes_initial_position = None
-    mouse_initial_position = None
+    Every `GraphicsView` owns its state, so the editors of several scenes do
+    not share a drag or a selection.
+    """
 
-    selection_node_previous = None
-    selection_group_previous = None
+    def __init__(self):
+        self.reset_attrs()
 
-    selection_previous_node = None
-    selection_previous_box = None
+    def reset_attrs(self):
+        self.mode_selection_box = None
+        self.mode_drag_node = None
+        self.mode_drag_edge = None
+        self.mode_drag_tmp_edge = None
 
-    edge_tmp = None
+        self.nodes_initial_position = None
+        self.mouse_initial_position = None
 
-    socket_clicked = None
-    socket_start = None
-    socket_end = None
+        self.selection_node_previous = None
+        self.selection_group_previous = None
 
-    @classmethod
-    def reset_attrs(cls):
-        for attr in cls.__dict__:
-            if not attr.startswith('__') and not callable(getattr(cls, attr)):
-                with contextlib.suppress(AttributeError):
-                    setattr(cls, attr, None)
+        self.selection_previous_node = None
+        self.selection_previous_box = None
+
+        self.edge_tmp = None
+
+        self.socket_clicked = None
+        self.socket_start = None
+        self.socket_end = None
 
 
 class LeftClick:
@@ -52,6 +54,7 @@ class LeftClick:
     def __init__(self, view, item):
         self.item = item
         self.view = view
+        self.state = view.click_state
 
     def _selected_nodes_position(self):
         """Get a the selected nodes position.
@@ -64,8 +67,8 @@ class LeftClick:
     def _click_is_node(self):
         return (
             isinstance(self.item, NodeGraphics) and
-            not LeftClickConstants.mode_drag_node and
-            not LeftClickConstants.mode_selection_box
+            not self.state.mode_drag_node and
+            not self.state.mode_selection_box
         )
 
     def _create_selection_command(self, previous, current, description):
@@ -82,7 +85,7 @@ class LeftClick:
         command = SelectCommand(
             self.view._scene, previous, current, description)
         self.view.top.undo_stack.push(command)
-        LeftClickConstants.selection_previous_node = current
+        self.state.selection_previous_node = current
 
 
 class LeftClickPress(LeftClick):
@@ -92,41 +95,40 @@ class LeftClickPress(LeftClick):
         self.view = view
         self.event = event
 
-        LeftClickConstants.mouse_initial_position = event.pos()
+        self.state.mouse_initial_position = event.pos()
 
         self.item = item
         if self._click_is_node():
-            self._create_selection_command(LeftClickConstants.selection_previous_node,
+            self._create_selection_command(self.state.selection_previous_node,
                                            self.item, 'Select')
 
-    @staticmethod
-    def _re_connect_edge(socket):
+    def _re_connect_edge(self, socket):
         LOGGER.debug('SocketInput has an edge connected already')
-        LeftClickConstants.mode_drag_tmp_edge = True
+        self.state.mode_drag_tmp_edge = True
 
-        LeftClickConstants.socket_start = socket.edge.start_socket
-        LeftClickConstants.socket_end = socket.edge.end_socket
+        self.state.socket_start = socket.edge.start_socket
+        self.state.socket_end = socket.edge.end_socket
 
         # trigger transfer data between nodes
-        end_node = LeftClickConstants.socket_end.node.base
-        end_socket_widget = LeftClickConstants.socket_end.widget
+        end_node = self.state.socket_end.node.base
+        end_socket_widget = self.state.socket_end.widget
         end_node.content.restore_widget(end_socket_widget)
-        end_node.content.clear_output(LeftClickConstants.socket_end.index)
+        end_node.content.clear_output(self.state.socket_end.index)
 
         # Invert the sockets if click starts at a output socket
-        LeftClickConstants.socket_clicked = (
-            LeftClickConstants.socket_end if isinstance(LeftClickConstants.socket_start, SocketInput)
-            else LeftClickConstants.socket_start
+        self.state.socket_clicked = (
+            self.state.socket_end if isinstance(self.state.socket_start, SocketInput)
+            else self.state.socket_start
         )
 
         socket.remove_edge()
 
     def on_socket(self, socket):
-        LeftClickConstants.socket_clicked = socket
-        LeftClickConstants.mode_drag_edge = True
+        self.state.socket_clicked = socket
+        self.state.mode_drag_edge = True
 
         socket_type = socket.data('type')
-        nodes_register.NodesRegister.reset_execution_flow()
+        self.view.scene().register.reset_execution_flow()
 
         if isinstance(socket, SocketInput) and socket.has_edge():
             self._re_connect_edge(socket)
@@ -134,26 +136,26 @@ class LeftClickPress(LeftClick):
         elif socket_type == 'execute' and socket.has_edge():
             socket.remove_edge(socket.edges[0])
 
-        LeftClickConstants.edge_tmp = NodeEdgeTmp(self.view.scene(), self.view,
-                                                  LeftClickConstants.socket_clicked)
+        self.state.edge_tmp = NodeEdgeTmp(self.view.scene(), self.view,
+                                          self.state.socket_clicked)
 
     def _update_node_zValue(self):
         self.item.setZValue(1)
-        if hasattr(LeftClickConstants.selection_node_previous, 'setZValue'):
-            LeftClickConstants.selection_node_previous.setZValue(0)
-        LeftClickConstants.selection_node_previous = self.item
+        if hasattr(self.state.selection_node_previous, 'setZValue'):
+            self.state.selection_node_previous.setZValue(0)
+        self.state.selection_node_previous = self.item
 
     def on_node(self):
         LOGGER.debug('Edge drag-mode Enabled')
 
-        LeftClickConstants.mode_drag_node = True
-        LeftClickConstants.nodes_initial_position = self._selected_nodes_position()
+        self.state.mode_drag_node = True
+        self.state.nodes_initial_position = self._selected_nodes_position()
 
         self._update_node_zValue()
 
     def update_view(self):
         with contextlib.suppress(AttributeError):
-            LeftClickConstants.edge_tmp.edge_graphics.update()
+            self.state.edge_tmp.edge_graphics.update()
 
 
 class LeftClickRelease(LeftClick):
@@ -166,34 +168,34 @@ class LeftClickRelease(LeftClick):
         self.mode_selection_box = False
 
     def _click_moved(self):
-        return LeftClickConstants.mouse_initial_position != self.event.pos()
+        return self.state.mouse_initial_position != self.event.pos()
 
     def _click_is_void(self):
         return not self.item and not self._is_box_selection()
 
     def _end_node_move(self):
-        if LeftClickConstants.mode_drag_node:
+        if self.state.mode_drag_node:
             command = MoveNodeCommand(self._selected_nodes_position(),
-                                      LeftClickConstants.nodes_initial_position,
+                                      self.state.nodes_initial_position,
                                       'Move Node')
             self.view.top.undo_stack.push(command)
-            LeftClickConstants.mode_drag_node = False
+            self.state.mode_drag_node = False
 
     def _is_box_selection(self):
         """Return `True` if action is a box selection."""
         return (
-            LeftClickConstants.mouse_initial_position != self.event.pos() and
-            not LeftClickConstants.mode_drag_node and
-            not LeftClickConstants.mode_drag_edge
+            self.state.mouse_initial_position != self.event.pos() and
+            not self.state.mode_drag_node and
+            not self.state.mode_drag_edge
         )
 
     def _create_box_select_command(self):
         scene = self.view.scene()
-        command = BoxSelectCommand(scene, LeftClickConstants.selection_previous_box,
+        command = BoxSelectCommand(scene, self.state.selection_previous_box,
                                    scene.selectionArea(), 'Box Select')
         self.view.top.undo_stack.push(command)
-        LeftClickConstants.selection_previous_box = scene.selectionArea()
-        LeftClickConstants.mode_selection_box = True
+        self.state.selection_previous_box = scene.selectionArea()
+        self.state.mode_selection_box = True
 
     def _end_box_selection(self):
         if self._is_box_selection():
@@ -201,23 +203,38 @@ class LeftClickRelease(LeftClick):
 
     def _delete_tmp_edge(self, msg=None):
         LOGGER.debug('Delete temporary edge. %s', (msg or ''))
-        LeftClickConstants.edge_tmp.delete_edge()
-        LeftClickConstants.edge_tmp = None
+        self.state.edge_tmp.delete_edge()
+        self.state.edge_tmp = None
 
     def _socket_is_invalid(self):
-        return self.item == LeftClickConstants.socket_clicked
+        return self.item == self.state.socket_clicked
 
-    @staticmethod
-    def _is_same_socket_type(end_socket):
+    def _is_same_socket_type(self, end_socket):
         """Check if input and output socket are the same type."""
-        return (isinstance(LeftClickConstants.socket_clicked, SocketOutput) and
+        return (isinstance(self.state.socket_clicked, SocketOutput) and
                 isinstance(end_socket, SocketOutput) or
-                isinstance(LeftClickConstants.socket_clicked, SocketInput) and
+                isinstance(self.state.socket_clicked, SocketInput) and
                 isinstance(end_socket, SocketInput))
 
+    def _creates_cycle(self, end_socket):
+        """Check if connecting the clicked socket to `end_socket` would close
+        a cycle in the graph."""
+        start, end = self.state.socket_clicked, end_socket
+        if isinstance(end, SocketOutput):
+            start, end = end, start
+
+        topology = self.view.scene().register.graph.topology
+        return topology.creates_cycle(start.port.node, end.port.node)
+
     def click_is_on_socket(self, end_socket):
         self._delete_tmp_edge()
 
+        if self._creates_cycle(end_socket):
+            LOGGER.debug('Edge would create a cycle. Delete edge.')
+            self.view.top.show_status_message('Edge would create a cycle')
+            self._readjust_edge()
+            return
+
         socket_type = end_socket.data('type')
 
         if isinstance(end_socket, SocketInput) and end_socket.has_edge():
@@ -228,36 +245,36 @@ class LeftClickRelease(LeftClick):
                 end_socket.remove_edge(end_socket.edges[0])
 
             # invert the sockets if starting point is input to output
-            end_socket, LeftClickConstants.socket_clicked = LeftClickConstants.socket_clicked, end_socket
+            end_socket, self.state.socket_clicked = self.state.socket_clicked, end_socket
 
         command = ConnectEdgeCommand(self.view._scene,
-                                     LeftClickConstants.socket_clicked,
+                                     self.state.socket_clicked,
                                      end_socket, 'Connect Edge')
         self.view.top.undo_stack.push(command)
 
     def _readjust_edge(self):
-        if LeftClickConstants.mode_drag_tmp_edge:
+        if self.state.mode_drag_tmp_edge:
             command = DisconnectEdgeCommand(self.view.scene(),
-                                            LeftClickConstants.socket_start,
-                                            LeftClickConstants.socket_end,
+                                            self.state.socket_start,
+                                            self.state.socket_end,
                                             'Disconnect Edge')
             self.view.top.undo_stack.push(command)
-            LeftClickConstants.mode_drag_tmp_edge = False
+            self.state.mode_drag_tmp_edge = False
 
     def release(self):
         if not self._click_moved():
-            LeftClickConstants.mode_drag_node = False
+            self.state.mode_drag_node = False
 
         self._end_box_selection()
 
         if self._click_is_void():
-            self._create_selection_command(LeftClickConstants.selection_previous_node,
+            self._create_selection_command(self.state.selection_previous_node,
                                            None, 'Select')
             return
 
         self._end_node_move()
 
-        if LeftClickConstants.mode_drag_edge:
+        if self.state.mode_drag_edge:
 
             if self._socket_is_invalid():
                 self._delete_tmp_edge('End socket is invalid. Delete edge.')
@@ -266,8 +283,8 @@ class LeftClickRelease(LeftClick):
             if isinstance(self.item, SocketGraphics):
                 self.click_is_on_socket(self.item)
 
-            elif LeftClickConstants.edge_tmp:
+            elif self.state.edge_tmp:
                 self._readjust_edge()
                 self._delete_tmp_edge('Edge release was not on a socket')
 
-            LeftClickConstants.mode_drag_edge = False
+            self.state.mode_drag_edge = False
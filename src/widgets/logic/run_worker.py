@@ -0,0 +1,122 @@
+import logging
+
+from PySide2.QtCore import QObject, QThread, Signal
+
+from src.engine import (
+    EngineGraph,
+    EngineRegister,
+    ExecutionCancelled,
+    GraphExecutor
+)
+from src.nodes import NodesRegister
+from src.utils.graph_state import scene_state
+
+LOGGER = logging.getLogger('nodeeditor.run_worker')
+
+
+class GraphRunWorker(QObject):
+    """Execute a headless copy of the graph inside a worker thread.
+
+    The worker never touches the editor widgets: every update is emitted as
+    a signal, which Qt queues to the receivers living in the GUI thread.
+
+    The node states are saved when the worker is created, before the run
+    starts, so `finished` only reports the states the run itself changed.
+    """
+    exec_edge = Signal(str, int)
+    progress = Signal(str, int)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, executor: GraphExecutor, control):
+        super().__init__()
+        self.executor = executor
+        self.control = control
+        self._executed = 0
+
+        self._sent_states = {node_id: node.save_state()
+                             for node_id, node in executor.graph.nodes.items()}
+
+    def _on_exec_edge(self, edge):
+        self.exec_edge.emit(edge.start_node.node_id, edge.start_index)
+
+    def _on_node(self, node):
+        self._executed += 1
+        self.progress.emit(node.node_id, self._executed)
+
+    def run(self):
+        try:
+            results = self.executor.run(self.control,
+                                        on_exec_edge=self._on_exec_edge,
+                                        on_node=self._on_node)
+        except ExecutionCancelled as err:
+            self.failed.emit(str(err))
+        except Exception as err:
+            LOGGER.exception('Graph execution failed')
+            self.failed.emit(f'Graph execution failed: {err}')
+        else:
+            self.finished.emit({
+                node_id: {'result': results.get(node_id),
+                          'sent_state': self._sent_states.get(node_id),
+                          'state': self._changed_state(node_id, node)}
+                for node_id, node in self.executor.graph.nodes.items()
+            })
+
+    def _changed_state(self, node_id, node):
+        """Get the state of a node if the run changed it, `None` otherwise."""
+        state = node.save_state()
+        return None if state == self._sent_states.get(node_id) else state
+
+
+def has_headless_nodes(register: NodesRegister) -> bool:
+    """Check if every node of the graph has a headless counterpart."""
+    # the classes of `register.nodes` stay listed once their nodes are deleted
+    return all(node.node_class in EngineRegister.nodes_classes
+               for node in register.node_ids.values())
+
+
+class HeadlessGraphSync:
+    """Keep a headless copy of the editor graph for the background runs.
+
+    The copy is rebuilt only when the graph topology changed, otherwise only
+    the nodes whose content changed are updated, so the headless plan and
+    dirty flags are preserved between runs.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.graph = None
+        self._revision = None
+
+    def update(self) -> EngineGraph:
+        register = self.scene.register
+        if self._revision != register.revision:
+            self.graph = EngineGraph.from_state(scene_state(self.scene))
+            self._revision = register.revision
+            return self.graph
+
+        for node in register.all_nodes:
+            state = node.content.save_state()
+            if self.graph.nodes[node.node_id].save_state() != state:
+                self.graph.set_state(node.node_id, state)
+
+        return self.graph
+
+
+def start_worker(worker: GraphRunWorker, parent: QObject) -> QThread:
+    """Move the worker to a new thread and start it.
+
+    The thread is owned by `parent` so it outlives the Python references, it
+    quits and both objects are deleted once the worker is done.
+    """
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.failed.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread
@@ -4,14 +4,19 @@ from PySide2.QtGui import QPainterPath
 from PySide2.QtWidgets import QUndoCommand, QGraphicsScene
 
 
-from src.widgets.node_edge import NodeEdge, NodeEdgeGraphics
+from src.widgets.node_edge import NodeEdgeGraphics
 from src.nodes import (
-    NodesRegister, create_node, connect_output_edges, connect_input_edges
+    create_node, connect_edge, connect_output_edges, connect_input_edges
 )
 
 
 def graph_node(node):
-    return NodesRegister.get_node_from_graph(node)
+    return node.base.register.get_node_from_graph(node)
+
+
+def _edge_key(edge: dict) -> tuple:
+    start, end = edge['start_socket'], edge['end_socket']
+    return start['node'], start['index'], end['node'], end['index']
 
 
 class MoveNodeCommand(QUndoCommand):
@@ -79,11 +84,14 @@ class ConnectEdgeCommand(QUndoCommand):
         self.start_socket = start_socket
         self.end_socket = end_socket
 
+        self._edge = None
+
     def undo(self):
-        self.end_socket.remove_edge()
+        if self._edge:
+            self.end_socket.remove_edge()
 
     def redo(self):
-        NodeEdge(self.scene, self.start_socket, self.end_socket)
+        self._edge = connect_edge(self.scene, self.start_socket, self.end_socket)
 
 
 class DisconnectEdgeCommand(QUndoCommand):
@@ -97,7 +105,7 @@ class DisconnectEdgeCommand(QUndoCommand):
         self.edge = None
 
     def undo(self):
-        NodeEdge(self.scene, self.start_socket, self.end_socket)
+        connect_edge(self.scene, self.start_socket, self.end_socket)
 
     def redo(self):
         pass
@@ -144,29 +152,48 @@ class DeleteNodeCommand(QUndoCommand):
             self.input_edges[node_id] = node_data.get('input_edges', {})
             self.output_edges[node_id] = node_data.get('output_edges', {})
 
+    def _unrestored_output_edges(self) -> dict:
+        """Get the output edges not restored with the input edges.
+
+        An edge between two deleted nodes is both in the output edges of its
+        start node and in the input edges of its end node.
+        """
+        restored = {_edge_key(edge)
+                    for edges in self.input_edges.values()
+                    for edge in edges.values()}
+
+        return {node_id: {key: edge for key, edge in edges.items()
+                          if _edge_key(edge) not in restored}
+                for node_id, edges in self.output_edges.items()}
+
     def undo(self):
         def connected_edges(node_list):
             return bool([_ for _ in node_list.values() if _])
 
         self._create_nodes()
 
+        output_edges = self._unrestored_output_edges()
+
         if connected_edges(self.input_edges):
             connect_input_edges(self.scene, self.input_edges)
 
-        if connected_edges(self.output_edges):
-            connect_output_edges(self.scene, self.output_edges)
+        if connected_edges(output_edges):
+            connect_output_edges(self.scene, output_edges)
 
     def redo(self):
-        """Append the node data into a class attribute and delete them."""
-        for node in self.selected_nodes:
-
-            node = graph_node(node)
+        """Append the node data into a class attribute and delete them.
 
-            if node.base.is_event_node:
-                continue
+        Every node is saved before any is deleted, so its data does not depend
+        on the order of the selection.
+        """
+        nodes = [graph_node(node) for node in self.selected_nodes]
+        nodes = [node for node in nodes if not node.base.is_event_node]
 
-            self.nodes_data[node.node_id] = node.data()
+        for node in nodes:
+            self.nodes_data[node.node_id] = node.data().snapshot(
+                'position', 'input_edges', 'output_edges')
 
+        for node in nodes:
             node.delete_node()
 
 
@@ -176,14 +203,16 @@ class DeleteEdgeCommand(QUndoCommand):
         self.edge = edge.base
         self.scene = scene
         self._edge = None
+        self._undone = False
 
     def undo(self):
         start_socket = self.edge.start_socket
         end_socket = self.edge.end_socket
-        self._edge = NodeEdge(self.scene, start_socket, end_socket)
+        self._edge = connect_edge(self.scene, start_socket, end_socket)
+        self._undone = True
 
     def redo(self):
-        if not self._edge:
+        if not self._undone:
             self.edge.delete_edge()
-        else:
+        elif self._edge:
             self._edge.end_socket.remove_edge()
@@ -2,6 +2,7 @@ import abc
 import json
 import math
 import logging
+from collections.abc import Iterator
 
 from PySide2.QtCore import QPointF,  Qt
 from PySide2.QtGui import QPen, QPainterPath, QColor, QPainterPathStroker, QPolygonF
@@ -156,9 +157,14 @@ class NodeEdge(_EdgeInterface):
         self.scene = scene
 
         self.edge_graphics = NodeEdgeGraphics(self)
-        self.scene.addItem(self.edge_graphics)
 
+        # the start output version and end state version of the last transfer
+        self._synced_versions = None
+
+        # connect the model first, an edge closing a cycle raises before
+        # being added to the scene
         self._add_reference()
+        self.scene.addItem(self.edge_graphics)
         # self.transfer_data()
         self._convert_widget_to_label()
 
@@ -166,19 +172,48 @@ class NodeEdge(_EdgeInterface):
         end_node = self.end_socket.node.base
         end_node.content.convert_to_label(self.end_socket.index)
 
-    def transfer_data(self):
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the edge needs to transfer its data again.
+
+        An edge is dirty when the start node outputs or the end node content
+        changed since the last transfer.
+        """
+        return self._synced_versions != (
+            self.start_socket.node.base.output_version,
+            self.end_socket.node.base.state_version)
+
+    def pull_data(self):
+        """Pull the start node output and mark the edge as synced.
+
+        An iterator, e.g. a generator streamed to a loop, is consumed by the
+        run, so the edge stays dirty to pull a new one on the next run.
+        """
         self.edge_graphics.update_flow_color('#4692DD')
 
-        self.socket_output = self.start_socket.node.base.get_output(
-            self.start_socket.index)
+        start_node = self.start_socket.node.base
+        self.socket_output = start_node.get_output(self.start_socket.index)
 
-        # XXX: need to find a cleaner way for the for loop
-        if isinstance(self.socket_output, (list)):
-            for n in self.socket_output:
-                self.end_socket.node.base.set_input(n, self.end_socket.index)
-        else:
-            self.end_socket.node.base.set_input(
-                self.socket_output, self.end_socket.index)
+        if not isinstance(self.socket_output, Iterator):
+            self._synced_versions = (start_node.output_version,
+                                     self.end_socket.node.base.state_version)
+        return self.socket_output
+
+    def push_data(self, value) -> list:
+        """Set a pulled value into the end node input.
+
+        Returns:
+            (list) - A list holding the node `set_input` result, which is an
+            awaitable for asynchronous nodes.
+        """
+        end_node = self.end_socket.node.base
+        results = [end_node.set_input(value, self.end_socket.index)]
+
+        end_node.outputs_changed()
+        return results
+
+    def transfer_data(self):
+        self.push_data(self.pull_data())
 
     @property
     def start_socket(self) -> SocketOutput:
@@ -198,19 +233,24 @@ class NodeEdge(_EdgeInterface):
         Remove the edge graphics from the scene and delete its reference from
         its connected sockets.
         """
-        # start socket is always a SocketOutput, which has a list of edges
-        # thus a reference to the deleted edge is needed
-        self.start_socket.clear_reference(self)
+        self.scene.register.graph.disconnect(self.model)
 
-        # end socket is always a SocketInput, which has only one edge
-        self.end_socket.clear_reference()
+        end_node = self.end_socket.node.base
+        end_node.content.input_values.pop(self.end_socket.index, None)
+        end_node.mark_dirty()
+        self.scene.register.graph_changed()
 
         self.scene.removeItem(self.edge_graphics)
 
     def _add_reference(self):
-        """Add the edge reference to socket list."""
-        self.start_socket.add_edge(self)
-        self.end_socket.add_edge(self)
+        """Connect the sockets in the graph model, with the edge as view."""
+        end_node = self.end_socket.node.base
+        self.model = self.scene.register.graph.connect(
+            self.start_socket.node.base.model, self.start_socket.index,
+            end_node.model, self.end_socket.index, self)
+
+        end_node.mark_dirty()
+        self.scene.register.graph_changed()
 
     def __str__(self) -> str:
         return class_id('NodeEdge', self)
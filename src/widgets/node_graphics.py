@@ -2,6 +2,8 @@ import abc
 import pprint
 import logging
 
+from collections.abc import Mapping
+
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QFont, QPen, QColor, QPainterPath, QBrush
 from PySide2.QtWidgets import (
@@ -11,7 +13,7 @@ from PySide2.QtWidgets import (
     QWidget
 )
 
-from src.nodes import NodesRegister, extract_output_edges, extract_input_edges
+from src.nodes import extract_output_edges, extract_input_edges
 from src.utils import class_id
 from src.widgets.node_socket import create_socket
 
@@ -27,6 +29,58 @@ class NodeGraphicsContent(QGraphicsProxyWidget):
         return class_id('NodeGraphicsContent', self)
 
 
+def _node_position(node) -> dict:
+    position = node.pos()
+    return {'x': position.x(), 'y': position.y()}
+
+
+# the fields of `NodeData` and how to get them from a `NodeGraphics`
+_NODE_DATA_FIELDS = {
+    'class': lambda node: node.node_class,
+    'object': str,
+    'id': lambda node: node.node_id,
+    'zValue': lambda node: node.zValue(),
+    'position': _node_position,
+    'output_edges': extract_output_edges,
+    'input_edges': extract_input_edges,
+    'connected_sockets': lambda node: {
+        'input_sockets': {},
+        'output_sockets': {}
+    },
+}
+
+
+class NodeData(Mapping):
+    """A read-only view over the data of a node.
+
+    Each field is computed when it is read, so getting the position does not
+    extract the edges. The node outputs are not part of it, since getting
+    them runs the node logic.
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node: 'NodeGraphics'):
+        self._node = node
+
+    def __getitem__(self, key):
+        return _NODE_DATA_FIELDS[key](self._node)
+
+    def __iter__(self):
+        return iter(_NODE_DATA_FIELDS)
+
+    def __len__(self):
+        return len(_NODE_DATA_FIELDS)
+
+    def snapshot(self, *keys) -> dict:
+        """Get the current value of some fields, all of them by default.
+
+        The view always reads the node as it is, a snapshot is needed to keep
+        the data of a node that is going to change or to be deleted.
+        """
+        return {key: self[key] for key in keys or _NODE_DATA_FIELDS}
+
+
 class NodeGraphics(QGraphicsItem):
     _width = 150
     _title_height = 25
@@ -37,10 +91,13 @@ class NodeGraphics(QGraphicsItem):
         self.base = base
         self.content = content
         self.node_class = str(self.base)
-        self.node_id = NodesRegister.register_node(self)
+        self.node_id = self.base.register.register_node(self)
 
         self._height = max(self.content.layout_size.height(), 50)
 
+        # share of the run time spent in the node, see `set_heat`
+        self._heat = None
+
         self._set_flags()
         self._set_colors()
         self._draw_title()
@@ -49,13 +106,11 @@ class NodeGraphics(QGraphicsItem):
 
     def delete_node(self):
         """Delete the graphics node and its input edges."""
-        NodesRegister.unregister_node(self)
-
-        # Merge two dicts. I would rather use .update but does not work
-        edges = {**self.data('input_edges'), **self.data('output_edges')}
-        for edge in edges:
+        for edge in self.base.input_edges + self.base.output_edges:
             edge.delete_edge()
 
+        self.base.register.unregister_node(self)
+
         self.scene().removeItem(self)
 
     def _set_colors(self):
@@ -66,6 +121,7 @@ class NodeGraphics(QGraphicsItem):
 
         self._node_background = QBrush(QColor("#FF313131"))
         self._node_title_background = QBrush(self.base.title_background)
+        self._node_heat = QColor('#FF5000')
 
     def _set_flags(self):
         """Initialize UI for the Node graphic content."""
@@ -172,6 +228,15 @@ class NodeGraphics(QGraphicsItem):
             painter.setBrush(self._node_background)
             painter.drawPath(self._node_body)
 
+        def draw_heat():
+            # the content widget covers most of the body, so the outline
+            # carries the tint as well
+            color = QColor(self._node_heat)
+            color.setAlphaF(0.15 + 0.6 * self._heat)
+            painter.setPen(QPen(color, 1 + 5 * self._heat))
+            painter.setBrush(color)
+            painter.drawPath(self._node_body)
+
         def draw_outline():
             painter.setPen(self._node_selected if self.isSelected()
                            else self._node_border)
@@ -180,33 +245,37 @@ class NodeGraphics(QGraphicsItem):
 
         draw_body()
         draw_title()
+        if self._heat is not None:
+            draw_heat()
         draw_outline()
 
+    def set_heat(self, heat):
+        """Tint the node body by its share of the profiled run time.
+
+        Args:
+            heat (float): A value between 0 and 1, or `None` to remove the tint.
+        """
+        self._heat = heat
+        self.update()
+
     def boundingRect(self):
         """Set the bounding margins for the node."""
         return self._node_body.boundingRect()
 
-    def data(self, key=None) -> dict:
-
-        position = self.pos()
-        node_data = {
-            'class': self.node_class,
-            'object': str(self),
-            'id': self.node_id,
-            'zValue': self.zValue(),
-            'position': {'x': position.x(), 'y': position.y()},
-            'output_edges': extract_output_edges(self),
-            'input_edges': extract_input_edges(self),
-            'node_output': self.base.get_output(),
-            'connected_sockets': {
-                'input_sockets': {},
-                'output_sockets': {}
-            }
-        }
-        return node_data.get(key, node_data)
+    def data(self, key=None):
+        """Get the data of the node, see `NodeData`.
+
+        Returns:
+            (any) - The value of `key` when it is a field, only that field is
+            computed, otherwise the `NodeData` view of the node.
+        """
+        node_data = NodeData(self)
+        if key in _NODE_DATA_FIELDS:
+            return node_data[key]
+        return node_data
 
     def repr(self):
-        return pprint.pformat(self.data(), 1, 100)
+        return pprint.pformat(self.data().snapshot(), 1, 100)
         # return json.dumps(self.data(), indent=1)
 
     def __str__(self) -> str:
@@ -240,16 +309,33 @@ class Node(NodeInterface):
         LOGGER.info('Init Node')
 
         self.content = content
+        self.register = scene.register
 
         self.node_graphics = NodeGraphics(node, content)
         scene.addItem(self.node_graphics)
 
+        # the node topology, the node and its sockets are views over it
+        self.model = self.register.graph.add_node(
+            self.node_id, str(self),
+            [socket.data['type'] for socket in self.content.inputs],
+            [socket.data['type'] for socket in self.content.outputs], self)
+
         self.input_sockets = []
         self.output_sockets = []
         self.output_execs = []
 
         self.was_execute = False
 
+        # `output_version` changes every time the node outputs might have
+        # changed, `state_version` only when the node content changed.
+        # Edges compare them to know if they need to transfer again.
+        self.output_version = 0
+        self.state_version = 0
+        self.content.content_changed.connect(self.mark_dirty)
+
+        # outputs computed by a worker process, see `apply_work_result`
+        self.process_outputs = {}
+
         self._add_inputs()
         self._add_outputs()
 
@@ -292,24 +378,91 @@ class Node(NodeInterface):
             if socket_type == 'execute':
                 self.output_execs.append(socket)
 
+    @property
+    def node_id(self) -> str:
+        return self.node_graphics.node_id
+
+    @property
+    def input_edges(self) -> list:
+        """Get the `NodeEdge` of the input sockets, by socket index."""
+        return [edge.view for edge in self.model.input_edges()]
+
+    @property
+    def output_edges(self) -> list:
+        """Get the `NodeEdge` of the output sockets, by socket index."""
+        return [edge.view for edge in self.model.output_edges()]
+
+    @property
+    def thread_safe(self) -> bool:
+        return self.content.thread_safe
+
+    @property
+    def run_in_process(self) -> bool:
+        return self.content.run_in_process
+
+    @property
+    def input_values(self) -> dict:
+        return self.content.input_values
+
     def set_position(self, x: int, y: int):
         self.node_graphics.setPos(x, y)
 
-    def get_output(self, index=0):
-        return self.content.get_output(index)
+    def mark_dirty(self):
+        """Mark the node content as changed.
 
-    def set_input(self, value, index=0):
-        self.content.set_input(value, index)
+        Both the input and the output edges of the node will transfer their
+        data again on the next run.
+        """
+        self.state_version += 1
+        self.output_version += 1
+        self.process_outputs.clear()
+
+    def outputs_changed(self):
+        """Mark the node outputs as changed after receiving new data."""
+        self.output_version += 1
+
+    def work_unit(self, inputs: list) -> tuple:
+        """Get the picklable `WorkUnit` fields to evaluate the node in a process."""
+        return (str(self), self.node_graphics.node_id,
+                self.content.save_state(), inputs)
+
+    def apply_work_result(self, inputs: list, result):
+        """Apply the result of a worker process to the node widgets."""
+        self.content.input_values.update(inputs)
+
+        if result.state != self.content.save_state():
+            # the state comes from the node itself, so it is not a change
+            self.content.blockSignals(True)
+            self.content.restore_state(result.state)
+            self.content.blockSignals(False)
 
-        for edge in self.node_graphics.data('output_edges'):
-            if edge.start_socket.socket_type == 'execute':
-                continue
-            edge.transfer_data()
+        self.process_outputs = dict(result.outputs)
+        self.outputs_changed()
 
+    def get_output(self, index=0):
+        if index in self.process_outputs:
+            return self.process_outputs[index]
+
+        if self.content.memoize:
+            return self.content.memoized_output(index)
+        return self.content.cached_output(index)
+
+    def set_input(self, value, index=0):
+        # downstream nodes are fed by the execution plan, in topological
+        # order, so there is no need to push the value to the output edges.
+        self.content.input_values[index] = value
         self.was_execute = True
+        return self.content.set_input(value, index)
 
     def get_execute_flow(self):
         return self.content.get_execute_flow(self.output_execs)
 
+    def execute_index(self) -> int:
+        """Get the index of the execute output socket to follow."""
+        return self.get_execute_flow().index
+
+    def iterate(self):
+        return self.content.iterate()
+
     def __str__(self):
         return f'{self.__class__.__name__}'
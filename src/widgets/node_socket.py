@@ -6,6 +6,7 @@ from PySide2.QtWidgets import (
     QGraphicsItem
 )
 
+from src.engine.engine_model import Port
 from src.utils import class_id
 
 
@@ -104,6 +105,12 @@ class SocketGraphics(QGraphicsItem):
     def widget(self):
         return self._socket.socket_widget
 
+    @property
+    def port(self) -> Port:
+        """The socket in the graph model."""
+        return Port(self.node.base.model, self.index,
+                    isinstance(self, SocketOutput))
+
     @property
     def socket_type(self):
         return self._socket_data.data['type']
@@ -154,26 +161,17 @@ class SocketGraphics(QGraphicsItem):
 
 class SocketInput(SocketGraphics):
 
-    def __init__(self, socket):
-        super().__init__(socket)
-        self._edge = None
-
     @property
     def edge(self):
-        return self._edge
+        edge = self.node.base.model.input_edge(self.index)
+        return edge.view if edge else None
 
     def has_edge(self):
-        return bool(self._edge)
+        return bool(self.node.base.model.input_edge(self.index))
 
     def get_edges(self):
         return self.edge
 
-    def add_edge(self, edge):
-        self._edge = edge
-
-    def clear_reference(self):
-        self._edge = None
-
     def remove_edge(self):
         self.edge.delete_edge()
 
@@ -183,34 +181,24 @@ class SocketInput(SocketGraphics):
 
 class SocketOutput(SocketGraphics):
 
-    def __init__(self, socket):
-        super().__init__(socket)
-        self._edges = []
-
     @property
-    def edges(self):
-        return self._edges
-
-    def add_edge(self, edge: 'NodeEdge'):
-        self._edges.append(edge)
+    def edges(self) -> list:
+        return [edge.view
+                for edge in self.node.base.model.socket_edges(self.index)]
 
     def get_edges(self):
         """Return the socket edges.
 
         Returns:
-            list: a shallow copy of the socket edge list.
+            list: a new list of the socket edges.
         """
-        return self.edges.copy()
+        return self.edges
 
     def has_edge(self):
-        return bool(self._edges)
+        return bool(self.node.base.model.socket_edges(self.index))
 
     def remove_edge(self, edge):
-        edge = self.edges.index(edge)
-        self.edges[edge].delete_edge()
-
-    def clear_reference(self, edge):
-        self._edges.remove(edge)
+        edge.delete_edge()
 
     def __str__(self) -> str:
         return class_id('SocketOutput', self)
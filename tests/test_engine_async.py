@@ -0,0 +1,82 @@
+import os
+import asyncio
+import unittest
+
+from src.engine import (
+    EngineGraph,
+    EngineNode,
+    EngineRegister,
+    GraphExecutor,
+    SocketType,
+    load_graph
+)
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'example', 'my_project.json')
+
+
+@EngineRegister.register_class
+class NodeTestAsyncReverse(EngineNode):
+    """A data node awaiting its input and output."""
+
+    inputs = (SocketType.text,)
+    outputs = (SocketType.text,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = ''
+
+    async def set_input(self, value, index):
+        await asyncio.sleep(0)
+        self.text = value[::-1]
+
+    async def get_output(self, index):
+        await asyncio.sleep(0)
+        return self.text
+
+
+def reverse_graph() -> EngineGraph:
+    """Two debug nodes fed by awaitable data branches."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.add_node('NodeDebug', 'NodeDebug.002')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeDebug.001', 0, 'NodeDebug.002', 0)
+
+    for number, text in (('001', 'foo'), ('002', 'bar')):
+        graph.add_node('NodeInput', f'NodeInput.{number}', {'text': text})
+        graph.add_node('NodeTestAsyncReverse', f'NodeTestAsyncReverse.{number}')
+        graph.add_node('NodeString', f'NodeString.{number}')
+        graph.connect(f'NodeInput.{number}', 0, f'NodeTestAsyncReverse.{number}', 0)
+        graph.connect(f'NodeTestAsyncReverse.{number}', 0, f'NodeString.{number}', 0)
+        graph.connect(f'NodeString.{number}', 0, f'NodeDebug.{number}', 1)
+    return graph
+
+
+def run_async(executor: GraphExecutor) -> dict:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(executor.run_async())
+    finally:
+        loop.close()
+
+
+class TestRunAsync(unittest.TestCase):
+
+    def test_example_graph(self):
+        expected = GraphExecutor(load_graph(EXAMPLE)).run()
+        self.assertEqual(expected, {'NodeDebug.001': 'FOO BAR'})
+
+        executor = GraphExecutor(load_graph(EXAMPLE))
+        for _ in range(2):
+            self.assertEqual(run_async(executor), expected)
+
+    def test_awaitable_nodes(self):
+        executor = GraphExecutor(reverse_graph())
+        for _ in range(2):
+            self.assertEqual(run_async(executor),
+                             {'NodeDebug.001': 'OOF', 'NodeDebug.002': 'RAB'})
+
+
+if __name__ == '__main__':
+    unittest.main()
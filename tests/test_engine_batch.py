@@ -0,0 +1,93 @@
+import unittest
+
+from src.engine import (
+    EngineGraph,
+    EngineNode,
+    EngineRegister,
+    GraphExecutor,
+    SocketType,
+    run_batch
+)
+
+
+@EngineRegister.register_class
+class NodeTestUpper(EngineNode):
+    """A data node without batch methods, evaluated row by row."""
+
+    inputs = (SocketType.text,)
+    outputs = (SocketType.text,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = ''
+
+    def set_input(self, value, index):
+        self.text = value
+
+    def get_output(self, index):
+        return self.text.upper()
+
+
+def branch_graph() -> EngineGraph:
+    """A branch picking `NodeDebug.001` if the input text is not empty."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeInput', 'NodeInput.001', {'text': ''})
+    graph.add_node('NodeBranch', 'NodeBranch.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.add_node('NodeDebug', 'NodeDebug.002')
+    graph.connect('NodeExecute.001', 0, 'NodeBranch.001', 0)
+    graph.connect('NodeInput.001', 0, 'NodeBranch.001', 1)
+    graph.connect('NodeBranch.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeBranch.001', 1, 'NodeDebug.002', 0)
+    graph.connect('NodeInput.001', 0, 'NodeDebug.001', 1)
+    graph.connect('NodeInput.001', 0, 'NodeDebug.002', 1)
+    return graph
+
+
+class TestRunBatch(unittest.TestCase):
+
+    def test_batch_results(self):
+        self.assertEqual(run_batch(branch_graph(), {'NodeInput.001': ['x', 'y']}),
+                         {'NodeDebug.001': ['x', 'y']})
+
+    def test_run_after_batch(self):
+        graph = branch_graph()
+        executor = GraphExecutor(graph)
+        self.assertEqual(executor.run(), {'NodeDebug.002': ''})
+
+        run_batch(graph, {'NodeInput.001': ['x', 'y']})
+        self.assertEqual(executor.run(), {'NodeDebug.002': ''})
+        self.assertEqual(GraphExecutor(graph).run(), {'NodeDebug.002': ''})
+
+    def test_run_after_batch_row_by_row(self):
+        graph = branch_graph()
+        executor = GraphExecutor(graph)
+        executor.run()
+
+        # the rows take different branches, so the batch runs row by row
+        self.assertEqual(run_batch(graph, {'NodeInput.001': ['x', '']}),
+                         {'NodeDebug.001': ['x', None], 'NodeDebug.002': [None, '']})
+        self.assertEqual(executor.run(), {'NodeDebug.002': ''})
+
+    def test_run_after_batch_of_row_node(self):
+        graph = EngineGraph()
+        graph.add_node('NodeExecute', 'NodeExecute.001')
+        graph.add_node('NodeInput', 'NodeInput.001', {'text': 'foo'})
+        graph.add_node('NodeTestUpper', 'NodeTestUpper.001')
+        graph.add_node('NodeDebug', 'NodeDebug.001')
+        graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+        graph.connect('NodeInput.001', 0, 'NodeTestUpper.001', 0)
+        graph.connect('NodeTestUpper.001', 0, 'NodeDebug.001', 1)
+
+        executor = GraphExecutor(graph)
+        self.assertEqual(executor.run(), {'NodeDebug.001': 'FOO'})
+
+        self.assertEqual(run_batch(graph, {'NodeInput.001': ['x', 'y']}),
+                         {'NodeDebug.001': ['X', 'Y']})
+        self.assertEqual(executor.run(), {'NodeDebug.001': 'FOO'})
+        self.assertEqual(graph.get_node('NodeTestUpper.001').input_values, {0: 'foo'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+
+from src.engine import OutputCache, digest
+
+
+class Truncated:
+    """A value whose `repr` does not show its data."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __repr__(self):
+        return 'Truncated(...)'
+
+
+class TestDigest(unittest.TestCase):
+
+    def test_json_values_ignore_dict_order(self):
+        self.assertEqual(digest({'a': 1, 'b': 2}), digest({'b': 2, 'a': 1}))
+
+    def test_values_with_same_repr_differ(self):
+        self.assertNotEqual(digest(Truncated([1, 2])), digest(Truncated([1, 3])))
+
+    def test_unpicklable_values_raise(self):
+        with self.assertRaises(TypeError):
+            digest(value for value in range(2))
+
+
+class TestOutputCache(unittest.TestCase):
+
+    def test_inputs_with_same_repr_do_not_collide(self):
+        cache = OutputCache()
+
+        def compute(index):
+            return sum(inputs[0].data)
+
+        inputs = {0: Truncated([1, 2])}
+        self.assertEqual(cache.get_output(0, {}, inputs, compute), 3)
+        inputs = {0: Truncated([1, 3])}
+        self.assertEqual(cache.get_output(0, {}, inputs, compute), 4)
+
+    def test_undigestable_inputs_are_computed(self):
+        cache = OutputCache()
+        inputs = {0: (value for value in range(3))}
+        self.assertEqual(cache.get_output(0, {}, inputs, lambda index: 'out'), 'out')
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_one_shot_outputs_are_not_stored(self):
+        cache = OutputCache()
+
+        async def coroutine():
+            return 'async'
+
+        for compute in (lambda index: iter([1, 2]), lambda index: coroutine()):
+            values = [cache.get_output(0, {}, {}, compute) for _ in range(2)]
+            self.assertIsNot(values[0], values[1])
+
+            for value in values:
+                if asyncio.iscoroutine(value):
+                    value.close()
+
+        self.assertEqual(cache.stats()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import json
+import unittest
+
+from src.engine import EngineGraph, GraphExecutor, compile_graph
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'example', 'my_project.json')
+
+
+def branch_state(text: str) -> dict:
+    """A branch picking `NodeDebug.001` if the input text is not empty."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeInput', 'NodeInput.001', {'text': text})
+    graph.add_node('NodeBranch', 'NodeBranch.001')
+    graph.add_node('NodeString', 'NodeString.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.add_node('NodeDebug', 'NodeDebug.002')
+    graph.connect('NodeExecute.001', 0, 'NodeBranch.001', 0)
+    graph.connect('NodeInput.001', 0, 'NodeBranch.001', 1)
+    graph.connect('NodeBranch.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeBranch.001', 1, 'NodeDebug.002', 0)
+    graph.connect('NodeInput.001', 0, 'NodeString.001', 0)
+    graph.connect('NodeString.001', 0, 'NodeDebug.001', 1)
+    graph.connect('NodeInput.001', 1, 'NodeDebug.002', 1)
+    return graph.state()
+
+
+def loop_state() -> dict:
+    """A loop printing the upper case of every element of its default list."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeForLoop', 'NodeForLoop.001')
+    graph.add_node('NodeString', 'NodeString.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeForLoop.001', 0)
+    graph.connect('NodeForLoop.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeForLoop.001', 1, 'NodeString.001', 0)
+    graph.connect('NodeString.001', 0, 'NodeDebug.001', 1)
+    return graph.state()
+
+
+def executor_results(data: dict) -> dict:
+    with GraphExecutor(EngineGraph.from_state(data)) as executor:
+        return executor.run()
+
+
+class TestCompileGraph(unittest.TestCase):
+
+    def assert_same_results(self, data: dict):
+        results = executor_results(data)
+        self.assertTrue(results)
+        self.assertEqual(compile_graph(data)(), results)
+
+    def test_example_graph(self):
+        with open(EXAMPLE, 'r', encoding='utf-8') as f:
+            self.assert_same_results(json.load(f))
+
+    def test_branch(self):
+        for text in ('', 'foo'):
+            with self.subTest(text=text):
+                self.assert_same_results(branch_state(text))
+
+    def test_loop(self):
+        self.assert_same_results(loop_state())
+
+    def test_batch_input_argument(self):
+        run_graph = compile_graph(branch_state('foo'))
+
+        for text in ('', 'bar'):
+            with self.subTest(text=text):
+                self.assertEqual(run_graph(NodeInput_001=text),
+                                 executor_results(branch_state(text)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from src.engine import (
+    EngineGraph,
+    EngineNode,
+    EngineRegister,
+    GraphExecutor,
+    SocketType
+)
+
+
+@EngineRegister.register_class
+class NodeTestLines(EngineNode):
+    """A source streaming its lines with a generator."""
+
+    outputs = (SocketType.array,)
+
+    def get_output(self, index):
+        return (f'line{number}' for number in range(3))
+
+
+def loop_graph(through_passthru: bool) -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeTestLines', 'NodeTestLines.001')
+    graph.add_node('NodeForLoop', 'NodeForLoop.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeForLoop.001', 0)
+    graph.connect('NodeForLoop.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeForLoop.001', 1, 'NodeDebug.001', 1)
+
+    if through_passthru:
+        graph.add_node('NodePassthru', 'NodePassthru.001')
+        graph.connect('NodeTestLines.001', 0, 'NodePassthru.001', 0)
+        graph.connect('NodePassthru.001', 0, 'NodeForLoop.001', 1)
+    else:
+        graph.connect('NodeTestLines.001', 0, 'NodeForLoop.001', 1)
+    return graph
+
+
+class TestForLoop(unittest.TestCase):
+
+    def assert_runs_stream(self, graph):
+        lines = []
+        debug = graph.get_node('NodeDebug.001')
+        set_input = debug.set_input
+
+        def record(value, index):
+            if index == 1:
+                lines.append(value)
+            return set_input(value, index)
+
+        debug.set_input = record
+
+        executor = GraphExecutor(graph)
+        for _ in range(2):
+            del lines[:]
+            self.assertEqual(executor.run(), {'NodeDebug.001': 'line2'})
+            self.assertEqual(lines, ['line0', 'line1', 'line2'])
+
+    def test_generator_is_pulled_every_run(self):
+        self.assert_runs_stream(loop_graph(through_passthru=False))
+
+    def test_generator_through_a_data_node(self):
+        self.assert_runs_stream(loop_graph(through_passthru=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from src.engine import EngineGraph, GraphExecutor
+
+
+def debug_graph() -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeInput', 'NodeInput.001', {'text': 'foo'})
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeInput.001', 0, 'NodeDebug.001', 1)
+    return graph
+
+
+def wide_graph() -> EngineGraph:
+    """Two debug nodes fed by independent data branches."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.add_node('NodeDebug', 'NodeDebug.002')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeDebug.001', 0, 'NodeDebug.002', 0)
+
+    for number, text in (('001', 'foo'), ('002', 'bar')):
+        graph.add_node('NodeInput', f'NodeInput.{number}', {'text': text})
+        graph.add_node('NodePassthru', f'NodePassthru.{number}')
+        graph.add_node('NodeString', f'NodeString.{number}')
+        graph.connect(f'NodeInput.{number}', 0, f'NodePassthru.{number}', 0)
+        graph.connect(f'NodePassthru.{number}', 0, f'NodeString.{number}', 0)
+        graph.connect(f'NodeString.{number}', 0, f'NodeDebug.{number}', 1)
+    return graph
+
+
+class TestRunPlan(unittest.TestCase):
+
+    def test_exec_node_receives_clean_inputs(self):
+        graph = debug_graph()
+        executor = GraphExecutor(graph)
+        self.assertEqual(executor.run(), {'NodeDebug.001': 'foo'})
+
+        # the debug node was cleared, its input edge did not change
+        graph.get_node('NodeDebug.001').text = None
+        self.assertEqual(executor.run(), {'NodeDebug.001': 'foo'})
+
+    def test_clean_upstream_is_not_pulled(self):
+        graph = debug_graph()
+        graph.add_node('NodePassthru', 'NodePassthru.001')
+        graph.connect('NodeInput.001', 0, 'NodePassthru.001', 0)
+        graph.connect('NodePassthru.001', 0, 'NodeDebug.001', 1)
+
+        executor = GraphExecutor(graph)
+        executor.run()
+
+        pulled = []
+        edge = graph.output_edges(graph.get_node('NodeInput.001'))[0]
+        pull_data = edge.pull_data
+        edge.pull_data = lambda: pulled.append(edge) or pull_data()
+
+        self.assertEqual(executor.run(), {'NodeDebug.001': 'foo'})
+        self.assertEqual(pulled, [])
+
+
+class TestThreadPool(unittest.TestCase):
+
+    def test_same_results_as_sequential_run(self):
+        expected = {'NodeDebug.001': 'FOO', 'NodeDebug.002': 'BAR'}
+        self.assertEqual(GraphExecutor(wide_graph()).run(), expected)
+
+        graph = wide_graph()
+        with GraphExecutor(graph, max_workers=4) as executor:
+            for _ in range(3):
+                self.assertEqual(executor.run(), expected)
+
+            node = graph.get_node('NodeInput.002')
+            node.restore_state({'text': 'baz'})
+            node.mark_dirty()
+            self.assertEqual(executor.run(),
+                             {'NodeDebug.001': 'FOO', 'NodeDebug.002': 'BAZ'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+from src.engine import (
+    EngineGraph,
+    EngineNode,
+    EngineRegister,
+    GraphExecutor,
+    SocketType
+)
+
+
+@EngineRegister.register_class
+class NodeTestProcessDebug(EngineNode):
+    """A sink of the execute flow evaluated in a worker process."""
+
+    run_in_process = True
+
+    inputs = (SocketType.execute, SocketType.text)
+    outputs = (SocketType.execute,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = None
+
+    def set_input(self, value, index):
+        if index == 1:
+            self.text = value.upper()
+
+    def get_output(self, index):
+        return
+
+    def result(self):
+        return self.text
+
+
+@EngineRegister.register_class
+class NodeTestProcessReverse(EngineNode):
+    """A data node evaluated in a worker process."""
+
+    run_in_process = True
+
+    inputs = (SocketType.text,)
+    outputs = (SocketType.text,)
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = ''
+
+    def set_input(self, value, index):
+        self.text = value[::-1]
+
+    def get_output(self, index):
+        return self.text
+
+
+def process_graph() -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeInput', 'NodeInput.001', {'text': 'foo'})
+    graph.add_node('NodeTestProcessDebug', 'NodeTestProcessDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeTestProcessDebug.001', 0)
+    graph.connect('NodeInput.001', 0, 'NodeTestProcessDebug.001', 1)
+    return graph
+
+
+def reverse_graph() -> EngineGraph:
+    """Two debug nodes fed by data branches evaluated in processes."""
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.add_node('NodeDebug', 'NodeDebug.002')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeDebug.001', 0, 'NodeDebug.002', 0)
+
+    for number, text in (('001', 'foo'), ('002', 'bar')):
+        graph.add_node('NodeInput', f'NodeInput.{number}', {'text': text})
+        graph.add_node('NodeTestProcessReverse', f'NodeTestProcessReverse.{number}')
+        graph.add_node('NodeString', f'NodeString.{number}')
+        graph.connect(f'NodeInput.{number}', 0, f'NodeTestProcessReverse.{number}', 0)
+        graph.connect(f'NodeTestProcessReverse.{number}', 0, f'NodeString.{number}', 0)
+        graph.connect(f'NodeString.{number}', 0, f'NodeDebug.{number}', 1)
+    return graph
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def test_exec_node_receives_its_inputs(self):
+        with GraphExecutor(process_graph(), max_processes=1) as executor:
+            self.assertEqual(executor.run(),
+                             {'NodeTestProcessDebug.001': 'FOO'})
+
+    def test_same_results_as_sequential_run(self):
+        expected = {'NodeDebug.001': 'OOF', 'NodeDebug.002': 'RAB'}
+        self.assertEqual(GraphExecutor(reverse_graph()).run(), expected)
+
+        graph = reverse_graph()
+        with GraphExecutor(graph, max_workers=2, max_processes=2) as executor:
+            for _ in range(2):
+                self.assertEqual(executor.run(), expected)
+
+            # the output came back from a worker process
+            self.assertEqual(
+                graph.get_node('NodeTestProcessReverse.001').process_outputs,
+                {0: 'oof'})
+
+            node = graph.get_node('NodeInput.002')
+            node.restore_state({'text': 'baz'})
+            node.mark_dirty()
+            self.assertEqual(executor.run(),
+                             {'NodeDebug.001': 'OOF', 'NodeDebug.002': 'ZAB'})
+
+
+if __name__ == '__main__':
+    unittest.main()
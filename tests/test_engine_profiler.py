@@ -0,0 +1,85 @@
+import os
+import unittest
+
+from src.engine import (
+    EngineNode,
+    EngineRegister,
+    GraphExecutor,
+    Profiler,
+    SocketType,
+    load_graph
+)
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'example', 'my_project.json')
+
+
+@EngineRegister.register_class
+class NodeTestBroken(EngineNode):
+    """A source failing to compute its output."""
+
+    outputs = (SocketType.text,)
+
+    def get_output(self, index):
+        raise RuntimeError('broken')
+
+
+def assert_unwrapped(test: unittest.TestCase, graph):
+    for node in graph.nodes.values():
+        for name in Profiler.methods:
+            test.assertNotIn(name, vars(node), node.node_id)
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_stats_are_collected(self):
+        graph = load_graph(EXAMPLE)
+        profiler = Profiler()
+        with GraphExecutor(graph, profiler=profiler) as executor:
+            self.assertEqual(executor.run(), {'NodeDebug.001': 'FOO BAR'})
+
+        self.assertEqual(set(profiler.stats), set(graph.nodes))
+        for stats in profiler.stats.values():
+            self.assertGreater(stats.calls, 0)
+            self.assertGreaterEqual(stats.wall, 0.0)
+
+        self.assertGreater(profiler.stats['NodeString.001'].bytes, 0)
+
+        report = profiler.report()
+        self.assertEqual([stats.wall for stats in report],
+                         sorted((stats.wall for stats in report), reverse=True))
+
+        heat = profiler.heat()
+        self.assertEqual(heat[report[0].node_id], 1.0)
+        self.assertTrue(all(0.0 <= value <= 1.0 for value in heat.values()))
+
+        profiler.reset()
+        self.assertEqual(profiler.stats, {})
+
+    def test_nodes_are_unwrapped_after_the_run(self):
+        graph = load_graph(EXAMPLE)
+        debug = graph.get_node('NodeDebug.001')
+        get_output = debug.get_output = lambda index: None
+
+        with GraphExecutor(graph, profiler=Profiler()) as executor:
+            executor.run()
+
+        # the method set on the instance before the run is restored
+        self.assertIs(vars(debug).pop('get_output'), get_output)
+        assert_unwrapped(self, graph)
+
+    def test_nodes_are_unwrapped_after_a_failed_run(self):
+        graph = load_graph(EXAMPLE)
+        graph.add_node('NodeTestBroken', 'NodeTestBroken.001')
+        graph.connect('NodeTestBroken.001', 0, 'NodeDebug.001', 1)
+
+        profiler = Profiler()
+        with GraphExecutor(graph, profiler=profiler) as executor:
+            with self.assertRaises(RuntimeError):
+                executor.run()
+
+        self.assertEqual(profiler.stats['NodeTestBroken.001'].calls, 1)
+        assert_unwrapped(self, graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
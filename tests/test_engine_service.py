@@ -0,0 +1,23 @@
+import os
+import unittest
+
+from src.engine.engine_service import GraphService
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'example', 'my_project.json')
+
+
+class TestGraphService(unittest.TestCase):
+
+    def test_compiled_run_rejects_timeout(self):
+        service = GraphService(max_runs=1)
+        with self.assertRaises(ValueError):
+            service.run(EXAMPLE, timeout=1, compiled=True)
+
+        # the rejected run released its slot and did not count as a run
+        self.assertEqual(service.run(EXAMPLE, compiled=True)['results'],
+                         service.run(EXAMPLE, timeout=1)['results'])
+        self.assertEqual(service.warm_graph(EXAMPLE).runs, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
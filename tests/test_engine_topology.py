@@ -0,0 +1,123 @@
+import random
+import unittest
+
+from src.engine import CycleError, Graph
+
+
+def chain_graph(count: int) -> Graph:
+    """Nodes with two inputs and an output, added without edges."""
+    graph = Graph()
+    for number in range(1, count + 1):
+        graph.add_node(f'NodeTest.{number:03}', 'NodeTest',
+                       ('value', 'value'), ('value',))
+    return graph
+
+
+def node_ids(nodes) -> list:
+    return [node.node_id for node in nodes]
+
+
+class TestTopologyIndex(unittest.TestCase):
+
+    def assert_sorted(self, graph: Graph):
+        order = graph.topology.topological_order()
+        self.assertCountEqual(order, graph.nodes.values())
+
+        position = {node: index for index, node in enumerate(order)}
+        for edge in graph.edges():
+            self.assertLess(position[edge.start], position[edge.end], edge)
+
+    def assert_ends(self, graph: Graph):
+        nodes = graph.nodes.values()
+        self.assertCountEqual(graph.topology.roots(),
+                              [node for node in nodes if not node.input_edges()])
+        self.assertCountEqual(graph.topology.leaves(),
+                              [node for node in nodes if not node.output_edges()])
+
+    def test_edge_against_the_order_reorders(self):
+        graph = chain_graph(3)
+        first, second, third = graph.nodes.values()
+
+        graph.connect(third, 0, second, 0)
+        graph.connect(second, 0, first, 0)
+        self.assertEqual(node_ids(graph.topology.topological_order()),
+                         ['NodeTest.003', 'NodeTest.002', 'NodeTest.001'])
+
+        self.assertEqual(graph.topology.upstream(first), [third, second])
+        self.assertEqual(graph.topology.downstream(third), [second, first])
+
+    def test_cycle_is_rejected(self):
+        graph = chain_graph(3)
+        first, second, third = graph.nodes.values()
+        graph.connect(first, 0, second, 0)
+        graph.connect(second, 0, third, 0)
+
+        self.assertTrue(graph.topology.creates_cycle(third, first))
+        self.assertFalse(graph.topology.creates_cycle(first, third))
+        with self.assertRaises(CycleError):
+            graph.connect(third, 0, first, 0)
+        with self.assertRaises(CycleError):
+            graph.connect(first, 0, first, 0)
+
+        # the rejected edges were not connected
+        self.assertEqual(graph.edge_count, 2)
+        self.assertEqual(first.input_edges(), [])
+        self.assert_sorted(graph)
+
+    def test_roots_and_leaves_after_removals(self):
+        graph = chain_graph(4)
+        first, second, third, fourth = graph.nodes.values()
+
+        # collect the ends before the changes so they are updated, not rebuilt
+        self.assert_ends(graph)
+
+        edge = graph.connect(first, 0, second, 0)
+        graph.connect(second, 0, third, 0)
+        graph.connect(fourth, 0, third, 1)
+        self.assertEqual(node_ids(graph.topology.roots()),
+                         ['NodeTest.001', 'NodeTest.004'])
+        self.assert_ends(graph)
+
+        graph.disconnect(edge)
+        self.assert_ends(graph)
+        self.assertIn(second, graph.topology.roots())
+        self.assertIn(first, graph.topology.leaves())
+
+        graph.remove_node(second.node_id)
+        self.assert_ends(graph)
+        self.assertNotIn(second, graph.topology.roots())
+        self.assertIn(third, graph.topology.leaves())
+        self.assert_sorted(graph)
+
+    def test_random_edges_keep_the_order(self):
+        rand = random.Random(0)
+        graph = Graph()
+        for number in range(1, 41):
+            graph.add_node(f'NodeTest.{number:03}', 'NodeTest',
+                           ('value',) * 4, ('value',))
+        self.assert_ends(graph)
+
+        nodes = list(graph.nodes.values())
+        for _ in range(200):
+            start, end = rand.sample(nodes, 2)
+            index = rand.randrange(4)
+            if end.input_edge(index):
+                continue
+
+            if start in graph.topology.downstream(end):
+                with self.assertRaises(CycleError):
+                    graph.connect(start, 0, end, index)
+            else:
+                graph.connect(start, 0, end, index)
+
+        self.assert_sorted(graph)
+        self.assert_ends(graph)
+
+        for node in rand.sample(nodes, 10):
+            graph.remove_node(node.node_id)
+        self.assert_sorted(graph)
+        self.assert_ends(graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
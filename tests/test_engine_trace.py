@@ -0,0 +1,147 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from src.engine import (
+    DiskCache,
+    EngineGraph,
+    EngineNode,
+    EngineRegister,
+    SocketType,
+    load_graph
+)
+from src.engine.engine_trace import (
+    load_trace,
+    record_trace,
+    replay_trace,
+    save_trace
+)
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'example', 'my_project.json')
+
+
+@EngineRegister.register_class
+class NodeTestPureUpper(EngineNode):
+    """A pure data node, served from the disk cache of a run."""
+
+    inputs = (SocketType.text,)
+    outputs = (SocketType.text,)
+    pure = True
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.text = ''
+
+    def set_input(self, value, index):
+        self.text = value
+
+    def get_output(self, index):
+        return self.text.upper()
+
+
+def upper_graph() -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeInput', 'NodeInput.001', {'text': 'foo'})
+    graph.add_node('NodeTestPureUpper', 'NodeTestPureUpper.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeInput.001', 0, 'NodeTestPureUpper.001', 0)
+    graph.connect('NodeTestPureUpper.001', 0, 'NodeDebug.001', 1)
+    return graph
+
+
+def loop_graph() -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeForLoop', 'NodeForLoop.001')
+    graph.add_node('NodeString', 'NodeString.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeForLoop.001', 0)
+    graph.connect('NodeForLoop.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeForLoop.001', 1, 'NodeString.001', 0)
+    graph.connect('NodeString.001', 0, 'NodeDebug.001', 1)
+    return graph
+
+
+class TestTraceFile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_round_trip(self):
+        trace = record_trace(load_graph(EXAMPLE))
+        self.assertEqual(trace['results'], {'NodeDebug.001': 'FOO BAR'})
+
+        for name in ('trace.json', 'trace.json.gz'):
+            with self.subTest(name=name):
+                file = os.path.join(self.directory, name)
+                save_trace(trace, file)
+                self.assertEqual(load_trace(file), json.loads(json.dumps(trace)))
+
+    def test_unsupported_version(self):
+        file = os.path.join(self.directory, 'trace.json')
+        save_trace(dict(record_trace(upper_graph()), version=0), file)
+
+        with self.assertRaises(RuntimeError):
+            load_trace(file)
+
+
+class TestReplayTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.disk_cache = DiskCache(os.path.join(directory, 'cache.sqlite'))
+        self.addCleanup(self.disk_cache.close)
+
+    def test_substituted_nodes_skip_the_disk_cache(self):
+        graph = upper_graph()
+        trace = record_trace(graph)
+
+        # an entry under the key of the substituted node, which must not be
+        # served instead of the recorded output
+        upper = graph.get_node('NodeTestPureUpper.001')
+        self.disk_cache.get_output('NodeTestPureUpper', 0, upper.save_state(),
+                                   {0: 'foo'}, lambda index: 'STALE')
+
+        replay = replay_trace(trace, skip=['NodeTestPureUpper.001'],
+                              executor_options={'disk_cache': self.disk_cache})
+
+        self.assertEqual(replay['mismatches'], [])
+        self.assertEqual(replay['results'], {'NodeDebug.001': 'FOO'})
+        self.assertEqual(self.disk_cache.stats()['hits'], 0)
+        self.assertEqual(self.disk_cache.stats()['entries'], 1)
+
+    def assert_replays(self, trace: dict, **options):
+        replay = replay_trace(trace, **options)
+        self.assertEqual(replay['mismatches'], [])
+        self.assertEqual(len(replay['transfers']), len(trace['transfers']))
+        self.assertEqual(replay['results'], trace['results'])
+
+    def test_replay_saved_trace(self):
+        file = os.path.join(self.directory, 'trace.json.gz')
+        save_trace(record_trace(load_graph(EXAMPLE)), file)
+        trace = load_trace(file)
+
+        self.assert_replays(trace)
+        self.assert_replays(trace, skip=['NodeString.001'])
+        self.assert_replays(trace, skip=['NodeInput.001', 'NodeBranch.001'])
+        self.assert_replays(trace, isolate='NodeString.001')
+        self.assert_replays(trace, isolate='NodeDebug.001')
+
+    def test_replay_loop(self):
+        trace = record_trace(loop_graph())
+        self.assertTrue(trace['results'])
+
+        self.assert_replays(trace, skip=['NodeForLoop.001'])
+        self.assert_replays(trace, isolate='NodeString.001')
+        self.assert_replays(trace, isolate='NodeDebug.001')
+
+
+if __name__ == '__main__':
+    unittest.main()
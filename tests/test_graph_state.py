@@ -0,0 +1,50 @@
+import os
+import unittest
+
+try:
+    from PySide2.QtWidgets import QApplication, QGraphicsView
+except ImportError:
+    QApplication = None
+
+
+def passthru_state(edges) -> dict:
+    """A save file of two `NodePassthru` connected by `edges`, a list of
+    `(start id, end id)`."""
+    nodes = {}
+    for node_id in ('NodePassthru.001', 'NodePassthru.002'):
+        output_edges = {
+            str(index): {'start_socket': {'node': start, 'index': 0},
+                         'end_socket': {'node': end, 'index': 0}}
+            for index, (start, end) in enumerate(edges) if start == node_id}
+        nodes[node_id] = {'class': 'NodePassthru',
+                          'position': {'x': 0.0, 'y': 0.0},
+                          'output_edges': output_edges}
+    return {'viewport': {'x': 0.0, 'y': 0.0}, 'nodes': nodes}
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestLoadScene(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_cycle_edge_is_skipped(self):
+        from src.utils.graph_state import load_scene
+        from src.widgets.editor_scene import Scene
+
+        scene = Scene().graphics_scene
+        view = QGraphicsView(scene)
+        self.addCleanup(view.deleteLater)
+
+        load_scene(scene, passthru_state([
+            ('NodePassthru.001', 'NodePassthru.002'),
+            ('NodePassthru.002', 'NodePassthru.001')]))
+
+        self.assertEqual(len(scene.register.all_nodes), 2)
+        self.assertEqual(len(list(scene.register.graph.edges())), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
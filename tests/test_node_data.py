@@ -0,0 +1,82 @@
+import os
+import unittest
+from unittest import mock
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestNodeData(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.nodes import create_node
+        from src.widgets.editor_scene import Scene
+        from src.widgets.node_edge import NodeEdge
+
+        self.scene = Scene()
+        scene = self.scene.graphics_scene
+        self.source = create_node(scene, 'NodeInput')
+        self.upper = create_node(scene, 'NodeString')
+        NodeEdge(scene, self.source.output_sockets[0], self.upper.input_sockets[0])
+
+    def test_reading_runs_no_node_logic(self):
+        nodes = (self.source, self.upper)
+        calls = []
+        for node in nodes:
+            for name in ('get_output', 'set_input'):
+                method = getattr(node, name)
+                setattr(node, name, mock.Mock(side_effect=method))
+                calls.append(getattr(node, name))
+
+        versions = [(node.state_version, node.output_version) for node in nodes]
+        for node in nodes:
+            graphics = node.node_graphics
+            dict(graphics.data())
+            graphics.data().snapshot()
+            graphics.repr()
+            for key in graphics.data():
+                graphics.data(key)
+
+        for call in calls:
+            call.assert_not_called()
+        self.assertEqual([(node.state_version, node.output_version)
+                          for node in nodes], versions)
+        self.assertFalse(any(node.was_execute for node in nodes))
+
+    def test_only_the_read_field_is_computed(self):
+        from src.widgets import node_graphics
+
+        fields = {key: mock.Mock(side_effect=field) for key, field in
+                  node_graphics._NODE_DATA_FIELDS.items()}
+        graphics = self.source.node_graphics
+
+        with mock.patch.dict(node_graphics._NODE_DATA_FIELDS, fields):
+            self.assertEqual(graphics.data('id'), 'NodeInput.001')
+            self.assertEqual(graphics.data()['class'], 'NodeInput')
+
+        self.assertEqual({key for key, field in fields.items() if field.called},
+                         {'id', 'class'})
+
+    def test_view_is_live_and_snapshot_is_not(self):
+        graphics = self.source.node_graphics
+        data = graphics.data()
+        snapshot = data.snapshot('position')
+
+        graphics.setPos(10, 20)
+        self.assertEqual(data['position'], {'x': 10, 'y': 20})
+        self.assertEqual(snapshot, {'position': {'x': 0, 'y': 0}})
+
+        with self.assertRaises(TypeError):
+            data['position'] = {'x': 0, 'y': 0}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+from src.engine import EngineGraph, EngineRegister, SocketType
+
+# a value fed to every data input, by socket type
+INPUTS = {
+    SocketType.number: 3,
+    SocketType.array: ['foo', 'bar'],
+    SocketType.boolean: True,
+    SocketType.text: 'foo Bar',
+    SocketType.widget: 'foo Bar',
+    SocketType.value: 'foo',
+}
+
+# states restored on both copies, on top of the editor defaults
+STATES = {
+    'NodeBranch': [{'condition': True}],
+    'NodeInput': [{'text': 'abc'}],
+    'NodeNumber': [{'spinbox': 3.5}],
+    'NodeString': [
+        {'text': 'foo Bar', 'buttons': {
+            'make_upper': False, 'make_lower': True, 'make_title': False}},
+        {'text': 'foo Bar', 'buttons': {
+            'make_upper': False, 'make_lower': False, 'make_title': True}}],
+}
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestNodeParity(unittest.TestCase):
+    """The headless copy of every built-in node behaves as the editor node."""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.widgets.editor_scene import Scene
+
+        # the nodes widgets are deleted with the scene
+        self.scene = Scene()
+
+    def node_pair(self, node_class: str, state: dict = None) -> tuple:
+        from src.nodes import create_node
+
+        editor = create_node(self.scene.graphics_scene, node_class)
+        if state:
+            editor.content.restore_state(state)
+
+        graph = EngineGraph()
+        engine = graph.add_node(node_class, f'{node_class}.001',
+                                editor.content.save_state())
+        return editor, engine
+
+    def assert_same_outputs(self, editor, engine):
+        for index, socket_type in enumerate(engine.outputs):
+            if socket_type != SocketType.execute:
+                self.assertEqual(editor.content.get_output(index),
+                                 engine.get_output(index), f'output {index}')
+
+    def test_built_in_nodes(self):
+        from src.nodes import NodesRegister
+
+        node_classes = sorted(set(NodesRegister.nodes_classes) &
+                              set(EngineRegister.nodes_classes))
+        self.assertIn('NodeString', node_classes)
+
+        for node_class in node_classes:
+            for state in [None] + STATES.get(node_class, []):
+                with self.subTest(node_class, state=state):
+                    editor, engine = self.node_pair(node_class, state)
+
+                    self.assertEqual(
+                        [socket.socket_type for socket in editor.input_sockets],
+                        list(engine.inputs))
+                    self.assertEqual(
+                        [socket.socket_type for socket in editor.output_sockets],
+                        list(engine.outputs))
+                    self.assertEqual(editor.content.save_state(), engine.save_state())
+                    self.assert_same_outputs(editor, engine)
+
+                    for index, socket_type in enumerate(engine.inputs):
+                        if socket_type != SocketType.execute:
+                            editor.content.set_input(INPUTS[socket_type], index)
+                            engine.set_input(INPUTS[socket_type], index)
+                    self.assert_same_outputs(editor, engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
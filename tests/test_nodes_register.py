@@ -0,0 +1,91 @@
+import os
+import unittest
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestNodeIdAllocator(unittest.TestCase):
+
+    def test_lowest_gap_is_reused_first(self):
+        from src.nodes.nodes_register import NodeIdAllocator
+
+        allocator = NodeIdAllocator()
+        self.assertEqual([allocator.allocate() for _ in range(5)], [1, 2, 3, 4, 5])
+
+        allocator.release(4)
+        allocator.release(2)
+        self.assertEqual(allocator.allocate(), 2)
+        self.assertEqual(allocator.allocate(), 4)
+        self.assertEqual(allocator.allocate(), 6)
+
+    def test_last_is_lowered_past_the_gaps(self):
+        from src.nodes.nodes_register import NodeIdAllocator
+
+        allocator = NodeIdAllocator()
+        for _ in range(5):
+            allocator.allocate()
+
+        allocator.release(3)
+        allocator.release(4)
+        allocator.release(5)
+        self.assertEqual(allocator.last, 2)
+
+        # the stale numbers left in the heap are not handed out again
+        self.assertEqual([allocator.allocate() for _ in range(3)], [3, 4, 5])
+        self.assertEqual(allocator.last, 5)
+
+    def test_ids_past_999(self):
+        from src.nodes.nodes_register import (
+            NodeIdAllocator,
+            format_node_id,
+            node_id_number
+        )
+
+        allocator = NodeIdAllocator()
+        for _ in range(1000):
+            number = allocator.allocate()
+
+        node_id = format_node_id('NodeInput', number)
+        self.assertEqual(node_id, 'NodeInput.1000')
+        self.assertEqual(node_id_number(node_id), 1000)
+        self.assertEqual(format_node_id('NodeInput', 7), 'NodeInput.007')
+
+        allocator.release(999)
+        self.assertEqual(allocator.allocate(), 999)
+        self.assertEqual(allocator.allocate(), 1001)
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestRegisterNodeIds(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.widgets.editor_scene import Scene
+
+        self.scene = Scene()
+
+    def test_deleted_node_id_is_reused(self):
+        from src.nodes import create_node
+
+        scene = self.scene.graphics_scene
+        nodes = [create_node(scene, 'NodeInput') for _ in range(3)]
+        self.assertEqual([node.node_id for node in nodes],
+                         ['NodeInput.001', 'NodeInput.002', 'NodeInput.003'])
+
+        nodes[1].node_graphics.delete_node()
+        self.assertEqual(create_node(scene, 'NodeInput').node_id, 'NodeInput.002')
+        self.assertEqual(create_node(scene, 'NodeInput').node_id, 'NodeInput.004')
+        self.assertEqual(scene.register.get_last_node_id('NodeInput'),
+                         'NodeInput.004')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import unittest
+import multiprocessing
+
+from src.engine import EngineGraph, EngineNode, EngineRegister, SocketType
+from src.run import KILL_GRACE, run_files
+
+
+@EngineRegister.register_class
+class NodeTestHang(EngineNode):
+    """A node whose single output never completes in time."""
+
+    outputs = (SocketType.text,)
+
+    def get_output(self, index):
+        time.sleep(60)
+        return 'late'
+
+
+@EngineRegister.register_class
+class NodeTestCrash(EngineNode):
+    """A node killing its process without a result."""
+
+    outputs = (SocketType.text,)
+
+    def get_output(self, index):
+        os._exit(1)
+
+
+def debug_graph(source: str) -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node(source, f'{source}.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect(f'{source}.001', 0, 'NodeDebug.001', 1)
+    return graph
+
+
+# the workers only know the test nodes when forked from this process
+@unittest.skipUnless(multiprocessing.get_start_method() == 'fork',
+                     'the test nodes are registered in the parent process')
+class TestRunFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def save(self, name: str, graph: EngineGraph) -> str:
+        file = os.path.join(self.directory, name)
+        with open(file, 'w', encoding='utf-8') as f:
+            json.dump(graph.state(), f)
+        return file
+
+    def test_hung_node_is_killed(self):
+        hung = self.save('hung.json', debug_graph('NodeTestHang'))
+        fine = self.save('fine.json', debug_graph('NodeString'))
+
+        for workers in (1, 2):
+            start = time.perf_counter()
+            records = {record['file']: record
+                       for record in run_files([hung, fine], workers, timeout=0.1)}
+
+            self.assertLess(time.perf_counter() - start, 10 * KILL_GRACE)
+            self.assertEqual(records[hung]['status'], 'timeout')
+            self.assertEqual(records[fine]['status'], 'ok')
+
+    def test_crashed_worker_fails_its_file_only(self):
+        crash = self.save('crash.json', debug_graph('NodeTestCrash'))
+        files = [self.save(f'fine{number}.json', debug_graph('NodeString'))
+                 for number in range(3)]
+
+        records = {record['file']: record
+                   for record in run_files([crash] + files, workers=2)}
+
+        self.assertEqual(records[crash]['status'], 'failed')
+        self.assertEqual([records[file]['status'] for file in files], ['ok'] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
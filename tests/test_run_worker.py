@@ -0,0 +1,50 @@
+import os
+import unittest
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestHasHeadlessNodes(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+        from PySide2.QtGui import QColor
+        from src.nodes import NodeContent, NodesRegister
+        from src.widgets.node_graphics import Node
+
+        @NodesRegister.register_class
+        class NodeTestEditorOnly(Node):
+            """A node without a headless counterpart."""
+
+            title_background = QColor('#FFFFFF')
+            title = 'Editor Only'
+
+            def __init__(self, scene):
+                super().__init__(scene=scene, node=self, content=NodeContent(self))
+
+    def test_deleted_nodes_are_ignored(self):
+        from src.nodes import create_node
+        from src.widgets.editor_scene import Scene
+        from src.widgets.logic.run_worker import has_headless_nodes
+
+        scene = Scene()
+        register = scene.graphics_scene.register
+        create_node(scene.graphics_scene, 'NodeString')
+        self.assertTrue(has_headless_nodes(register))
+
+        node = create_node(scene.graphics_scene, 'NodeTestEditorOnly')
+        self.assertFalse(has_headless_nodes(register))
+
+        node.node_graphics.delete_node()
+        self.assertTrue(has_headless_nodes(register))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import gc
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.client import HTTPConnection
+
+from src.engine import EngineGraph, EngineNode, EngineRegister, GraphService, SocketType
+from src.serve import ServiceHTTPServer
+
+
+@EngineRegister.register_class
+class NodeTestLookup(EngineNode):
+    """A node whose logic fails with a `KeyError`."""
+
+    outputs = (SocketType.text,)
+
+    def get_output(self, index):
+        return {}['missing']
+
+
+def lookup_graph() -> EngineGraph:
+    graph = EngineGraph()
+    graph.add_node('NodeExecute', 'NodeExecute.001')
+    graph.add_node('NodeTestLookup', 'NodeTestLookup.001')
+    graph.add_node('NodeDebug', 'NodeDebug.001')
+    graph.connect('NodeExecute.001', 0, 'NodeDebug.001', 0)
+    graph.connect('NodeTestLookup.001', 0, 'NodeDebug.001', 1)
+    return graph
+
+
+class TestServeRun(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # the widgets left by the editor tests are collected before the
+        # server threads start, Qt objects are not deleted from other threads
+        gc.collect()
+
+        cls.server = ServiceHTTPServer(('127.0.0.1', 0), GraphService())
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.file = os.path.join(directory, 'lookup.json')
+        with open(self.file, 'w', encoding='utf-8') as f:
+            json.dump(lookup_graph().state(), f)
+
+    def post(self, body) -> tuple:
+        connection = HTTPConnection(*self.server.server_address)
+        self.addCleanup(connection.close)
+        connection.request('POST', '/run', json.dumps(body))
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_body_must_be_an_object(self):
+        for body in ([], 'x', 1):
+            self.assertEqual(self.post(body)[0], 400)
+
+    def test_unknown_override_is_a_client_error(self):
+        status, reply = self.post({'file': self.file,
+                                   'overrides': {'NodeInput.999': {'text': ''}}})
+        self.assertEqual(status, 400)
+        self.assertIn('NodeInput.999', reply['error'])
+
+    def test_compiled_run_with_timeout_is_a_client_error(self):
+        status, _ = self.post({'file': self.file, 'compiled': True, 'timeout': 1})
+        self.assertEqual(status, 400)
+
+    def test_node_key_error_is_a_server_error(self):
+        status, reply = self.post({'file': self.file})
+        self.assertEqual(status, 500)
+        self.assertTrue(reply['error'].startswith('KeyError'))
+
+
+if __name__ == '__main__':
+    unittest.main()
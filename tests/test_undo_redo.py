@@ -0,0 +1,79 @@
+import os
+import unittest
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+
+def edges(scene) -> list:
+    return sorted(
+        (edge.start_socket.node.node_id, edge.start_socket.index,
+         edge.end_socket.node.node_id, edge.end_socket.index)
+        for node in scene.register.all_nodes
+        for edge in node.base.output_edges)
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestDeleteNodeCommand(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_undo_delete_linked_nodes(self):
+        from src.nodes import create_node
+        from src.widgets.editor_scene import Scene
+        from src.widgets.node_edge import NodeEdge
+        from src.widgets.logic.undo_redo import DeleteNodeCommand
+
+        scene = Scene().graphics_scene
+        source = create_node(scene, 'NodeInput')
+        upper = create_node(scene, 'NodeString')
+        debug = create_node(scene, 'NodeDebug')
+        NodeEdge(scene, source.output_sockets[0], upper.input_sockets[0])
+        NodeEdge(scene, upper.output_sockets[0], debug.input_sockets[1])
+        before = edges(scene)
+
+        command = DeleteNodeCommand(
+            scene, [source.node_graphics, upper.node_graphics], 'Delete node')
+        command.redo()
+        self.assertEqual(edges(scene), [])
+
+        command.undo()
+        self.assertEqual(edges(scene), before)
+
+
+@unittest.skipIf(QApplication is None, 'PySide2 is not installed')
+class TestConnectEdgeCommand(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_cycle_edge_is_skipped(self):
+        from src.nodes import create_node
+        from src.widgets.editor_scene import Scene
+        from src.widgets.node_edge import NodeEdge
+        from src.widgets.logic.undo_redo import ConnectEdgeCommand
+
+        scene = Scene().graphics_scene
+        first = create_node(scene, 'NodePassthru')
+        second = create_node(scene, 'NodePassthru')
+        NodeEdge(scene, first.output_sockets[0], second.input_sockets[0])
+        before = edges(scene)
+
+        command = ConnectEdgeCommand(scene, second.output_sockets[0],
+                                     first.input_sockets[0], 'Connect edge')
+        command.redo()
+        self.assertEqual(edges(scene), before)
+
+        command.undo()
+        self.assertEqual(edges(scene), before)
+
+
+if __name__ == '__main__':
+    unittest.main()